@@ -13,23 +13,44 @@ import json
 from ..collectors.rss_collector import RSSCollector
 from ..collectors.reddit_collector import RedditCollector
 from ..collectors.api_collector import APICollector
+from ..collectors.nitter_collector import NitterCollector
+from ..collectors.scraper_collector import ScraperCollector
+from ..collectors.registry import ArticleSink, CollectorRegistry
+from ..collectors.api_query_planner import shared_api_query_planner
+from ..collectors.feed_cache import shared_feed_cache
+from ..collectors.feed_scheduler import shared_feed_scheduler
+from ..collectors.feed_state import shared_feed_state
+from ..collectors.http_pool import HTTPClientPool
+from ..collectors.rate_limiter import shared_rate_limiter
+from ..collectors.relevance_router import shared_relevance_router
+from ..collectors.timestamps import shared_timestamp_parser
+from ..collectors.worker_pool import shared_worker_pool
 from ..processors.deduplicator import Deduplicator
+from .pipeline import AggregationPipeline
 from ..processors.content_processor import ContentProcessor
 from ..storage.mongodb_storage import MongoDBStorage
-from ..config import QUALITY_SCORING
+from ..storage.quota_ledger import QuotaLedger
+from ..config import PIPELINE_CONFIG, QUALITY_SCORING
 
 logger = logging.getLogger(__name__)
 
 class NewsAggregator:
-    def __init__(self, storage: MongoDBStorage):
+    def __init__(self, storage: MongoDBStorage, http_pool: HTTPClientPool = None):
         self.storage = storage
+        self.http_pool = http_pool
         self.deduplicator = Deduplicator()
         self.content_processor = ContentProcessor()
+        self.quota_ledger = QuotaLedger(storage)
+        self.feed_scheduler = shared_feed_scheduler
         
-        # Collectors
+        # Collectors, run through the registry with per-collector deadlines
         self.rss_collector = None
         self.reddit_collector = None
         self.api_collector = None
+        self.nitter_collector = None
+        self.scraper_collector = None
+        self.registry = CollectorRegistry()
+        self.pipeline = AggregationPipeline(self.registry, self._process_articles, self.deduplicator, storage)
         
         # Statistics
         self.stats = {
@@ -50,9 +71,23 @@ class NewsAggregator:
         """Initialize all collectors and processors"""
         try:
             # Initialize collectors
-            self.rss_collector = RSSCollector()
-            self.reddit_collector = RedditCollector()
-            self.api_collector = APICollector()
+            self.rss_collector = RSSCollector(http_pool=self.http_pool)
+            self.reddit_collector = RedditCollector(http_pool=self.http_pool)
+            self.api_collector = APICollector(http_pool=self.http_pool, quota_ledger=self.quota_ledger)
+            self.nitter_collector = NitterCollector(http_pool=self.http_pool)
+            self.scraper_collector = ScraperCollector(http_pool=self.http_pool)
+            
+            self.registry.register('rss', self._collect_rss_articles, health=self._rss_health)
+            self.registry.register('reddit', self._collect_reddit_content, health=self._reddit_health)
+            self.registry.register('api', self._collect_api_articles, health=self._api_health)
+            self.registry.register('nitter', self._collect_nitter_articles, health=self.nitter_collector.get_nitter_health)
+            self.registry.register('scraper', self._collect_scraped_articles)
+            
+            # Feeds are refreshed in the background; aggregations read the shared cache
+            self.rss_collector.schedule_feeds(self.feed_scheduler)
+            
+            # Articles stored by earlier runs are skipped rather than reprocessed
+            await self.deduplicator.load_memory(self.storage)
             
             # Test collector health
             await self._check_collectors_health()
@@ -63,6 +98,22 @@ class NewsAggregator:
             logger.error(f"Failed to initialize news aggregator: {e}")
             raise
     
+    async def schedule_fixture(self, match_id: str, home_team: str, away_team: str,
+                               match_date: datetime, priority: str = "normal") -> bool:
+        """
+        Register a fixture before its aggregations run, so the quota reserve
+        and the feed scheduler's kickoff cadence account for it
+        """
+        scheduled = await self.storage.schedule_match({
+            'match_id': match_id,
+            'home_team': home_team,
+            'away_team': away_team,
+            'match_date': match_date,
+            'priority': priority,
+        })
+        self.feed_scheduler.register_fixture(match_id, home_team, away_team, match_date)
+        return scheduled
+    
     async def aggregate_match_news(self, match_id: str, home_team: str, away_team: str, 
                                  match_date: datetime, priority: str = "normal") -> Dict[str, Any]:
         """
@@ -81,65 +132,51 @@ class NewsAggregator:
                 'match_date': match_date,
                 'aggregation_started': start_time,
                 'priority': priority,
-                'status': 'aggregating'
+                'status': 'aggregating',
+                'error': None
             }
             await self.storage.store_match_info(match_info)
             
-            # Collect from all sources in parallel
-            collection_tasks = []
-            
-            # RSS Collection
-            if self.rss_collector:
-                collection_tasks.append(self._collect_rss_articles(home_team, away_team, match_date))
-            
-            # Reddit Collection
-            if self.reddit_collector:
-                collection_tasks.append(self._collect_reddit_content(home_team, away_team, match_date))
-            
-            # API Collection
-            if self.api_collector:
-                collection_tasks.append(self._collect_api_articles(home_team, away_team, match_date))
-            
-            # Execute all collections concurrently
-            collection_results = await asyncio.gather(*collection_tasks, return_exceptions=True)
+            # Feeds for this fixture switch to the kickoff cadence near kickoff
+            self.feed_scheduler.register_fixture(match_id, home_team, away_team, match_date)
             
-            # Merge all articles
-            all_articles = []
-            collection_errors = []
-            
-            for i, result in enumerate(collection_results):
-                if isinstance(result, Exception):
-                    collection_errors.append(str(result))
-                    logger.error(f"Collection task {i} failed: {result}")
-                else:
-                    all_articles.extend(result)
-            
-            logger.info(f"Collected {len(all_articles)} articles from {len(collection_tasks)} sources")
-            
-            # Add match_id to all articles
-            for article in all_articles:
-                article['match_id'] = match_id
+            match = {
+                'match_id': match_id,
+                'home_team': home_team,
+                'away_team': away_team,
+                'match_date': match_date,
+                'priority': priority,
+            }
             
-            # Process articles
-            processed_articles = await self._process_articles(all_articles)
+            # Register the match so shared feeds are routed to every in-flight aggregation at once
+            shared_relevance_router.register_match(match_id, home_team, away_team)
+            try:
+                # Collect, process, deduplicate and store as streaming stages; each collector
+                # runs under its own deadline and fast sources are stored while slow ones fetch
+                outcome = await self.pipeline.run(match, match_info)
+            finally:
+                shared_relevance_router.unregister_match(match_id)
             
-            # Deduplicate
-            unique_articles = self.deduplicator.deduplicate_articles(processed_articles)
+            unique_articles = outcome['unique_articles']
+            collector_report = outcome['collectors']
+            collection_errors = [report['error'] for report in collector_report.values() if 'error' in report]
             
-            # Store articles
-            storage_result = await self.storage.store_articles_batch(unique_articles)
+            logger.info(f"Collected {outcome['articles_collected']} articles from {len(collector_report)} collectors")
             
-            # Generate and store match context
-            context = await self._generate_match_context(match_id, unique_articles, home_team, away_team)
+            # Generate and store match context, over everything stored for the match
+            match_articles = await self._get_match_articles(match_id, unique_articles, outcome['articles_already_stored'])
+            context = await self._generate_match_context(match_id, match_articles, home_team, away_team)
             await self.storage.store_match_context(match_id, context)
             
             # Update match status
             match_info['status'] = 'completed'
             match_info['aggregation_completed'] = datetime.utcnow()
-            match_info['articles_collected'] = len(unique_articles)
-            match_info['sources_processed'] = len(collection_tasks)
+            match_info['articles_collected'] = len(match_articles)
+            match_info['sources_processed'] = len(collector_report)
+            match_info['collectors'] = collector_report
             match_info['errors'] = collection_errors
             await self.storage.store_match_info(match_info)
+            await self.storage.record_match_aggregation(match_id)
             
             # Update statistics
             aggregation_time = (datetime.utcnow() - start_time).total_seconds()
@@ -148,11 +185,15 @@ class NewsAggregator:
             result = {
                 'match_id': match_id,
                 'status': 'completed',
-                'articles_collected': len(unique_articles),
-                'articles_stored': storage_result['stored'],
-                'duplicates_removed': len(all_articles) - len(unique_articles),
-                'sources_processed': len(collection_tasks),
+                'articles_collected': len(match_articles),
+                'articles_stored': outcome['articles_stored'],
+                'articles_already_stored': outcome['articles_already_stored'],
+                'duplicates_removed': outcome['duplicates_removed'],
+                'sources_processed': len(collector_report),
                 'processing_time_seconds': aggregation_time,
+                'first_stored_seconds': outcome['first_stored_seconds'],
+                'stage_seconds': outcome['stage_seconds'],
+                'collectors': collector_report,
                 'errors': collection_errors,
                 'context': context
             }
@@ -174,21 +215,26 @@ class NewsAggregator:
             
             raise
     
-    async def _collect_rss_articles(self, home_team: str, away_team: str, match_date: datetime) -> List[Dict[str, Any]]:
+    async def _collect_rss_articles(self, match: Dict[str, Any], sink: ArticleSink) -> List[Dict[str, Any]]:
         """Collect articles from RSS feeds"""
         try:
             async with self.rss_collector:
-                articles = await self.rss_collector.collect_for_match(home_team, away_team, match_date)
+                articles = await self.rss_collector.collect_for_match(
+                    match['home_team'], match['away_team'], match['match_date'], match['match_id'], sink=sink
+                )
                 logger.info(f"RSS collection: {len(articles)} articles")
                 return articles
         except Exception as e:
             logger.error(f"RSS collection failed: {e}")
             return []
     
-    async def _collect_reddit_content(self, home_team: str, away_team: str, match_date: datetime) -> List[Dict[str, Any]]:
+    async def _collect_reddit_content(self, match: Dict[str, Any], sink: ArticleSink) -> List[Dict[str, Any]]:
         """Collect content from Reddit"""
         try:
-            reddit_content = await self.reddit_collector.collect_for_match(home_team, away_team, match_date)
+            async with self.reddit_collector:
+                reddit_content = await self.reddit_collector.collect_for_match(
+                    match['home_team'], match['away_team'], match['match_date']
+                )
             
             # Convert Reddit content to article format
             articles = []
@@ -199,7 +245,7 @@ class NewsAggregator:
                         'title': discussion.get('title', ''),
                         'content': discussion.get('content', ''),
                         'summary': discussion.get('title', ''),  # Use title as summary for Reddit
-                        'link': f"https://reddit.com{discussion.get('url', '')}",
+                        'link': f"https://reddit.com{discussion.get('permalink', '')}",
                         'author': discussion.get('author', ''),
                         'published_at': discussion.get('created_at', datetime.utcnow()),
                         'source': f"Reddit - {discussion.get('subreddit', 'unknown')}",
@@ -220,6 +266,7 @@ class NewsAggregator:
                     }
                     articles.append(article)
             
+            await sink.add(articles)
             logger.info(f"Reddit collection: {len(articles)} articles")
             return articles
             
@@ -227,17 +274,46 @@ class NewsAggregator:
             logger.error(f"Reddit collection failed: {e}")
             return []
     
-    async def _collect_api_articles(self, home_team: str, away_team: str, match_date: datetime) -> List[Dict[str, Any]]:
+    async def _collect_api_articles(self, match: Dict[str, Any], sink: ArticleSink) -> List[Dict[str, Any]]:
         """Collect articles from news APIs"""
         try:
             async with self.api_collector:
-                articles = await self.api_collector.collect_for_match(home_team, away_team, match_date)
+                articles = await self.api_collector.collect_for_match(
+                    match['home_team'], match['away_team'], match['match_date'], match['match_id'],
+                    match.get('priority', 'normal'), sink=sink
+                )
                 logger.info(f"API collection: {len(articles)} articles")
                 return articles
         except Exception as e:
             logger.error(f"API collection failed: {e}")
             return []
     
+    async def _collect_nitter_articles(self, match: Dict[str, Any], sink: ArticleSink) -> List[Dict[str, Any]]:
+        """Collect tweets through Nitter RSS"""
+        try:
+            async with self.nitter_collector:
+                articles = await self.nitter_collector.collect_for_match(
+                    match['home_team'], match['away_team'], match['match_date'], match['match_id'], sink=sink
+                )
+                logger.info(f"Nitter collection: {len(articles)} tweets")
+                return articles
+        except Exception as e:
+            logger.error(f"Nitter collection failed: {e}")
+            return []
+    
+    async def _collect_scraped_articles(self, match: Dict[str, Any], sink: ArticleSink) -> List[Dict[str, Any]]:
+        """Collect articles scraped from club and news websites"""
+        try:
+            async with self.scraper_collector:
+                articles = await self.scraper_collector.collect_for_match(
+                    match['home_team'], match['away_team'], match['match_date'], match['match_id'], sink=sink
+                )
+                logger.info(f"Scraper collection: {len(articles)} articles")
+                return articles
+        except Exception as e:
+            logger.error(f"Scraper collection failed: {e}")
+            return []
+    
     async def _process_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process articles through content processing pipeline"""
         try:
@@ -248,6 +324,22 @@ class NewsAggregator:
             logger.error(f"Article processing failed: {e}")
             return articles  # Return original articles if processing fails
     
+    async def _get_match_articles(self, match_id: str, unique_articles: List[Dict[str, Any]],
+                                  already_stored: int) -> List[Dict[str, Any]]:
+        """
+        The match's articles from this and earlier aggregations.
+        
+        Articles an earlier run stored skip the pipeline, so on a
+        re-aggregation they are read back from storage; new articles the
+        store stage failed to write are kept from this run.
+        """
+        if not already_stored:
+            return unique_articles
+        
+        stored = await self.storage.get_articles_for_match(match_id, limit=PIPELINE_CONFIG['context_article_limit'])
+        stored_hashes = {article.get('hash') for article in stored}
+        return stored + [article for article in unique_articles if article.get('hash') not in stored_hashes]
+    
     async def _generate_match_context(self, match_id: str, articles: List[Dict[str, Any]], 
                                     home_team: str, away_team: str) -> Dict[str, Any]:
         """Generate comprehensive match context from articles"""
@@ -535,25 +627,23 @@ class NewsAggregator:
             logger.error(f"Sentiment analysis failed: {e}")
             return {'error': str(e)}
     
+    async def _rss_health(self) -> Dict[str, Any]:
+        async with self.rss_collector:
+            return await self.rss_collector.get_all_feeds_health()
+    
+    async def _reddit_health(self) -> Dict[str, Any]:
+        async with self.reddit_collector:
+            return await self.reddit_collector.get_subreddit_health()
+    
+    async def _api_health(self) -> Dict[str, Any]:
+        # Read from the quota ledger; no session needed
+        return await self.api_collector.test_api_connections()
+    
     async def _check_collectors_health(self):
         """Check health of all collectors"""
         try:
-            # Check RSS collector
-            if self.rss_collector:
-                async with self.rss_collector:
-                    rss_health = await self.rss_collector.get_all_feeds_health()
-                    self.stats['sources_health']['rss'] = rss_health
-            
-            # Check Reddit collector
-            if self.reddit_collector:
-                reddit_health = await self.reddit_collector.get_subreddit_health()
-                self.stats['sources_health']['reddit'] = reddit_health
-            
-            # Check API collector
-            if self.api_collector:
-                async with self.api_collector:
-                    api_health = await self.api_collector.test_api_connections()
-                    self.stats['sources_health']['api'] = api_health
+            # Scraper targets are not probed here; its yield shows up in the collector stats
+            self.stats['sources_health'].update(await self.registry.check_health())
             
             logger.info("Collector health check completed")
             
@@ -593,6 +683,20 @@ class NewsAggregator:
             'last_aggregation': self.stats['last_aggregation'],
             'active_tasks': len(self.active_tasks),
             'queue_size': self.task_queue.qsize(),
+            'feed_cache': shared_feed_cache.get_stats(),
+            'feed_scheduler': self.feed_scheduler.get_stats(),
+            'conditional_get': shared_feed_state.get_stats(),
+            'http_pool': self.http_pool.get_stats() if self.http_pool else None,
+            'rate_limiter': shared_rate_limiter.get_stats(),
+            'relevance_router': shared_relevance_router.get_stats(),
+            'timestamps': shared_timestamp_parser.get_stats(),
+            'dedup_memory': self.deduplicator.get_cache_stats(),
+            'api_quota': self.quota_ledger.get_stats(),
+            'api_query_planner': shared_api_query_planner.get_stats(),
+            'worker_pool': shared_worker_pool.get_stats(),
+            'collectors': self.registry.get_stats(),
+            'reddit': self.reddit_collector.get_stats() if self.reddit_collector else None,
+            'scraper': self.scraper_collector.get_stats() if self.scraper_collector else None,
             'sources_health': self.stats['sources_health']
         }
     
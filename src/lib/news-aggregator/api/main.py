@@ -17,6 +17,9 @@ from pydantic import BaseModel, Field
 from .aggregator import NewsAggregator
 from .models import MatchRequest, NewsResponse, AggregationStatus, HealthCheck
 from ..storage.mongodb_storage import MongoDBStorage
+from ..collectors.http_pool import HTTPClientPool
+from ..collectors.content_cache import shared_content_cache
+from ..collectors.worker_pool import shared_worker_pool
 from ..config import API_CONFIG
 
 logger = logging.getLogger(__name__)
@@ -24,22 +27,28 @@ logger = logging.getLogger(__name__)
 # Global storage instance
 storage = None
 aggregator = None
+http_pool = None
 active_connections: Dict[str, List[WebSocket]] = {}
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
-    global storage, aggregator
+    global storage, aggregator, http_pool
     
     # Startup
     try:
         storage = MongoDBStorage()
         await storage.connect()
         
-        aggregator = NewsAggregator(storage)
+        # One HTTP client pool for the whole application lifetime
+        http_pool = HTTPClientPool()
+        await http_pool.start()
+        
+        aggregator = NewsAggregator(storage, http_pool=http_pool)
         await aggregator.initialize()
         
         # Start background tasks
+        aggregator.feed_scheduler.start(storage)
         asyncio.create_task(periodic_cleanup())
         asyncio.create_task(health_monitor())
         
@@ -51,6 +60,15 @@ async def lifespan(app: FastAPI):
         raise
     
     # Shutdown
+    if aggregator:
+        await aggregator.feed_scheduler.stop()
+    
+    if http_pool:
+        await http_pool.close()
+    
+    shared_worker_pool.shutdown()
+    shared_content_cache.close()
+    
     if storage:
         await storage.disconnect()
     
@@ -115,6 +133,40 @@ async def trigger_aggregation(
         logger.error(f"Aggregation trigger failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/v1/matches/{match_id}/schedule")
+async def schedule_match(
+    match_id: str = Path(..., description="Match ID"),
+    request: MatchRequest = ...
+):
+    """Register an upcoming fixture ahead of its aggregations"""
+    try:
+        if not request.home_team or not request.away_team:
+            raise HTTPException(status_code=400, detail="Home team and away team are required")
+        
+        scheduled = await aggregator.schedule_fixture(
+            match_id,
+            request.home_team,
+            request.away_team,
+            request.match_date,
+            request.priority
+        )
+        if not scheduled:
+            raise HTTPException(status_code=503, detail="Failed to store fixture")
+        
+        return {
+            "status": "scheduled",
+            "match_id": match_id,
+            "teams": f"{request.home_team} vs {request.away_team}",
+            "match_date": request.match_date.isoformat(),
+            "priority": request.priority
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Fixture scheduling failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/v1/matches/{match_id}/news")
 async def get_match_news(
     match_id: str = Path(..., description="Match ID"),
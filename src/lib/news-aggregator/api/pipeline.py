@@ -0,0 +1,222 @@
+"""
+Streaming Aggregation Pipeline - Collect, process, deduplicate and store concurrently
+Articles flow through bounded queues, so fast sources are stored while slow ones are still fetching
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from ..collectors.registry import CollectorRegistry
+from ..config import PIPELINE_CONFIG
+from ..processors.deduplicator import Deduplicator, DeduplicationSession
+from ..storage.mongodb_storage import MongoDBStorage, article_hash
+
+logger = logging.getLogger(__name__)
+
+ProcessFn = Callable[[List[Dict[str, Any]]], Awaitable[List[Dict[str, Any]]]]
+
+# End-of-stream marker passed down each queue
+_DONE = object()
+
+
+async def _drain(queue: asyncio.Queue) -> AsyncIterator[Any]:
+    """Yield items from ``queue`` until the upstream stage signals the end"""
+    while True:
+        item = await queue.get()
+        if item is _DONE:
+            # Left in place, so draining an ended queue again returns at once
+            queue.put_nowait(_DONE)
+            return
+        yield item
+
+
+class AggregationPipeline:
+    """
+    Runs one match aggregation as four concurrent stages:
+
+        collect -> process -> deduplicate -> store
+
+    Each stage is an async generator over the bounded queue from the stage
+    before it, so a full queue makes the upstream stage wait rather than
+    buffering the whole article set. Collectors hand over batches as their
+    sub-tasks finish; batches are processed, deduplicated against
+    everything kept so far and written in small batches, with the match's
+    progress updated after each write. Articles from fast sources are
+    therefore readable through the API while slow sources still fetch.
+
+    Articles an earlier run already stored for the match skip processing
+    and storage; they only take part in deduplication, so repeats of them
+    from other sources are dropped too, as are near-copies of any stored
+    article's body, found by SimHash.
+    """
+
+    def __init__(self, registry: CollectorRegistry, process: ProcessFn, deduplicator: Deduplicator,
+                 storage: MongoDBStorage, config: Dict[str, Any] = None):
+        self.registry = registry
+        self.process = process
+        self.deduplicator = deduplicator
+        self.storage = storage
+        self.config = config or PIPELINE_CONFIG
+
+    async def run(self, match: Dict[str, Any], match_info: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Aggregate ``match`` end to end.
+
+        ``match_info`` is re-stored with the running article count after
+        every write. Returns the unique articles kept, the counts and
+        timings of each stage and the per-collector report.
+        """
+        run = _PipelineRun(self.deduplicator.start_session())
+        size = self.config['queue_size']
+        collected, processed, unique = asyncio.Queue(size), asyncio.Queue(size), asyncio.Queue(size)
+
+        tasks = [
+            asyncio.create_task(self._collect(match, collected, run)),
+            asyncio.create_task(self._pump(self._process_stage(_drain(collected), match, run),
+                                           collected, processed, 'Processing')),
+            asyncio.create_task(self._pump(self._dedup_stage(_drain(processed), match, run),
+                                           processed, unique, 'Deduplication')),
+            asyncio.create_task(self._store_stage(unique, match_info, run)),
+        ]
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return run.result()
+
+    async def _collect(self, match: Dict[str, Any], queue: asyncio.Queue, run: '_PipelineRun'):
+        try:
+            run.collector_report = await self.registry.stream_all(match, queue)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Collection stage failed for match {match['match_id']}: {e}")
+        await queue.put(_DONE)
+
+    async def _pump(self, stage: AsyncIterator[List[Dict[str, Any]]], upstream: asyncio.Queue,
+                    queue: asyncio.Queue, label: str):
+        """Feed a stage's output into the next queue, ending the stream when it finishes or fails"""
+        try:
+            async for batch in stage:
+                await queue.put(batch)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Downstream keeps whatever already got through; the rest of the upstream
+            # output is discarded so earlier stages aren't left blocked on a full queue
+            logger.error(f"{label} stage failed: {e}")
+            async for _ in _drain(upstream):
+                pass
+        await queue.put(_DONE)
+
+    async def _process_stage(self, batches: AsyncIterator, match: Dict[str, Any],
+                             run: '_PipelineRun') -> AsyncIterator[List[Dict[str, Any]]]:
+        async for collector, articles in batches:
+            started = time.perf_counter()
+            run.articles_collected += len(articles)
+
+            for article in articles:
+                article['match_id'] = match['match_id']
+                # The storage key, taken before deduplication can merge in other content
+                article.setdefault('hash', article_hash(article))
+
+            fresh, seen = self.deduplicator.split_seen(articles)
+            run.articles_already_stored += len(seen)
+
+            processed = await self.process(fresh) if fresh else []
+            run.stage_seconds['process'] += time.perf_counter() - started
+            if processed or seen:
+                yield processed, seen
+
+    async def _dedup_stage(self, batches: AsyncIterator, match: Dict[str, Any],
+                           run: '_PipelineRun') -> AsyncIterator[List[Dict[str, Any]]]:
+        # Loaded while collectors fetch their first batches
+        run.session.add_stored_simhashes(await self.storage.get_match_simhashes(match['match_id']))
+
+        async for articles, seen in batches:
+            started = time.perf_counter()
+            run.session.add_known(seen)
+            new_articles, changed = run.session.add(articles)
+            run.stage_seconds['dedup'] += time.perf_counter() - started
+
+            # Originals that absorbed a duplicate are written again with the merge info
+            if new_articles or changed:
+                yield new_articles + changed
+
+    async def _store_stage(self, queue: asyncio.Queue, match_info: Optional[Dict[str, Any]], run: '_PipelineRun'):
+        pending: Dict[int, Dict[str, Any]] = {}
+        flush_at = None
+
+        while True:
+            timeout = max(0.0, flush_at - time.monotonic()) if flush_at is not None else None
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                item = None
+
+            if item is not None and item is not _DONE:
+                for article in item:
+                    pending[id(article)] = article
+                if flush_at is None:
+                    flush_at = time.monotonic() + self.config['store_flush_seconds']
+
+            flush_due = flush_at is not None and time.monotonic() >= flush_at
+            if pending and (item is _DONE or flush_due or len(pending) >= self.config['store_batch_size']):
+                await self._flush(list(pending.values()), match_info, run)
+                pending.clear()
+                flush_at = None
+
+            if item is _DONE:
+                return
+
+    async def _flush(self, articles: List[Dict[str, Any]], match_info: Optional[Dict[str, Any]], run: '_PipelineRun'):
+        started = time.perf_counter()
+        result = await self.storage.store_articles_batch(articles)
+        run.articles_stored += result['stored']
+        run.store_errors += result['errors']
+        if not result['errors']:
+            self.deduplicator.remember_articles(articles)
+
+        if run.first_stored_seconds is None and result['stored']:
+            run.first_stored_seconds = time.perf_counter() - run.started
+
+        if match_info is not None:
+            match_info['articles_collected'] = len(run.session.unique_articles)
+            await self.storage.store_match_info(match_info)
+
+        run.stage_seconds['store'] += time.perf_counter() - started
+
+
+class _PipelineRun:
+    """Counters and state for one pipeline run"""
+
+    def __init__(self, session: DeduplicationSession):
+        self.session = session
+        self.started = time.perf_counter()
+        self.collector_report: Dict[str, Dict[str, Any]] = {}
+        self.articles_collected = 0
+        self.articles_already_stored = 0
+        self.articles_stored = 0
+        self.store_errors = 0
+        self.first_stored_seconds: Optional[float] = None
+        self.stage_seconds = {'process': 0.0, 'dedup': 0.0, 'store': 0.0}
+
+    def result(self) -> Dict[str, Any]:
+        return {
+            'unique_articles': self.session.unique_articles,
+            'articles_collected': self.articles_collected,
+            'articles_already_stored': self.articles_already_stored,
+            'duplicates_removed': self.session.duplicates_removed,
+            'near_duplicates_removed': self.session.simhash_duplicates,
+            'articles_stored': self.articles_stored,
+            'store_errors': self.store_errors,
+            'collectors': self.collector_report,
+            'first_stored_seconds': self.first_stored_seconds,
+            'stage_seconds': {stage: round(seconds, 3) for stage, seconds in self.stage_seconds.items()},
+        }
@@ -0,0 +1,238 @@
+"""
+Deduplication Benchmark - Indexed deduplication vs comparing every pair
+Runs both over a synthetic matchday batch and checks each against the stories it was built from
+
+Usage (from src/lib; the package directory's hyphen rules out ``python -m``):
+    python -c "import importlib; importlib.import_module('news-aggregator.benchmarks.dedup_benchmark').main()"
+    python -c "import importlib; importlib.import_module('news-aggregator.benchmarks.dedup_benchmark').main()" --stories 300
+
+The batch is synthetic, and so are the figures in the history measured on
+it. It is built from stories that several sources republish with the
+edits seen in practice: source suffixes and "BREAKING:" prefixes on titles,
+reworded titles, a few changed words or an extra sentence in the body, and
+tracking parameters on URLs. Unrelated stories about the same teams share
+much of their vocabulary, which is what makes near-duplicate lookup hard.
+
+The ideal result keeps one article per story. A wrong merge is a duplicate
+merged into an article from a different story.
+"""
+
+import argparse
+import copy
+import difflib
+import random
+import re
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Set
+
+from ..processors.deduplicator import Deduplicator
+
+TEAMS = ['Arsenal', 'Chelsea', 'Liverpool', 'Everton', 'Tottenham', 'Newcastle', 'Brighton', 'Fulham']
+
+WORDS = (
+    'manager said the team played well after the match and fans cheered as the striker scored '
+    'a late goal from the penalty spot while the defence held firm under pressure in the second half '
+    'midfielder injury update ahead of the weekend fixture with the squad training on friday '
+    'transfer talks continue as the club weighs a bid for the winger before the window closes '
+    'referee decision sparked debate over the var review and the keeper made a fine save '
+    'captain praised supporters away from home at the stadium in the title race this season'
+).split()
+
+PLAYERS = (
+    'Saka Odegaard Rice Havertz Martinelli Palmer Jackson Mudryk Enzo Caicedo Salah Nunez Szoboszlai '
+    'Van Dijk Alisson Pickford Calvert Lewin Branthwaite Son Maddison Romero Isak Gordon Guimaraes Trippier '
+    'Mitoma Welbeck Ferguson Iwobi Jimenez Leno Arteta Pochettino Klopp Dyche Postecoglou Howe De Zerbi Silva'
+).split()
+
+SOURCES = [
+    ('bbc_sport', 'bbc.co.uk/sport/football', ' | BBC Sport'),
+    ('sky_sports', 'skysports.com/football/news', ' | Sky Sports'),
+    ('guardian_football', 'theguardian.com/football', ' | The Guardian'),
+    ('espn_fc', 'espn.co.uk/football/story', ''),
+    ('google_news', 'news.google.com/articles', ''),
+]
+
+
+def _sentence(rng: random.Random, names: List[str], length: int) -> str:
+    words = [rng.choice(WORDS) for _ in range(length)]
+    for _ in range(3):
+        words[rng.randrange(length)] = rng.choice(names)
+    return ' '.join(words).capitalize() + '.'
+
+
+def _edit_words(rng: random.Random, text: str, count: int) -> str:
+    words = text.split()
+    for _ in range(count):
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+    return ' '.join(words)
+
+
+def build_batch(stories: int, seed: int) -> List[Dict[str, Any]]:
+    """Articles for ``stories`` stories, each republished by one to four sources"""
+    rng = random.Random(seed)
+    articles = []
+
+    for story in range(stories):
+        teams = rng.sample(TEAMS, 2)
+        names = teams + rng.sample(PLAYERS, 4) + [str(rng.randint(1, 90))]
+        title = f"{teams[0]} {' '.join(rng.choice(WORDS) for _ in range(6))} {teams[1]}"
+        content = ' '.join(_sentence(rng, names, rng.randint(12, 20)) for _ in range(rng.randint(5, 10)))
+        slug = title.lower().replace(' ', '_')
+
+        for copy_number, (source, domain, suffix) in enumerate(rng.sample(SOURCES, rng.randint(1, 4))):
+            variant_title, variant_content = title, content
+            if copy_number:
+                edit = rng.random()
+                if edit < 0.3:
+                    variant_title = f"BREAKING: {title}"
+                elif edit < 0.6:
+                    variant_title = _edit_words(rng, title, 1)
+                elif edit < 0.8:
+                    # Reworded headline: only the body gives it away
+                    variant_title = f"{teams[1]} {' '.join(rng.choice(WORDS) for _ in range(7))}"
+                variant_content = _edit_words(rng, content, rng.randint(1, 8))
+                if rng.random() < 0.3:
+                    variant_content += ' ' + _sentence(rng, names, 15)
+
+            articles.append({
+                'bench_id': len(articles),
+                'story': story,
+                'title': variant_title + suffix,
+                'content': variant_content,
+                'link': f"https://www.{domain}/{slug}_{story}?utm_source={source}",
+                'source': source,
+                'quality_score': round(rng.uniform(0.4, 0.95), 2),
+                'published_at': datetime(2024, 5, 11, 12, 0),
+            })
+
+    rng.shuffle(articles)
+    return articles
+
+
+def _legacy_is_similar(dedup: Deduplicator, article1: Dict[str, Any], article2: Dict[str, Any]) -> bool:
+    """The pairwise check before fingerprints: both articles normalised on every call"""
+    pairs = [
+        (dedup._normalize_title(article1.get('title', '')), dedup._normalize_title(article2.get('title', '')),
+         dedup.title_similarity_threshold, 0),
+        (dedup._normalize_content(article1.get('content', '') or article1.get('summary', '')),
+         dedup._normalize_content(article2.get('content', '') or article2.get('summary', '')),
+         dedup.content_similarity_threshold, 50),
+        (dedup._normalize_url(article1.get('link', '') or article1.get('url', '')),
+         dedup._normalize_url(article2.get('link', '') or article2.get('url', '')),
+         dedup.url_similarity_threshold, 0),
+    ]
+    for text1, text2, threshold, min_length in pairs:
+        if len(text1) > min_length and len(text2) > min_length:
+            if difflib.SequenceMatcher(None, text1, text2).ratio() >= threshold:
+                return True
+    return False
+
+
+def _legacy_find_original(dedup: Deduplicator, duplicate_article: Dict[str, Any],
+                          unique_articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """The scan that found the article to merge a hash match into"""
+    duplicate_hashes = dedup._generate_article_hashes(duplicate_article)
+
+    for article in unique_articles:
+        article_hashes = article['deduplication_info']['hashes']
+        for hash_val in duplicate_hashes.values():
+            if hash_val in article_hashes.values():
+                return article
+        if _legacy_is_similar(dedup, duplicate_article, article):
+            return article
+    return None
+
+
+def legacy_deduplicate(dedup: Deduplicator, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """The session loop before indexing: every new article is compared with every kept one"""
+    unique_articles = []
+    processed_hashes: Set[str] = set()
+
+    for article in sorted(articles, key=lambda x: x.get('quality_score', 0), reverse=True):
+        hashes = dedup._generate_article_hashes(article)
+
+        if dedup._is_duplicate_by_hash(hashes, processed_hashes):
+            original_article = _legacy_find_original(dedup, article, unique_articles)
+            if original_article:
+                dedup._merge_article_info(original_article, article)
+            continue
+
+        duplicate_found = False
+        for existing_article in unique_articles:
+            if _legacy_is_similar(dedup, article, existing_article):
+                dedup._merge_article_info(existing_article, article)
+                duplicate_found = True
+                break
+
+        if not duplicate_found:
+            article['deduplication_info'] = {'merged_count': 0, 'merged_sources': [], 'hashes': hashes}
+            unique_articles.append(article)
+            processed_hashes.update(hashes.values())
+
+    return unique_articles
+
+
+STORY_RE = re.compile(r'_(\d+)\?')
+
+
+def _wrong_merges(articles: List[Dict[str, Any]]) -> int:
+    """Duplicates merged into a kept article from a different story"""
+    return sum(
+        1 for article in articles
+        for merged in article['deduplication_info']['merged_sources']
+        if int(STORY_RE.search(merged['url']).group(1)) != article['story']
+    )
+
+
+def run(stories: int, seed: int) -> Dict[str, Any]:
+    batch = build_batch(stories, seed)
+    dedup = Deduplicator()
+
+    legacy_input = copy.deepcopy(batch)
+    started = time.perf_counter()
+    legacy = legacy_deduplicate(dedup, legacy_input)
+    legacy_seconds = time.perf_counter() - started
+
+    session_input = copy.deepcopy(batch)
+    started = time.perf_counter()
+    session = dedup.start_session()
+    session.add(session_input)
+    session_seconds = time.perf_counter() - started
+
+    return {
+        'articles': len(batch),
+        'stories': stories,
+        'legacy_unique': len(legacy),
+        'session_unique': len(session.unique_articles),
+        'legacy_seconds': legacy_seconds,
+        'session_seconds': session_seconds,
+        'session_comparisons': session.similarity_checks,
+        'simhash_duplicates': session.simhash_duplicates,
+        'legacy_wrong': _wrong_merges(legacy),
+        'session_wrong': _wrong_merges(session.unique_articles),
+    }
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--stories', type=int, nargs='+', default=[10, 20, 40], help='Story counts to benchmark')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    print(f"\n{'articles':>9}{'stories':>9}{'unique old/new':>16}{'old s':>9}{'new s':>9}{'speedup':>9}"
+          f"{'full checks':>13}{'simhash':>9}{'wrong old/new':>15}")
+    for stories in args.stories:
+        result = run(stories, args.seed)
+        unique = f"{result['legacy_unique']}/{result['session_unique']}"
+        wrong = f"{result['legacy_wrong']}/{result['session_wrong']}"
+        print(
+            f"{result['articles']:>9}{result['stories']:>9}{unique:>16}{result['legacy_seconds']:>9.2f}"
+            f"{result['session_seconds']:>9.2f}{result['legacy_seconds'] / result['session_seconds']:>8.1f}x"
+            f"{result['session_comparisons']:>13}{result['simhash_duplicates']:>9}{wrong:>15}"
+        )
+
+
+if __name__ == '__main__':
+    sys.exit(main())
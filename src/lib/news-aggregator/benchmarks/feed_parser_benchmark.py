@@ -0,0 +1,176 @@
+"""
+Feed Parser Benchmark - Streaming fast path vs feedparser
+Times both parsers on recorded or generated feeds and checks that they agree
+
+Usage (from src/lib; the package directory's hyphen rules out ``python -m``):
+    python -c "import importlib; importlib.import_module('news-aggregator.benchmarks.feed_parser_benchmark').main()" --synthetic
+    python -c "import importlib; importlib.import_module('news-aggregator.benchmarks.feed_parser_benchmark').main()" --record feeds/
+    python -c "import importlib; importlib.import_module('news-aggregator.benchmarks.feed_parser_benchmark').main()" feeds/*.xml
+
+No recorded feeds are committed, since they are the sources' content. The
+figures quoted in the history come from ``--synthetic``: generated RSS 2.0
+and Atom documents shaped like the configured sources' feeds.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import urllib.request
+from typing import Callable, Dict, List
+from xml.sax.saxutils import escape
+
+from ..collectors.feed_parser import parse_feed_fallback, parse_feed_fast
+from ..config import DEFAULT_HEADERS, RSS_SOURCES
+
+
+def record_feeds(directory: str):
+    """Download every configured RSS source into ``directory``"""
+    os.makedirs(directory, exist_ok=True)
+
+    for name, url in RSS_SOURCES.items():
+        request = urllib.request.Request(url, headers={'User-Agent': DEFAULT_HEADERS['User-Agent']})
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                content = response.read()
+        except Exception as e:
+            print(f"  skipped {name}: {e}")
+            continue
+
+        path = os.path.join(directory, f"{name}.xml")
+        with open(path, 'wb') as f:
+            f.write(content)
+        print(f"  recorded {name} ({len(content) / 1024:.0f} KiB) -> {path}")
+
+
+def build_synthetic_feeds(entries: int, seed: int = 1) -> Dict[str, bytes]:
+    """An RSS 2.0 and an Atom feed of ``entries`` items each"""
+    rng = random.Random(seed)
+    words = 'arsenal chelsea late goal manager injury update transfer bid derby win draw penalty keeper'.split()
+
+    def text(length: int) -> str:
+        return escape(' '.join(rng.choice(words) for _ in range(length)).capitalize())
+
+    items, atom_entries = [], []
+    for i in range(entries):
+        title, summary = text(8), text(40)
+        link = f"https://example.com/football/news/{i}"
+        items.append(
+            f"<item><title>{title}</title><link>{link}</link><guid>{link}</guid>"
+            f"<description>&lt;p&gt;{summary}&lt;/p&gt;</description>"
+            f"<pubDate>Sat, 11 May 2024 {i % 24:02d}:{i % 60:02d}:00 GMT</pubDate>"
+            f"<category>Football</category></item>"
+        )
+        atom_entries.append(
+            f"<entry><title>{title}</title><link href=\"{link}\"/><id>{link}</id>"
+            f"<updated>2024-05-11T{i % 24:02d}:{i % 60:02d}:00Z</updated>"
+            f"<summary>{summary}</summary><author><name>Staff</name></author></entry>"
+        )
+
+    return {
+        'synthetic_rss.xml': (
+            '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Football</title>'
+            + ''.join(items) + '</channel></rss>'
+        ).encode('utf-8'),
+        'synthetic_atom.xml': (
+            '<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom"><title>Football</title>'
+            + ''.join(atom_entries) + '</feed>'
+        ).encode('utf-8'),
+    }
+
+
+def time_parser(parser: Callable, content: bytes, rounds: int) -> List[float]:
+    """Per-round wall time in milliseconds"""
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        parser(content)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def benchmark_file(path: str, rounds: int) -> Dict[str, object]:
+    with open(path, 'rb') as f:
+        return benchmark_content(os.path.basename(path), f.read(), rounds)
+
+
+def benchmark_content(name: str, content: bytes, rounds: int) -> Dict[str, object]:
+    try:
+        fast_entries = parse_feed_fast(content)
+        fast_timings = time_parser(parse_feed_fast, content, rounds)
+    except Exception as e:
+        # Malformed feeds are exactly what the fallback is for
+        fast_entries = None
+        fast_timings = None
+        print(f"  {name}: fast path rejected feed ({e})")
+
+    fallback_entries = parse_feed_fallback(content)
+    fallback_timings = time_parser(parse_feed_fallback, content, rounds)
+
+    agreement = None
+    if fast_entries is not None and fallback_entries:
+        matching = sum(
+            1 for fast, slow in zip(fast_entries, fallback_entries)
+            if fast['title'] == slow['title'] and fast['link'] == slow['link']
+        )
+        agreement = matching / max(len(fast_entries), len(fallback_entries))
+
+    return {
+        'file': name,
+        'size_kib': len(content) / 1024,
+        'entries': len(fallback_entries),
+        'fast_ms': statistics.median(fast_timings) if fast_timings else None,
+        'feedparser_ms': statistics.median(fallback_timings),
+        'agreement': agreement,
+    }
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('files', nargs='*', help='Recorded feed files to benchmark')
+    parser.add_argument('--rounds', type=int, default=10, help='Timed parses per file and parser')
+    parser.add_argument('--record', metavar='DIR', help='Download the configured RSS sources into DIR first')
+    parser.add_argument('--synthetic', type=int, nargs='?', const=200, metavar='ENTRIES',
+                        help='Also benchmark generated RSS and Atom feeds (default 200 entries each)')
+    args = parser.parse_args(argv)
+
+    if args.record:
+        print(f"Recording feeds into {args.record}")
+        record_feeds(args.record)
+        if not args.files:
+            args.files = sorted(
+                os.path.join(args.record, name) for name in os.listdir(args.record) if name.endswith('.xml')
+            )
+
+    if not args.files and not args.synthetic:
+        parser.error('no feed files given')
+
+    results = [benchmark_file(path, args.rounds) for path in args.files]
+    if args.synthetic:
+        results += [
+            benchmark_content(name, content, args.rounds)
+            for name, content in build_synthetic_feeds(args.synthetic).items()
+        ]
+
+    print(f"\n{'feed':<32}{'KiB':>8}{'entries':>9}{'fast ms':>10}{'feedparser ms':>15}{'speedup':>9}{'agree':>8}")
+    for result in results:
+        fast = result['fast_ms']
+        speedup = f"{result['feedparser_ms'] / fast:.1f}x" if fast else '-'
+        agreement = f"{result['agreement']:.0%}" if result['agreement'] is not None else '-'
+        print(
+            f"{result['file'][:31]:<32}{result['size_kib']:>8.0f}{result['entries']:>9}"
+            f"{fast if fast is not None else float('nan'):>10.2f}{result['feedparser_ms']:>15.2f}"
+            f"{speedup:>9}{agreement:>8}"
+        )
+
+    fast_total = sum(r['fast_ms'] for r in results if r['fast_ms'] is not None)
+    slow_total = sum(r['feedparser_ms'] for r in results if r['fast_ms'] is not None)
+    if fast_total:
+        print(f"\nTotal on feeds both parsers accept: {fast_total:.1f} ms vs {slow_total:.1f} ms "
+              f"({slow_total / fast_total:.1f}x)")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+Timestamp Benchmark - Shared timestamp parser vs the per-collector parsers it replaced
+Times both on feed date strings and counts where applying the timezone changes the result
+
+Usage (from src/lib; the package directory's hyphen rules out ``python -m``):
+    python -c "import importlib; importlib.import_module('news-aggregator.benchmarks.timestamp_benchmark').main()"
+    python -c "import importlib; importlib.import_module('news-aggregator.benchmarks.timestamp_benchmark').main()" --feeds feeds/
+
+The built-in corpus is synthetic: date strings generated in the shapes the
+configured sources publish, which is what the figures in the history were
+measured on. ``--feeds`` adds the entry dates of feed files recorded with
+``feed_parser_benchmark --record``; none are committed.
+"""
+
+import argparse
+import email.utils
+import os
+import re
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from ..collectors.feed_parser import parse_feed_fast
+from ..collectors.timestamps import TimestampParser
+
+# One template per source, as seen in its feed or API responses
+SOURCE_TEMPLATES = {
+    'bbc_sport': '{rfc} GMT',
+    'guardian_football': '{rfc} GMT',
+    'sky_sports': '{rfc} BST',
+    'espn_fc': '{rfc} EST',
+    'goal_com': '{rfc} +0200',
+    'uefa_atom': '{iso}Z',
+    'bundesliga_atom': '{iso}+02:00',
+    'guardian_api': '{iso}Z',
+    'newsdata_api': '{date} {time}',
+    'currents_api': '{date} {time} +0000',
+    'nitter': '{rfc} GMT',
+    'google_news': '{rfc} GMT',
+    'club_site_day_first': '{day} {month} {year}',
+    'club_site_month_first': '{month} {day}, {year}',
+    'club_site_numeric': '{day:02d}/{month_number:02d}/{year}',
+    'club_site_relative': '{hours} hours ago',
+}
+
+# Sources whose old collector used the scraper's format list rather than RFC-822 first
+SCRAPER_SOURCES = {name for name in SOURCE_TEMPLATES if name.startswith('club_site')}
+
+LEGACY_RSS_FORMATS = [
+    '%a, %d %b %Y %H:%M:%S %z',
+    '%a, %d %b %Y %H:%M:%S %Z',
+    '%Y-%m-%dT%H:%M:%S%z',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',
+]
+
+LEGACY_SCRAPER_FORMATS = [
+    '%Y-%m-%dT%H:%M:%S%z',
+    '%Y-%m-%dT%H:%M:%SZ',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',
+    '%d %B %Y',
+    '%d %b %Y',
+    '%B %d, %Y',
+    '%b %d, %Y',
+    '%d/%m/%Y',
+    '%m/%d/%Y',
+]
+
+
+def legacy_rss_parse(date_str: str) -> Optional[datetime]:
+    """The RSS and Nitter collectors' parser before the shared one: offsets dropped"""
+    try:
+        parsed = email.utils.parsedate_tz(date_str)
+        if parsed:
+            return datetime(*parsed[:6])
+    except Exception:
+        pass
+
+    for fmt in LEGACY_RSS_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def legacy_scraper_parse(date_str: str) -> Optional[datetime]:
+    """The scraper's parser before the shared one: every format in turn, then relative dates"""
+    for fmt in LEGACY_SCRAPER_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+
+    match = re.search(r'(\d+)\s*hour', date_str.lower())
+    if match and 'ago' in date_str.lower():
+        return datetime.utcnow() - timedelta(hours=int(match.group(1)))
+    return None
+
+
+def build_corpus(per_source: int) -> Dict[str, List[str]]:
+    """``per_source`` date strings per source, spread over the last few days"""
+    start = datetime(2024, 5, 11, 18, 0, 0)
+    corpus = {}
+
+    for source, template in SOURCE_TEMPLATES.items():
+        strings = []
+        for i in range(per_source):
+            when = start - timedelta(minutes=37 * i)
+            strings.append(template.format(
+                rfc=when.strftime('%a, %d %b %Y %H:%M:%S'),
+                iso=when.strftime('%Y-%m-%dT%H:%M:%S'),
+                date=when.strftime('%Y-%m-%d'),
+                time=when.strftime('%H:%M:%S'),
+                day=when.day,
+                month=when.strftime('%B'),
+                month_number=when.month,
+                year=when.year,
+                hours=i % 23 + 1,
+            ))
+        corpus[source] = strings
+
+    return corpus
+
+
+def load_feed_dates(directory: str) -> Dict[str, List[str]]:
+    """Entry dates of every recorded feed file in ``directory``"""
+    corpus = {}
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith('.xml'):
+            continue
+        with open(os.path.join(directory, name), 'rb') as f:
+            content = f.read()
+        try:
+            dates = [entry['published'] for entry in parse_feed_fast(content) if entry.get('published')]
+        except Exception as e:
+            print(f"  skipped {name}: {e}")
+            continue
+        if dates:
+            corpus[f"recorded:{name[:-4]}"] = dates
+    return corpus
+
+
+def time_calls(parse: Callable[[str], Optional[datetime]], strings: List[str], rounds: int) -> float:
+    """Median microseconds per date string"""
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for value in strings:
+            parse(value)
+        timings.append((time.perf_counter() - started) * 1e6 / len(strings))
+    return statistics.median(timings)
+
+
+def benchmark_source(source: str, strings: List[str], rounds: int) -> Dict[str, object]:
+    legacy = legacy_scraper_parse if source in SCRAPER_SOURCES else legacy_rss_parse
+
+    # A fresh parser per source, so the first call pays for learning the format
+    parser = TimestampParser()
+    shared = lambda value: parser.parse(value, source)
+
+    legacy_results = [legacy(value) for value in strings]
+    shared_results = [shared(value) for value in strings]
+
+    legacy_parsed = sum(1 for result in legacy_results if result is not None)
+    shared_parsed = sum(1 for result in shared_results if result is not None)
+    # Where both parsed, a different instant means the old parser dropped the zone
+    shifted = sum(
+        1 for old, new in zip(legacy_results, shared_results)
+        if old is not None and new is not None and source not in ('club_site_relative',) and old != new
+    )
+
+    return {
+        'source': source,
+        'strings': len(strings),
+        'legacy_us': time_calls(legacy, strings, rounds),
+        'shared_us': time_calls(shared, strings, rounds),
+        'legacy_parsed': legacy_parsed,
+        'shared_parsed': shared_parsed,
+        'zone_fixed': shifted,
+        'memo_hit_rate': parser.get_stats()['memo_hit_rate'],
+    }
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--feeds', metavar='DIR', help='Also benchmark entry dates from recorded feed files in DIR')
+    parser.add_argument('--per-source', type=int, default=200, help='Generated date strings per source')
+    parser.add_argument('--rounds', type=int, default=10, help='Timed passes over each source')
+    args = parser.parse_args(argv)
+
+    corpus = build_corpus(args.per_source)
+    if args.feeds:
+        corpus.update(load_feed_dates(args.feeds))
+
+    results = [benchmark_source(source, strings, args.rounds) for source, strings in corpus.items()]
+
+    print(f"\n{'source':<30}{'dates':>7}{'legacy us':>11}{'shared us':>11}{'speedup':>9}"
+          f"{'parsed old/new':>16}{'tz fixed':>10}{'memo':>7}")
+    for result in results:
+        parsed = f"{result['legacy_parsed']}/{result['shared_parsed']}"
+        print(
+            f"{result['source'][:29]:<30}{result['strings']:>7}{result['legacy_us']:>11.2f}"
+            f"{result['shared_us']:>11.2f}{result['legacy_us'] / result['shared_us']:>8.1f}x"
+            f"{parsed:>16}{result['zone_fixed']:>10}{result['memo_hit_rate']:>7.0%}"
+        )
+
+    total = sum(result['strings'] for result in results)
+    legacy_total = sum(result['legacy_us'] * result['strings'] for result in results)
+    shared_total = sum(result['shared_us'] * result['strings'] for result in results)
+    print(f"\nAll {total} dates: {legacy_total / 1000:.1f} ms vs {shared_total / 1000:.1f} ms "
+          f"({legacy_total / shared_total:.1f}x), "
+          f"{sum(r['shared_parsed'] - r['legacy_parsed'] for r in results)} more parsed, "
+          f"{sum(r['zone_fixed'] for r in results)} moved to the correct UTC instant")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
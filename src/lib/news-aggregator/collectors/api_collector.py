@@ -12,18 +12,37 @@ import hashlib
 import json
 
 from ..config import NEWS_APIS, RATE_LIMITS, DEFAULT_HEADERS, TEAM_VARIATIONS
+from .http_pool import HTTPClientPool
+from .rate_limiter import HostRateLimiter, shared_rate_limiter
+from .api_query_planner import APIQueryPlanner, DateWindow, shared_api_query_planner
+from .relevance_router import RelevanceRouter, shared_relevance_router
+from .registry import ArticleSink, gather_into
+from .timestamps import TimestampParser, shared_timestamp_parser
+from ..storage.quota_ledger import QuotaLedger
 
 logger = logging.getLogger(__name__)
 
 class APICollector:
-    def __init__(self):
+    def __init__(self, http_pool: HTTPClientPool = None, rate_limiter: HostRateLimiter = None,
+                 relevance_router: RelevanceRouter = None, quota_ledger: QuotaLedger = None,
+                 query_planner: APIQueryPlanner = None, timestamp_parser: TimestampParser = None):
         self.apis = NEWS_APIS
         self.headers = DEFAULT_HEADERS.copy()
-        self.rate_limiter = asyncio.Semaphore(RATE_LIMITS['news_apis']['concurrent_requests'])
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        self.relevance_router = relevance_router or shared_relevance_router
         self.session = None
-        self.daily_usage = {api: 0 for api in self.apis.keys()}
+        self.http_pool = http_pool
+        # Daily quotas are shared across workers; without storage the ledger uses a local file
+        self.quota_ledger = quota_ledger or QuotaLedger()
+        self.query_planner = query_planner or shared_api_query_planner
+        self.timestamps = timestamp_parser or shared_timestamp_parser
         
     async def __aenter__(self):
+        if self.http_pool:
+            # Borrow the application-wide session; the pool owns its lifetime
+            self.session = self.http_pool.session
+            return self
+        
         timeout = aiohttp.ClientTimeout(total=30)
         self.session = aiohttp.ClientSession(
             timeout=timeout,
@@ -33,44 +52,43 @@ class APICollector:
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and not self.http_pool:
             await self.session.close()
     
-    async def collect_for_match(self, home_team: str, away_team: str, match_date: datetime) -> List[Dict[str, Any]]:
-        """Collect news from free APIs for a specific match"""
+    async def collect_for_match(self, home_team: str, away_team: str, match_date: datetime,
+                               match_id: str = None, priority: str = 'normal',
+                               sink: ArticleSink = None) -> List[Dict[str, Any]]:
+        """Collect news from free APIs for a specific match; each API's articles go to ``sink``"""
         queries = self._build_queries(home_team, away_team, match_date)
+        queries['match_id'] = self.relevance_router.register_match(match_id, home_team, away_team)
+        queries['priority'] = priority
         
-        # Collect from all available APIs
-        tasks = []
-        
-        if self._can_use_api('guardian'):
-            tasks.append(self._collect_from_guardian(queries))
-        
-        if self._can_use_api('newsdata'):
-            tasks.append(self._collect_from_newsdata(queries))
-        
-        if self._can_use_api('currents'):
-            tasks.append(self._collect_from_currents(queries))
-        
-        if not tasks:
-            logger.warning("No APIs available for collection")
-            return []
-        
-        # Execute all tasks concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Merge results
-        all_articles = []
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"API collection error: {result}")
-                continue
-            all_articles.extend(result)
-        
-        # Sort by relevance and quality
-        all_articles.sort(key=lambda x: (x['relevance_score'], x['quality_score']), reverse=True)
-        
-        return all_articles
+        try:
+            # Collect from all available APIs
+            tasks = []
+            
+            if self._can_use_api('guardian'):
+                tasks.append(self._collect_from_guardian(queries))
+            
+            if self._can_use_api('newsdata'):
+                tasks.append(self._collect_from_newsdata(queries))
+            
+            if self._can_use_api('currents'):
+                tasks.append(self._collect_from_currents(queries))
+            
+            if not tasks:
+                logger.warning("No APIs available for collection")
+                return []
+            
+            # Execute all tasks concurrently
+            all_articles = await gather_into(tasks, sink, 'API')
+            
+            # Sort by relevance and quality
+            all_articles.sort(key=lambda x: (x['relevance_score'], x['quality_score']), reverse=True)
+            
+            return all_articles
+        finally:
+            self.relevance_router.unregister_match(queries['match_id'])
     
     def _build_queries(self, home_team: str, away_team: str, match_date: datetime) -> Dict[str, Any]:
         """Build comprehensive search queries for APIs"""
@@ -97,7 +115,7 @@ class APICollector:
         }
     
     def _can_use_api(self, api_name: str) -> bool:
-        """Check if API can be used (within daily limits)"""
+        """Check if API can be used (daily limits are charged per call)"""
         if api_name not in self.apis:
             return False
         
@@ -108,142 +126,200 @@ class APICollector:
             logger.warning(f"No API key for {api_name}")
             return False
         
-        # Check daily usage
-        current_usage = self.daily_usage.get(api_name, 0)
-        daily_limit = api_config.get('daily_limit', 0)
-        
-        if current_usage >= daily_limit:
-            logger.warning(f"Daily limit reached for {api_name}")
-            return False
-        
         return True
     
+    async def _charge_call(self, api_name: str, queries: Dict[str, Any]) -> bool:
+        """Count a call against the shared daily quota before making it"""
+        return await self.quota_ledger.try_charge(api_name, queries.get('priority', 'normal'))
+    
+    def _query_window(self, queries: Dict[str, Any]) -> DateWindow:
+        """Date window as the APIs see it, shared by every match in it"""
+        start, end = queries['date_range']
+        return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+    
     async def _collect_from_guardian(self, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Collect from Guardian Open Platform API"""
-        async with self.rate_limiter:
-            try:
-                # Rate limiting
-                await asyncio.sleep(1.0 / self.apis['guardian']['rate_limit'])
-                
-                articles = []
-                
-                # Try different query combinations
-                for team in queries['primary_teams']:
-                    params = {
-                        'q': f"{team} AND (football OR soccer)",
-                        'from-date': queries['date_range'][0].strftime('%Y-%m-%d'),
-                        'to-date': queries['date_range'][1].strftime('%Y-%m-%d'),
-                        'section': 'sport',
-                        'show-fields': 'headline,trailText,body,publication,thumbnail',
-                        'show-tags': 'keyword',
-                        'page-size': 20,
-                        'api-key': self.apis['guardian']['key']
-                    }
+        try:
+            team_results = await self.query_planner.get_team_results(
+                'guardian', queries['primary_teams'], self._query_window(queries),
+                fetch=lambda teams: self._search_guardian(teams, queries),
+                text_of=self._guardian_text,
+                max_terms=self.apis['guardian'].get('max_or_terms', 1)
+            )
+            
+            articles = []
+            seen_ids = set()
+            
+            for items in team_results.values():
+                for item in items:
+                    if item.get('id') in seen_ids:
+                        continue
+                    seen_ids.add(item.get('id'))
                     
-                    async with self.session.get(self.apis['guardian']['url'], params=params) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            
-                            for item in data.get('response', {}).get('results', []):
-                                article = self._process_guardian_article(item, queries)
-                                if article:
-                                    articles.append(article)
-                            
-                            self.daily_usage['guardian'] += 1
-                        else:
-                            logger.error(f"Guardian API error: {response.status}")
-                
-                logger.info(f"Collected {len(articles)} articles from Guardian API")
-                return articles
-                
-            except Exception as e:
-                logger.error(f"Error collecting from Guardian API: {e}")
-                return []
+                    article = self._process_guardian_article(item, queries)
+                    if article:
+                        articles.append(article)
+            
+            logger.info(f"Collected {len(articles)} articles from Guardian API")
+            return articles
+            
+        except Exception as e:
+            logger.error(f"Error collecting from Guardian API: {e}")
+            return []
+    
+    async def _search_guardian(self, teams: List[str], queries: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """One Guardian search for any of ``teams``, with further result pages fetched concurrently"""
+        api_config = self.apis['guardian']
+        team_query = ' OR '.join(f'"{team}"' for team in teams)
+        params = {
+            'q': f"({team_query}) AND (football OR soccer)",
+            'from-date': queries['date_range'][0].strftime('%Y-%m-%d'),
+            'to-date': queries['date_range'][1].strftime('%Y-%m-%d'),
+            'section': 'sport',
+            'show-fields': 'headline,trailText,body,publication,thumbnail',
+            'show-tags': 'keyword',
+            'page-size': min(api_config['page_size'] * len(teams), 200),  # Guardian's maximum
+            'api-key': api_config['key']
+        }
+        
+        first_page = await self._get_guardian_page(params, 1, queries)
+        if first_page is None:
+            return None
+        
+        items = list(first_page.get('results', []))
+        pages = min(first_page.get('pages', 1), api_config['max_pages'])
+        
+        if pages > 1:
+            more = await asyncio.gather(*[
+                self._get_guardian_page(params, page, queries) for page in range(2, pages + 1)
+            ])
+            for page in more:
+                if page:
+                    items.extend(page.get('results', []))
+        
+        return items
+    
+    async def _get_guardian_page(self, params: Dict[str, Any], page: int, queries: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if not await self._charge_call('guardian', queries):
+            return None
+        
+        await self.rate_limiter.acquire(self.apis['guardian']['url'], 'news_apis', rate=self.apis['guardian']['rate_limit'])
+        async with self.session.get(self.apis['guardian']['url'], params={**params, 'page': page}) as response:
+            if response.status != 200:
+                logger.error(f"Guardian API error: {response.status}")
+                return None
+            
+            data = await response.json()
+            return data.get('response', {})
+    
+    @staticmethod
+    def _guardian_text(item: Dict[str, Any]) -> str:
+        fields = item.get('fields', {})
+        return ' '.join((item.get('webTitle', ''), fields.get('headline', ''), fields.get('trailText', ''), fields.get('body', '')))
     
     async def _collect_from_newsdata(self, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Collect from NewsData.io API"""
-        async with self.rate_limiter:
-            try:
-                # Rate limiting
-                await asyncio.sleep(1.0 / self.apis['newsdata']['rate_limit'])
-                
-                articles = []
-                
-                # Use primary match query
-                match_query = f"({queries['primary_teams'][0]} AND {queries['primary_teams'][1]}) OR ({' OR '.join(queries['match_phrases'])})"
-                
-                params = {
-                    'q': match_query,
-                    'category': 'sports',
-                    'language': 'en',
-                    'country': 'us,gb',
-                    'from_date': queries['date_range'][0].strftime('%Y-%m-%d'),
-                    'to_date': queries['date_range'][1].strftime('%Y-%m-%d'),
-                    'size': 50,
-                    'apikey': self.apis['newsdata']['key']
-                }
-                
-                async with self.session.get(self.apis['newsdata']['url'], params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        for item in data.get('results', []):
-                            article = self._process_newsdata_article(item, queries)
-                            if article:
-                                articles.append(article)
-                        
-                        self.daily_usage['newsdata'] += 1
-                    else:
-                        logger.error(f"NewsData API error: {response.status}")
-                
-                logger.info(f"Collected {len(articles)} articles from NewsData API")
-                return articles
-                
-            except Exception as e:
-                logger.error(f"Error collecting from NewsData API: {e}")
-                return []
+        try:
+            articles = []
+            
+            # Use primary match query
+            match_query = f"({queries['primary_teams'][0]} AND {queries['primary_teams'][1]}) OR ({' OR '.join(queries['match_phrases'])})"
+            
+            items = await self.query_planner.get_query_results(
+                'newsdata', match_query, self._query_window(queries),
+                fetch=lambda: self._search_newsdata(match_query, queries)
+            )
+            
+            for item in items:
+                article = self._process_newsdata_article(item, queries)
+                if article:
+                    articles.append(article)
+            
+            logger.info(f"Collected {len(articles)} articles from NewsData API")
+            return articles
+            
+        except Exception as e:
+            logger.error(f"Error collecting from NewsData API: {e}")
+            return []
+    
+    async def _search_newsdata(self, match_query: str, queries: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        params = {
+            'q': match_query,
+            'category': 'sports',
+            'language': 'en',
+            'country': 'us,gb',
+            'from_date': queries['date_range'][0].strftime('%Y-%m-%d'),
+            'to_date': queries['date_range'][1].strftime('%Y-%m-%d'),
+            'size': 50,
+            'apikey': self.apis['newsdata']['key']
+        }
+        
+        if not await self._charge_call('newsdata', queries):
+            return None
+        
+        await self.rate_limiter.acquire(self.apis['newsdata']['url'], 'news_apis', rate=self.apis['newsdata']['rate_limit'])
+        async with self.session.get(self.apis['newsdata']['url'], params=params) as response:
+            if response.status != 200:
+                logger.error(f"NewsData API error: {response.status}")
+                return None
+            
+            data = await response.json()
+            return data.get('results', [])
     
     async def _collect_from_currents(self, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Collect from Currents API"""
-        async with self.rate_limiter:
-            try:
-                # Rate limiting
-                await asyncio.sleep(1.0 / self.apis['currents']['rate_limit'])
-                
-                articles = []
-                
-                # Use team names for search
-                for team in queries['primary_teams']:
-                    params = {
-                        'keywords': f"{team} football OR {team} soccer",
-                        'category': 'sports',
-                        'language': 'en',
-                        'country': 'US,GB',
-                        'start_date': queries['date_range'][0].strftime('%Y-%m-%d'),
-                        'end_date': queries['date_range'][1].strftime('%Y-%m-%d'),
-                        'page_size': 20,
-                        'apiKey': self.apis['currents']['key']
-                    }
+        try:
+            team_results = await self.query_planner.get_team_results(
+                'currents', queries['primary_teams'], self._query_window(queries),
+                fetch=lambda teams: self._search_currents(teams, queries),
+                text_of=lambda item: f"{item.get('title', '')} {item.get('description', '')}",
+                max_terms=self.apis['currents'].get('max_or_terms', 1)
+            )
+            
+            articles = []
+            seen_ids = set()
+            
+            for items in team_results.values():
+                for item in items:
+                    if item.get('id') in seen_ids:
+                        continue
+                    seen_ids.add(item.get('id'))
                     
-                    async with self.session.get(self.apis['currents']['url'], params=params) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            
-                            for item in data.get('news', []):
-                                article = self._process_currents_article(item, queries)
-                                if article:
-                                    articles.append(article)
-                            
-                            self.daily_usage['currents'] += 1
-                        else:
-                            logger.error(f"Currents API error: {response.status}")
-                
-                logger.info(f"Collected {len(articles)} articles from Currents API")
-                return articles
-                
-            except Exception as e:
-                logger.error(f"Error collecting from Currents API: {e}")
-                return []
+                    article = self._process_currents_article(item, queries)
+                    if article:
+                        articles.append(article)
+            
+            logger.info(f"Collected {len(articles)} articles from Currents API")
+            return articles
+            
+        except Exception as e:
+            logger.error(f"Error collecting from Currents API: {e}")
+            return []
+    
+    async def _search_currents(self, teams: List[str], queries: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        # Use team names for search
+        params = {
+            'keywords': ' OR '.join(f"{team} football OR {team} soccer" for team in teams),
+            'category': 'sports',
+            'language': 'en',
+            'country': 'US,GB',
+            'start_date': queries['date_range'][0].strftime('%Y-%m-%d'),
+            'end_date': queries['date_range'][1].strftime('%Y-%m-%d'),
+            'page_size': 20 * len(teams),
+            'apiKey': self.apis['currents']['key']
+        }
+        
+        if not await self._charge_call('currents', queries):
+            return None
+        
+        await self.rate_limiter.acquire(self.apis['currents']['url'], 'news_apis', rate=self.apis['currents']['rate_limit'])
+        async with self.session.get(self.apis['currents']['url'], params=params) as response:
+            if response.status != 200:
+                logger.error(f"Currents API error: {response.status}")
+                return None
+            
+            data = await response.json()
+            return data.get('news', [])
     
     def _process_guardian_article(self, item: Dict[str, Any], queries: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Process Guardian API article"""
@@ -263,7 +339,7 @@ class APICollector:
                 return None
             
             # Parse date
-            pub_date = self._parse_date(item.get('webPublicationDate', ''))
+            pub_date = self._parse_date(item.get('webPublicationDate', ''), 'guardian')
             
             article = {
                 'title': title,
@@ -307,7 +383,7 @@ class APICollector:
                 return None
             
             # Parse date
-            pub_date = self._parse_date(item.get('pubDate', ''))
+            pub_date = self._parse_date(item.get('pubDate', ''), 'newsdata')
             
             article = {
                 'title': title,
@@ -350,7 +426,7 @@ class APICollector:
                 return None
             
             # Parse date
-            pub_date = self._parse_date(item.get('published', ''))
+            pub_date = self._parse_date(item.get('published', ''), 'currents')
             
             article = {
                 'title': title,
@@ -379,41 +455,7 @@ class APICollector:
     
     def _calculate_relevance(self, title: str, summary: str, content: str, queries: Dict[str, Any]) -> float:
         """Calculate relevance score"""
-        text = f"{title} {summary} {content}".lower()
-        score = 0.0
-        
-        # Check for direct team mentions
-        for team in queries['primary_teams']:
-            if team.lower() in text:
-                score += 0.5
-        
-        # Check for team variations
-        for variation in queries['all_variations']:
-            if variation.lower() in text:
-                score += 0.2
-        
-        # Check for match phrases
-        for phrase in queries['match_phrases']:
-            if phrase.lower() in text:
-                score += 0.7
-        
-        # Check for keywords
-        for keyword in queries['keywords']:
-            if keyword.lower() in text:
-                score += 0.1
-        
-        # Penalize excluded terms
-        for exclude_term in queries['exclude_terms']:
-            if exclude_term.lower() in text:
-                score -= 0.4
-        
-        # Bonus for title matches
-        title_lower = title.lower()
-        for team in queries['primary_teams']:
-            if team.lower() in title_lower:
-                score += 0.3
-        
-        return min(score, 1.0)
+        return self.relevance_router.score(queries['match_id'], 'api', title, summary, content)
     
     def _calculate_quality_score(self, api_name: str, title: str, summary: str) -> float:
         """Calculate quality score"""
@@ -437,32 +479,9 @@ class APICollector:
         
         return min(base_score, 1.0)
     
-    def _parse_date(self, date_str: str) -> datetime:
-        """Parse date string"""
-        if not date_str:
-            return datetime.utcnow()
-        
-        # Try ISO format first
-        try:
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        except ValueError:
-            pass
-        
-        # Try other formats
-        formats = [
-            '%Y-%m-%dT%H:%M:%S%z',
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d',
-            '%a, %d %b %Y %H:%M:%S %Z',
-        ]
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        
-        return datetime.utcnow()
+    def _parse_date(self, date_str: str, api_name: str = None) -> datetime:
+        """Parse date string to naive UTC, defaulting to now"""
+        return self.timestamps.parse(date_str, api_name) or datetime.utcnow()
     
     def _generate_hash(self, title: str, article_id: str) -> str:
         """Generate unique hash"""
@@ -497,60 +516,38 @@ class APICollector:
         
         return list(set(tags))
     
-    def get_daily_usage(self) -> Dict[str, Dict[str, Any]]:
-        """Get current daily usage statistics"""
-        usage_stats = {}
-        
-        for api_name, api_config in self.apis.items():
-            current_usage = self.daily_usage.get(api_name, 0)
-            daily_limit = api_config.get('daily_limit', 0)
-            
-            usage_stats[api_name] = {
-                'current_usage': current_usage,
-                'daily_limit': daily_limit,
-                'remaining': daily_limit - current_usage,
-                'percentage_used': (current_usage / daily_limit * 100) if daily_limit > 0 else 0,
-                'status': 'available' if current_usage < daily_limit else 'exhausted'
-            }
-        
-        return usage_stats
-    
-    def reset_daily_usage(self):
-        """Reset daily usage counters (call this daily)"""
-        self.daily_usage = {api: 0 for api in self.apis.keys()}
-        logger.info("Daily usage counters reset")
+    async def get_daily_usage(self) -> Dict[str, Dict[str, Any]]:
+        """Get today's usage from the shared quota ledger"""
+        return await self.quota_ledger.get_usage()
     
     async def test_api_connections(self) -> Dict[str, Dict[str, Any]]:
-        """Test connections to all configured APIs"""
+        """
+        Report each API's state from the quota ledger.
+        
+        No request is made: a test call would spend the daily quota, and
+        health checks run on every /health request.
+        """
+        usage = await self.quota_ledger.get_usage()
         results = {}
         
         for api_name, api_config in self.apis.items():
-            try:
-                test_params = {
-                    'q': 'football',
-                    'page-size': 1,
-                    'api-key': api_config['key']
-                } if api_name == 'guardian' else {
-                    'q': 'football',
-                    'size': 1,
-                    'apikey': api_config['key']
-                }
-                
-                async with self.session.get(api_config['url'], params=test_params) as response:
-                    results[api_name] = {
-                        'status': 'healthy' if response.status == 200 else 'unhealthy',
-                        'status_code': response.status,
-                        'response_time': response.headers.get('x-response-time', 'unknown'),
-                        'last_tested': datetime.utcnow().isoformat(),
-                        'has_key': bool(api_config['key'])
-                    }
-                    
-            except Exception as e:
-                results[api_name] = {
-                    'status': 'error',
-                    'error': str(e),
-                    'last_tested': datetime.utcnow().isoformat(),
-                    'has_key': bool(api_config.get('key'))
-                }
+            has_key = bool(api_config.get('key'))
+            api_usage = usage.get(api_name, {})
+            
+            if not has_key:
+                status = 'unconfigured'
+            elif api_usage.get('status') == 'exhausted':
+                status = 'exhausted'
+            else:
+                status = 'healthy'
+            
+            results[api_name] = {
+                'status': status,
+                'has_key': has_key,
+                'current_usage': api_usage.get('current_usage', 0),
+                'daily_limit': api_usage.get('daily_limit', api_config.get('daily_limit', 0)),
+                'reserved': api_usage.get('reserved', 0),
+                'last_tested': datetime.utcnow().isoformat(),
+            }
         
         return results
\ No newline at end of file
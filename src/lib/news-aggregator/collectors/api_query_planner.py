@@ -0,0 +1,215 @@
+"""
+News API Query Planner - Batched team queries with a shared response cache
+Folds team searches into OR-queries and caches results per team and date window
+"""
+
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..config import CACHE_CONFIG, TEAM_VARIATIONS
+
+logger = logging.getLogger(__name__)
+
+# (start, end) dates as sent to the APIs, e.g. ('2024-05-09', '2024-05-13')
+DateWindow = Tuple[str, str]
+BatchFetcher = Callable[[List[str]], Awaitable[Optional[List[Dict[str, Any]]]]]
+QueryFetcher = Callable[[], Awaitable[Optional[List[Dict[str, Any]]]]]
+
+
+def normalise_query(text: str) -> str:
+    return ' '.join(text.lower().split())
+
+
+class _CachedResults:
+    def __init__(self, results: List[Dict[str, Any]]):
+        self.results = results
+        self.fetched_at = time.monotonic()
+
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+
+class APIQueryPlanner:
+    """
+    Plans one match's news API searches against a cache shared by every match.
+
+    Team searches are cached per (api, team, date window), so a team
+    shared by overlapping fixtures, or a re-aggregated match, is served
+    without another call, and concurrent requests for the same key share
+    one in-flight fetch. Only the calling match's own missing teams are
+    folded together, into as few OR-queries as the API accepts (none for
+    APIs that allow a single term); each batch's results are split back to
+    the teams whose names appear in them. Teams of different matches are
+    never batched into one query.
+    """
+
+    def __init__(self, ttl: float = None):
+        self.ttl = ttl if ttl is not None else CACHE_CONFIG['api_responses_expire']
+        self._cache: Dict[Tuple[str, str, DateWindow], _CachedResults] = {}
+        self._inflight: Dict[Tuple[str, str, DateWindow], asyncio.Future] = {}
+        self._team_patterns: Dict[str, re.Pattern] = {}
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'coalesced': 0,
+            'requests_planned': 0,
+            'requests_saved': 0,
+            'fetch_failures': 0,
+        }
+
+    def _fresh(self, key: Tuple[str, str, DateWindow]) -> Optional[List[Dict[str, Any]]]:
+        cached = self._cache.get(key)
+        if cached and cached.age() < self.ttl:
+            return cached.results
+        return None
+
+    def _team_pattern(self, team: str) -> re.Pattern:
+        pattern = self._team_patterns.get(team)
+        if pattern is None:
+            names = sorted({team, *TEAM_VARIATIONS.get(team, [])}, key=len, reverse=True)
+            pattern = re.compile(r'(?<!\w)(?:' + '|'.join(re.escape(name.lower()) for name in names) + r')(?!\w)')
+            self._team_patterns[team] = pattern
+        return pattern
+
+    async def get_team_results(self, api_name: str, teams: List[str], window: DateWindow,
+                               fetch: BatchFetcher, text_of: Callable[[Dict[str, Any]], str],
+                               max_terms: int = 1) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Results per team for ``teams`` over ``window``.
+
+        ``fetch`` searches for a batch of up to ``max_terms`` teams at once
+        and returns the raw result items, or None on failure (including a
+        refused quota charge). ``text_of`` gives the searchable text of an
+        item for splitting results between the teams of a batch.
+        """
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        missing: List[str] = []
+
+        teams = list(dict.fromkeys(teams))
+        for team in teams:
+            key = (api_name, normalise_query(team), window)
+
+            cached = self._fresh(key)
+            if cached is not None:
+                self.stats['hits'] += 1
+                results[team] = cached
+                continue
+
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                self.stats['coalesced'] += 1
+                waiting[team] = inflight
+                continue
+
+            self.stats['misses'] += 1
+            missing.append(team)
+
+        if missing:
+            loop = asyncio.get_running_loop()
+            futures = {}
+            for team in missing:
+                futures[team] = loop.create_future()
+                self._inflight[(api_name, normalise_query(team), window)] = futures[team]
+            waiting.update(futures)
+
+            batches = [missing[i:i + max(1, max_terms)] for i in range(0, len(missing), max(1, max_terms))]
+            self.stats['requests_planned'] += len(batches)
+            self.stats['requests_saved'] += len(teams) - len(batches)
+
+            # Tasks of their own, so a caller cancelled by its deadline still resolves
+            # the futures other aggregations are waiting on
+            fetches = [
+                asyncio.ensure_future(self._fetch_batch(api_name, batch, window, fetch, text_of, futures))
+                for batch in batches
+            ]
+            await asyncio.shield(asyncio.gather(*fetches))
+        else:
+            self.stats['requests_saved'] += len(teams)
+
+        for team, future in waiting.items():
+            # Shield so one cancelled caller doesn't cancel the shared fetch
+            results[team] = await asyncio.shield(future)
+
+        return results
+
+    async def _fetch_batch(self, api_name: str, batch: List[str], window: DateWindow, fetch: BatchFetcher,
+                           text_of: Callable[[Dict[str, Any]], str], futures: Dict[str, asyncio.Future]):
+        try:
+            items = await fetch(batch)
+        except Exception as e:
+            logger.error(f"{api_name} search failed for {batch}: {e}")
+            items = None
+
+        if items is None:
+            self.stats['fetch_failures'] += 1
+        else:
+            self._evict_expired()
+
+        for team in batch:
+            key = (api_name, normalise_query(team), window)
+            self._inflight.pop(key, None)
+
+            if items is None:
+                # Not cached, so the next aggregation retries
+                team_items = []
+            elif len(batch) == 1:
+                team_items = items
+            else:
+                pattern = self._team_pattern(team)
+                team_items = [item for item in items if pattern.search(text_of(item).lower())]
+
+            if items is not None:
+                self._cache[key] = _CachedResults(team_items)
+            if not futures[team].done():
+                futures[team].set_result(team_items)
+
+    async def get_query_results(self, api_name: str, query: str, window: DateWindow,
+                                fetch: QueryFetcher) -> List[Dict[str, Any]]:
+        """Results of one whole query over ``window``, cached by its normalised text"""
+        key = (api_name, normalise_query(query), window)
+
+        cached = self._fresh(key)
+        if cached is not None:
+            self.stats['hits'] += 1
+            self.stats['requests_saved'] += 1
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats['coalesced'] += 1
+            self.stats['requests_saved'] += 1
+            return await asyncio.shield(inflight)
+
+        self.stats['misses'] += 1
+        self.stats['requests_planned'] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        fetching = asyncio.ensure_future(
+            self._fetch_batch(api_name, [query], window, lambda _: fetch(), lambda item: '', {query: future})
+        )
+        await asyncio.shield(fetching)
+        return future.result()
+
+    def _evict_expired(self):
+        """Drop cached results older than the TTL"""
+        for key in [key for key, cached in self._cache.items() if cached.age() >= self.ttl]:
+            del self._cache[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get query planner statistics"""
+        lookups = self.stats['hits'] + self.stats['misses'] + self.stats['coalesced']
+        return {
+            **self.stats,
+            'hit_rate': (self.stats['hits'] + self.stats['coalesced']) / lookups if lookups else 0.0,
+            'cached_queries': len(self._cache),
+        }
+
+
+# Process-wide instance so overlapping matches share cached API responses
+shared_api_query_planner = APIQueryPlanner()
@@ -0,0 +1,180 @@
+"""
+Article Content Cache - Disk-backed cache of extracted article bodies
+Keyed by canonical URL so re-aggregating a match skips pages it has already extracted
+"""
+
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+    logging.warning("diskcache not available. Article content will be cached in memory per process.")
+
+from ..config import CACHE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that never change which article a URL points at
+TRACKING_PARAMS = {'fbclid', 'gclid', 'ocid', 'cmpid', 'ref', 'ref_src', 'src', 'share', 'at_medium', 'at_campaign'}
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Rough bound on entries for the in-memory fallback, assuming ~4 KiB bodies
+FALLBACK_ENTRY_BYTES = 4096
+
+
+def canonical_url(url: str) -> str:
+    """Normalise a URL so trivially different links to one article share a key"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+class _MemoryLRU:
+    """Per-process stand-in for diskcache with the same get/set subset"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        item = self._entries.get(key)
+        if item is None:
+            return default
+
+        value, expires_at = item
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, expire: float = None) -> bool:
+        self._entries[key] = (value, time.monotonic() + expire)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def volume(self) -> int:
+        return sum(len(value) for value, _ in self._entries.values())
+
+    def close(self):
+        self._entries.clear()
+
+
+class ContentCache:
+    """
+    Extracted article text keyed by canonical URL, with expiry.
+
+    Backed by diskcache (SQLite) under the cache directory, so every worker
+    process and uvicorn worker on a host shares one cache safely. The store
+    is capped at ``size_limit`` bytes and evicts least-recently-used
+    entries. An empty string records a page that was fetched but had no
+    extractable text, so it is not fetched again before it expires.
+    """
+
+    def __init__(self, directory: str = None, ttl: float = None, size_limit: int = None):
+        self.directory = os.path.join(directory or CACHE_CONFIG['directory'], 'article_content')
+        self.ttl = ttl if ttl is not None else CACHE_CONFIG['contents_expire']
+        self.size_limit = size_limit if size_limit is not None else CACHE_CONFIG['contents_size_limit']
+        self._cache = None
+        self.backend = None
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'errors': 0,
+        }
+
+    def _get_cache(self):
+        # Opened lazily so each process gets its own SQLite connection
+        if self._cache is not None:
+            return self._cache
+
+        if DISKCACHE_AVAILABLE:
+            try:
+                self._cache = diskcache.Cache(
+                    self.directory,
+                    size_limit=self.size_limit,
+                    eviction_policy='least-recently-used',
+                )
+                self.backend = 'disk'
+                return self._cache
+            except Exception as e:
+                logger.warning(f"Article content cache unavailable on disk ({e}), caching in memory")
+
+        self._cache = _MemoryLRU(max(1, self.size_limit // FALLBACK_ENTRY_BYTES))
+        self.backend = 'memory'
+        return self._cache
+
+    def get(self, url: str) -> Optional[str]:
+        """Cached text for ``url``, or None if it has not been extracted recently"""
+        try:
+            text = self._get_cache().get(canonical_url(url))
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.warning(f"Article content cache read failed for {url}: {e}")
+            return None
+
+        self.stats['hits' if text is not None else 'misses'] += 1
+        return text
+
+    def set(self, url: str, text: str):
+        """Store extracted text for ``url``"""
+        try:
+            self._get_cache().set(canonical_url(url), text or '', expire=self.ttl)
+            self.stats['stores'] += 1
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.warning(f"Article content cache write failed for {url}: {e}")
+
+    def close(self):
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get content cache statistics"""
+        lookups = self.stats['hits'] + self.stats['misses']
+        stats = {
+            **self.stats,
+            'hit_rate': self.stats['hits'] / lookups if lookups else 0.0,
+            'backend': self.backend,
+        }
+        if self._cache is not None:
+            try:
+                stats['entries'] = len(self._cache)
+                stats['size_bytes'] = self._cache.volume()
+            except Exception:
+                pass
+        return stats
+
+
+# Process-wide instance; the disk store itself is shared across processes
+shared_content_cache = ContentCache()
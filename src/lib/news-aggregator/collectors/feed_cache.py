@@ -0,0 +1,138 @@
+"""
+Shared Feed Cache - Process-wide cache of parsed feed entries
+Lets concurrent match aggregations share a single download of each feed
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..config import CACHE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+FeedFetcher = Callable[[], Awaitable[Optional[List[Any]]]]
+
+
+class _CachedFeed:
+    """Parsed entries for one feed and the time they were fetched"""
+
+    def __init__(self, entries: List[Any]):
+        self.entries = entries
+        self.fetched_at = time.monotonic()
+
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+
+class FeedCache:
+    """
+    Caches parsed feed entries keyed by feed URL.
+
+    Entries stay fresh for ``ttl`` seconds, or for a per-feed TTL set by the
+    background scheduler to outlast its next refresh. Concurrent requests for
+    the same feed are coalesced so that only one download and parse is in
+    flight per URL; every other caller awaits the same result.
+    """
+
+    def __init__(self, ttl: float = None):
+        self.ttl = ttl if ttl is not None else CACHE_CONFIG['feeds_expire']
+        self._feeds: Dict[str, _CachedFeed] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._ttls: Dict[str, float] = {}
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'coalesced': 0,
+            'fetch_failures': 0,
+            'stale_served': 0,
+            'refreshes': 0,
+        }
+
+    async def get_entries(self, key: str, fetch: FeedFetcher) -> List[Any]:
+        """Return cached entries for ``key``, fetching them once if stale"""
+        cached = self._feeds.get(key)
+        if cached and cached.age() < self._ttls.get(key, self.ttl):
+            self.stats['hits'] += 1
+            return cached.entries
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            self.stats['misses'] += 1
+            inflight = asyncio.ensure_future(self._fetch(key, fetch))
+            self._inflight[key] = inflight
+        else:
+            self.stats['coalesced'] += 1
+
+        # Shield so one cancelled caller doesn't cancel the shared fetch
+        return await asyncio.shield(inflight)
+
+    async def refresh(self, key: str, fetch: FeedFetcher) -> List[Any]:
+        """Fetch ``key`` now, whether or not it is stale, sharing any fetch already in flight"""
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            self.stats['refreshes'] += 1
+            inflight = asyncio.ensure_future(self._fetch(key, fetch))
+            self._inflight[key] = inflight
+
+        return await asyncio.shield(inflight)
+
+    async def _fetch(self, key: str, fetch: FeedFetcher) -> List[Any]:
+        """Run the fetcher and store its result"""
+        try:
+            entries = await fetch()
+        except Exception as e:
+            logger.error(f"Feed fetch failed for {key}: {e}")
+            entries = None
+        finally:
+            self._inflight.pop(key, None)
+
+        if entries is None:
+            self.stats['fetch_failures'] += 1
+
+            # Fall back to the last good copy rather than dropping the feed
+            stale = self._feeds.get(key)
+            if stale:
+                self.stats['stale_served'] += 1
+                return stale.entries
+            return []
+
+        self._feeds[key] = _CachedFeed(entries)
+        return entries
+
+    def set_ttl(self, key: str, ttl: Optional[float]):
+        """Override how long ``key`` stays fresh; None restores the default TTL"""
+        if ttl is None:
+            self._ttls.pop(key, None)
+        else:
+            self._ttls[key] = ttl
+
+    def age(self, key: str) -> Optional[float]:
+        """Seconds since ``key`` was last fetched successfully, or None if never"""
+        cached = self._feeds.get(key)
+        return cached.age() if cached else None
+
+    def invalidate(self, key: str = None):
+        """Drop one feed, or every feed when no key is given"""
+        if key is None:
+            self._feeds.clear()
+        else:
+            self._feeds.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.stats['hits'] + self.stats['misses'] + self.stats['coalesced']
+        return {
+            **self.stats,
+            'cached_feeds': len(self._feeds),
+            'inflight_fetches': len(self._inflight),
+            'hit_rate': (self.stats['hits'] + self.stats['coalesced']) / lookups if lookups else 0.0,
+            'ttl_seconds': self.ttl,
+            'scheduled_ttls': len(self._ttls),
+        }
+
+
+# Process-wide instance shared by every collector
+shared_feed_cache = FeedCache()
@@ -0,0 +1,132 @@
+"""
+Feed Parser - Streaming RSS/Atom parsing with a feedparser fallback
+Pulls only the entry fields collectors read; meant to run on the worker pool
+"""
+
+import io
+import logging
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, List, Tuple, Union
+
+try:
+    import feedparser
+    FEEDPARSER_AVAILABLE = True
+except ImportError:
+    FEEDPARSER_AVAILABLE = False
+    logging.warning("feedparser not available. Malformed feeds will be skipped.")
+
+logger = logging.getLogger(__name__)
+
+# Entry fields the collectors actually read
+FEED_ENTRY_FIELDS = ['title', 'summary', 'link', 'published', 'author', 'category']
+
+# Root elements of the formats the fast path understands (RSS 0.9x/2.0, RSS 1.0, Atom)
+FEED_ROOTS = {'rss', 'RDF', 'feed'}
+ITEM_TAGS = {'item', 'entry'}
+
+
+def simplify_entry(entry: Any) -> Dict[str, str]:
+    """Reduce a feedparser entry to a plain, JSON-serialisable dict"""
+    return {field: entry.get(field, '') or '' for field in FEED_ENTRY_FIELDS}
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _text(element: ET.Element) -> str:
+    return ''.join(element.itertext()).strip()
+
+
+def _entry_from_element(element: ET.Element) -> Dict[str, str]:
+    """Extract entry fields from an RSS <item> or Atom <entry>"""
+    entry = dict.fromkeys(FEED_ENTRY_FIELDS, '')
+    content = ''
+    updated = ''
+    guid = ''
+
+    for child in element:
+        name = _local_name(child.tag)
+
+        if name == 'title' and not entry['title']:
+            entry['title'] = _text(child)
+
+        elif name == 'link':
+            href = child.get('href')
+            if href is None:
+                entry['link'] = entry['link'] or _text(child)
+            elif child.get('rel', 'alternate') == 'alternate' and not entry['link']:
+                entry['link'] = href.strip()
+
+        elif name in ('description', 'summary') and not entry['summary']:
+            entry['summary'] = _text(child)
+
+        elif name in ('encoded', 'content') and not content:
+            content = _text(child)
+
+        elif name in ('pubDate', 'published', 'date', 'issued') and not entry['published']:
+            entry['published'] = _text(child)
+
+        elif name in ('updated', 'modified') and not updated:
+            updated = _text(child)
+
+        elif name in ('author', 'creator') and not entry['author']:
+            # Atom nests the author's name; RSS puts it in the element text
+            author_name = child.find('{*}name')
+            entry['author'] = _text(author_name) if author_name is not None else _text(child)
+
+        elif name in ('category', 'subject') and not entry['category']:
+            entry['category'] = (child.get('term') or _text(child)).strip()
+
+        elif name == 'guid' and child.get('isPermaLink', 'true') != 'false':
+            guid = _text(child)
+
+    entry['summary'] = entry['summary'] or content
+    entry['published'] = entry['published'] or updated
+    entry['link'] = entry['link'] or guid
+    return entry
+
+
+def parse_feed_fast(content: Union[bytes, str]) -> List[Dict[str, str]]:
+    """
+    Stream-parse a well-formed RSS/Atom document.
+
+    Raises ``ET.ParseError`` for malformed XML and ``ValueError`` for
+    documents that are not a recognised feed format.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+
+    entries = []
+    root_checked = False
+
+    for event, element in ET.iterparse(io.BytesIO(content), events=('start', 'end')):
+        if event == 'start':
+            if not root_checked:
+                if _local_name(element.tag) not in FEED_ROOTS:
+                    raise ValueError(f"Unrecognised feed root <{_local_name(element.tag)}>")
+                root_checked = True
+            continue
+
+        if _local_name(element.tag) in ITEM_TAGS:
+            entries.append(_entry_from_element(element))
+            # Drop the parsed subtree so memory stays flat on large feeds
+            element.clear()
+
+    return entries
+
+
+def parse_feed_fallback(content: Union[bytes, str]) -> List[Dict[str, str]]:
+    """Parse with feedparser, which tolerates malformed and exotic feeds"""
+    if not FEEDPARSER_AVAILABLE:
+        return []
+    return [simplify_entry(entry) for entry in feedparser.parse(content).entries]
+
+
+def parse_feed(content: Union[bytes, str]) -> Tuple[List[Dict[str, str]], str]:
+    """Parse a feed, returning its entries and which parser produced them"""
+    try:
+        return parse_feed_fast(content), 'fast'
+    except (ET.ParseError, ValueError) as e:
+        logger.debug(f"Fast feed parse failed ({e}), falling back to feedparser")
+        return parse_feed_fallback(content), 'feedparser'
@@ -0,0 +1,278 @@
+"""
+Feed Scheduler - Background feed refreshes at each feed's own pace
+Learns how often every feed publishes and keeps the shared feed cache fresh ahead of aggregations
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..config import FEED_SCHEDULER_CONFIG
+from .feed_cache import FeedCache, FeedFetcher, shared_feed_cache
+from .timestamps import TimestampParser, as_utc, shared_timestamp_parser
+
+logger = logging.getLogger(__name__)
+
+FixtureFeeds = Callable[[str, str], Iterable[str]]
+
+
+class _ScheduledFeed:
+    """A feed the scheduler refreshes, with what it has learned about it"""
+
+    def __init__(self, key: str, fetch: FeedFetcher, label: str):
+        self.key = key
+        self.fetch = fetch
+        self.label = label
+        self.publish_interval: Optional[float] = None
+        self.refreshed_at: Optional[float] = None
+        self.refreshes = 0
+        self.failures = 0
+
+
+class _Fixture:
+    def __init__(self, home_team: str, away_team: str, kickoff: datetime):
+        self.home_team = home_team
+        self.away_team = away_team
+        self.kickoff = kickoff
+
+
+class FeedScheduler:
+    """
+    Refreshes registered feeds in the background on per-feed schedules.
+
+    Each refresh learns a feed's publish interval as the median gap between
+    its newest entries, and the feed is polled again after a fraction of
+    that interval, clamped between the configured bounds. Feeds relevant to
+    a fixture near kickoff drop to the fast kickoff cadence. Every refresh
+    sets the feed's cache TTL just past its next scheduled refresh, so
+    aggregations are served from the cache rather than fetching on demand.
+    """
+
+    def __init__(self, feed_cache: FeedCache = None, config: Dict[str, Any] = None,
+                 timestamp_parser: TimestampParser = None):
+        self.feed_cache = feed_cache or shared_feed_cache
+        self.timestamps = timestamp_parser or shared_timestamp_parser
+        self.config = config or FEED_SCHEDULER_CONFIG
+        self.storage = None
+
+        self._feeds: Dict[str, _ScheduledFeed] = {}
+        self._fixtures: Dict[str, _Fixture] = {}
+        self._fixture_feeds: Optional[FixtureFeeds] = None
+        self._fixtures_loaded_at = 0.0
+
+        self._task: Optional[asyncio.Task] = None
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+        self.stats = {
+            'refreshes': 0,
+            'refresh_failures': 0,
+            'kickoff_refreshes': 0,
+        }
+
+    def register_feed(self, key: str, fetch: FeedFetcher, label: str = None):
+        """Refresh ``key`` in the background using ``fetch``"""
+        if key not in self._feeds:
+            self._feeds[key] = _ScheduledFeed(key, fetch, label or key)
+        else:
+            self._feeds[key].fetch = fetch
+
+    def set_fixture_feeds(self, fixture_feeds: FixtureFeeds):
+        """Tell the scheduler which feed keys matter for a (home team, away team) fixture"""
+        self._fixture_feeds = fixture_feeds
+
+    def register_fixture(self, match_id: str, home_team: str, away_team: str, kickoff: datetime):
+        """Poll the fixture's feeds at the kickoff cadence while it is near kickoff"""
+        self._fixtures[match_id] = _Fixture(home_team, away_team, as_utc(kickoff))
+        if self._wakeup:
+            self._wakeup.set()
+
+    def start(self, storage=None):
+        """Start the background refresh loop; ``storage`` supplies upcoming fixtures"""
+        if self._task and not self._task.done():
+            return
+
+        self.storage = storage
+        self._semaphore = asyncio.Semaphore(self.config['max_concurrent_refreshes'])
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Feed scheduler started for {len(self._feeds)} feeds")
+
+    async def stop(self):
+        """Stop refreshing and hand the feeds back to the cache's default TTL"""
+        tasks = [task for task in [self._task, *self._refreshing.values()] if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._task = None
+        self._refreshing.clear()
+        for key in self._feeds:
+            self.feed_cache.set_ttl(key, None)
+
+    async def _run(self):
+        while True:
+            try:
+                await self._load_fixtures()
+
+                now = time.monotonic()
+                kickoff_feeds = self._kickoff_feeds()
+                next_due = now + self.config['max_interval']
+
+                for feed in self._feeds.values():
+                    if feed.key in self._refreshing:
+                        continue
+
+                    interval = self._poll_interval(feed, feed.key in kickoff_feeds)
+                    due_at = feed.refreshed_at + interval if feed.refreshed_at is not None else now
+                    if due_at <= now:
+                        self._refreshing[feed.key] = asyncio.create_task(
+                            self._refresh(feed, feed.key in kickoff_feeds)
+                        )
+                    else:
+                        next_due = min(next_due, due_at)
+
+                # Wake for the next due feed, a finished refresh or a new fixture
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=max(1.0, next_due - time.monotonic()))
+                except asyncio.TimeoutError:
+                    pass
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Feed scheduler loop failed: {e}")
+                await asyncio.sleep(30)
+
+    async def _refresh(self, feed: _ScheduledFeed, near_kickoff: bool):
+        try:
+            async with self._semaphore:
+                started = time.monotonic()
+                entries = await self.feed_cache.refresh(feed.key, feed.fetch)
+
+            feed.refreshed_at = time.monotonic()
+            feed.refreshes += 1
+            self.stats['refreshes'] += 1
+            if near_kickoff:
+                self.stats['kickoff_refreshes'] += 1
+
+            # The cache keeps the last good copy when a fetch fails
+            age = self.feed_cache.age(feed.key)
+            if age is None or age > time.monotonic() - started:
+                feed.failures += 1
+                self.stats['refresh_failures'] += 1
+            else:
+                self._learn_interval(feed, entries)
+
+            interval = self._poll_interval(feed, near_kickoff)
+            self.feed_cache.set_ttl(feed.key, interval + self.config['cache_grace'])
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            feed.failures += 1
+            self.stats['refresh_failures'] += 1
+            logger.error(f"Scheduled refresh of {feed.label} failed: {e}")
+        finally:
+            self._refreshing.pop(feed.key, None)
+            if self._wakeup:
+                self._wakeup.set()
+
+    def _learn_interval(self, feed: _ScheduledFeed, entries: List[Any]):
+        """Median gap between the feed's newest entries"""
+        timestamps = sorted(
+            (ts for ts in (self.timestamps.parse(entry.get('published'), feed.key) for entry in entries) if ts is not None),
+            reverse=True
+        )[:self.config['history_entries']]
+
+        # Entries published together say nothing about the pace
+        gaps = [
+            (newer - older).total_seconds()
+            for newer, older in zip(timestamps, timestamps[1:])
+            if newer > older
+        ]
+        if not gaps:
+            return
+
+        interval = statistics.median(gaps)
+        if feed.publish_interval is None or abs(interval - feed.publish_interval) > feed.publish_interval * 0.25:
+            logger.debug(f"{feed.label} publishes about every {interval / 60:.0f} minutes")
+        feed.publish_interval = interval
+
+    def _poll_interval(self, feed: _ScheduledFeed, near_kickoff: bool) -> float:
+        if feed.publish_interval is None:
+            interval = self.config['default_interval']
+        else:
+            interval = feed.publish_interval * self.config['interval_fraction']
+
+        interval = min(max(interval, self.config['min_interval']), self.config['max_interval'])
+        if near_kickoff:
+            interval = min(interval, self.config['kickoff_interval'])
+        return interval
+
+    def _kickoff_feeds(self) -> set:
+        """Keys of feeds relevant to a fixture inside its kickoff window"""
+        now = datetime.utcnow()
+        before = timedelta(seconds=self.config['kickoff_before'])
+        after = timedelta(seconds=self.config['kickoff_after'])
+
+        keys = set()
+        for match_id, fixture in list(self._fixtures.items()):
+            if fixture.kickoff + after < now:
+                del self._fixtures[match_id]
+                continue
+            if fixture.kickoff - before > now:
+                continue
+
+            if self._fixture_feeds is None:
+                return set(self._feeds)
+            keys.update(self._fixture_feeds(fixture.home_team, fixture.away_team))
+
+        return keys
+
+    async def _load_fixtures(self):
+        """Pick up fixtures nearing kickoff from storage every few minutes, scheduled or already aggregated"""
+        if self.storage is None:
+            return
+        if time.monotonic() - self._fixtures_loaded_at < self.config['fixtures_refresh_seconds']:
+            return
+
+        self._fixtures_loaded_at = time.monotonic()
+        now = datetime.utcnow()
+        # Scheduled fixtures too, and ones still inside their post-match window
+        since = now - timedelta(seconds=self.config['kickoff_after'])
+        until = now + timedelta(seconds=self.config['kickoff_before'] + self.config['fixtures_refresh_seconds'])
+        matches = await self.storage.get_upcoming_matches(since, until, self.config['fixture_priorities'])
+
+        for match in matches:
+            if match.get('home_team') and match.get('away_team') and match.get('match_date'):
+                self.register_fixture(match['match_id'], match['home_team'], match['away_team'], match['match_date'])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics"""
+        kickoff_feeds = self._kickoff_feeds()
+        return {
+            **self.stats,
+            'running': self._task is not None and not self._task.done(),
+            'scheduled_feeds': len(self._feeds),
+            'upcoming_fixtures': len(self._fixtures),
+            'kickoff_feeds': len(kickoff_feeds & set(self._feeds)),
+            'feeds': {
+                feed.label: {
+                    'publish_interval_seconds': feed.publish_interval,
+                    'poll_interval_seconds': self._poll_interval(feed, feed.key in kickoff_feeds),
+                    'refreshes': feed.refreshes,
+                    'failures': feed.failures,
+                }
+                for feed in self._feeds.values()
+            },
+        }
+
+
+# Process-wide instance refreshing the shared feed cache
+shared_feed_scheduler = FeedScheduler()
@@ -0,0 +1,145 @@
+"""
+Feed State Store - Conditional GET support for feed fetches
+Persists ETag/Last-Modified validators and the last parsed entries per feed URL
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from ..config import CACHE_CONFIG
+from .feed_parser import parse_feed
+from .worker_pool import run_in_worker
+
+logger = logging.getLogger(__name__)
+
+
+class FeedStateStore:
+    """
+    Stores per-URL validators and parsed entries under the cache directory.
+
+    Requests carry If-None-Match/If-Modified-Since when validators are known,
+    so a 304 response reuses the stored entries without parsing anything.
+    Changed feeds are parsed on the shared worker pool, off the event loop.
+    """
+
+    def __init__(self, directory: str = None):
+        self.directory = os.path.join(directory or CACHE_CONFIG['directory'], 'feed_state')
+        self._states: Dict[str, Dict[str, Any]] = {}
+
+        self.stats = {
+            'requests': 0,
+            'not_modified': 0,
+            'modified': 0,
+            'errors': 0,
+            'fast_parses': 0,
+            'fallback_parses': 0,
+            'parse_seconds': 0.0,
+        }
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Feed state directory unavailable ({e}), validators kept in memory only")
+
+    async def fetch_entries(self, session: Any, url: str, label: str = None) -> Optional[List[Dict[str, str]]]:
+        """Conditionally fetch and parse a feed, returning None on failure"""
+        label = label or url
+        state = self.get(url)
+
+        headers = {}
+        if state:
+            if state.get('etag'):
+                headers['If-None-Match'] = state['etag']
+            if state.get('last_modified'):
+                headers['If-Modified-Since'] = state['last_modified']
+
+        async with session.get(url, headers=headers) as response:
+            self.stats['requests'] += 1
+
+            if response.status == 304 and state is not None:
+                self.stats['not_modified'] += 1
+                logger.debug(f"{label} not modified, reusing {len(state['entries'])} cached entries")
+                return state['entries']
+
+            if response.status != 200:
+                self.stats['errors'] += 1
+                logger.warning(f"Failed to fetch {label}: HTTP {response.status}")
+                return None
+
+            content = await response.read()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+
+        self.stats['modified'] += 1
+
+        started = time.monotonic()
+        entries, parser = await run_in_worker(parse_feed, content)
+        self.stats['parse_seconds'] += time.monotonic() - started
+        self.stats['fast_parses' if parser == 'fast' else 'fallback_parses'] += 1
+
+        if not entries:
+            logger.warning(f"No entries found in {label}")
+
+        self.update(url, etag, last_modified, entries)
+        return entries
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get stored state for a URL, loading it from disk if needed"""
+        if url in self._states:
+            return self._states[url]
+
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self._states[url] = state
+            return state
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable feed state for {url}: {e}")
+            return None
+
+    def update(self, url: str, etag: Optional[str], last_modified: Optional[str], entries: List[Dict[str, str]]):
+        """Store validators and entries for a URL"""
+        state = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'entries': entries,
+            'updated_at': datetime.utcnow().isoformat(),
+        }
+        self._states[url] = state
+
+        # Without validators a 304 is impossible, so there is nothing worth persisting
+        if not etag and not last_modified:
+            return
+
+        path = self._path(url)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to persist feed state for {url}: {e}")
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, f"{hashlib.md5(url.encode('utf-8')).hexdigest()}.json")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get conditional GET statistics"""
+        requests = self.stats['requests']
+        return {
+            **self.stats,
+            'not_modified_ratio': self.stats['not_modified'] / requests if requests else 0.0,
+            'tracked_feeds': len(self._states),
+        }
+
+
+# Process-wide instance shared by every feed collector
+shared_feed_state = FeedStateStore()
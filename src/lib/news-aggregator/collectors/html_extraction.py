@@ -0,0 +1,197 @@
+"""
+HTML Extraction - Listing and article parsing for the scraper
+Module-level, picklable functions meant to run on the worker pool; they return plain records
+"""
+
+import logging
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    logging.warning("selectolax not available. HTML parsing will use BeautifulSoup.")
+
+try:
+    import lxml  # noqa: F401
+    BS4_PARSER = 'lxml'
+except ImportError:
+    BS4_PARSER = 'html.parser'
+
+from bs4 import BeautifulSoup
+
+try:
+    from newspaper import Article
+    NEWSPAPER_AVAILABLE = True
+except ImportError:
+    NEWSPAPER_AVAILABLE = False
+    logging.warning("Newspaper3k not available. Article extraction will be limited.")
+
+logger = logging.getLogger(__name__)
+
+PARSER_BACKEND = 'selectolax' if SELECTOLAX_AVAILABLE else f"bs4/{BS4_PARSER}"
+
+# Paragraphs searched, in order, when newspaper3k is not installed
+ARTICLE_BODY_SELECTORS = ['article p', '[class*="article"] p', '[class*="content"] p', 'main p', 'p']
+
+
+class _SelectolaxBackend:
+    @staticmethod
+    def parse(html: str):
+        return LexborHTMLParser(html)
+
+    @staticmethod
+    def select(node, selector: str) -> list:
+        return node.css(selector)
+
+    @staticmethod
+    def select_one(node, selector: str):
+        return node.css_first(selector)
+
+    @staticmethod
+    def text(node, separator: str = '') -> str:
+        return node.text(separator=separator, strip=True)
+
+    @staticmethod
+    def attr(node, name: str) -> Optional[str]:
+        return node.attributes.get(name)
+
+
+class _SoupBackend:
+    @staticmethod
+    def parse(html: str):
+        return BeautifulSoup(html, BS4_PARSER)
+
+    @staticmethod
+    def select(node, selector: str) -> list:
+        return node.select(selector)
+
+    @staticmethod
+    def select_one(node, selector: str):
+        return node.select_one(selector)
+
+    @staticmethod
+    def text(node, separator: str = '') -> str:
+        return node.get_text(separator, strip=True)
+
+    @staticmethod
+    def attr(node, name: str) -> Optional[str]:
+        return node.get(name)
+
+
+_backend = _SelectolaxBackend if SELECTOLAX_AVAILABLE else _SoupBackend
+
+
+def _first_match(backend, node, selectors: List[str]) -> Tuple[Optional[str], Any]:
+    """First selector matching inside ``node``, with its element"""
+    for selector in selectors:
+        match = backend.select_one(node, selector)
+        if match is not None:
+            return selector, match
+    return None, None
+
+
+def _date_text(date_elem, backend) -> str:
+    """Raw date of a listing item: the date element's datetime attribute, else its text"""
+    return backend.attr(date_elem, 'datetime') or backend.text(date_elem)
+
+
+def _most_common(counter: Counter) -> Optional[str]:
+    return counter.most_common(1)[0][0] if counter else None
+
+
+def extract_listing_items(html: str, page_url: str, item_selectors: List[str], title_selectors: List[str],
+                          summary_selectors: List[str], date_selectors: List[str],
+                          limit: int) -> Dict[str, Any]:
+    """
+    Pull candidate articles out of a news listing page.
+
+    The first item selector that matches anything wins and at most
+    ``limit`` items are read. Each item becomes a plain dict with title,
+    absolute link, summary and the raw date text; scoring and date parsing
+    are left to the caller. ``selectors`` reports which selector won most
+    often for each role, for learning a site profile.
+    """
+    started = time.perf_counter()
+    backend = _backend
+    tree = backend.parse(html)
+
+    nodes = []
+    item_selector = None
+    for item_selector in item_selectors:
+        nodes = backend.select(tree, item_selector)
+        if nodes:
+            break
+
+    items = []
+    winners = {'title': Counter(), 'summary': Counter(), 'date': Counter()}
+    for node in nodes[:limit]:
+        title_selector, title_elem = _first_match(backend, node, title_selectors)
+        if title_elem is None:
+            continue
+
+        link_elem = backend.select_one(node, 'a')
+        if link_elem is None:
+            continue
+
+        link = backend.attr(link_elem, 'href') or ''
+        summary_selector, summary_elem = _first_match(backend, node, summary_selectors)
+        date_selector, date_elem = _first_match(backend, node, date_selectors)
+
+        winners['title'][title_selector] += 1
+        if summary_selector:
+            winners['summary'][summary_selector] += 1
+        if date_selector:
+            winners['date'][date_selector] += 1
+
+        items.append({
+            'title': backend.text(title_elem),
+            'link': urljoin(page_url, link) if link else '',
+            'summary': backend.text(summary_elem) if summary_elem is not None else '',
+            'date_text': _date_text(date_elem, backend) if date_elem is not None else '',
+        })
+
+    return {
+        'items': items,
+        'selectors': {
+            'item': item_selector if items else None,
+            'title': _most_common(winners['title']),
+            'summary': _most_common(winners['summary']),
+            'date': _most_common(winners['date']),
+        },
+        'parser': PARSER_BACKEND,
+        'parse_seconds': time.perf_counter() - started,
+    }
+
+
+def extract_article_text(html: str, article_url: str, max_length: int = 2000) -> Dict[str, Any]:
+    """Main text of an article page, via newspaper3k when installed"""
+    started = time.perf_counter()
+    text = ''
+
+    if NEWSPAPER_AVAILABLE:
+        article = Article(article_url)
+        article.set_html(html)
+        article.parse()
+        text = article.text or ''
+        parser = 'newspaper'
+    else:
+        backend = _backend
+        tree = backend.parse(html)
+        for selector in ARTICLE_BODY_SELECTORS:
+            paragraphs = [backend.text(node, ' ') for node in backend.select(tree, selector)]
+            paragraphs = [paragraph for paragraph in paragraphs if paragraph]
+            if paragraphs:
+                text = '\n\n'.join(paragraphs)
+                break
+        parser = PARSER_BACKEND
+
+    return {
+        'text': text[:max_length],
+        'parser': parser,
+        'parse_seconds': time.perf_counter() - started,
+    }
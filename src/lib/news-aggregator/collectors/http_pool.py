@@ -0,0 +1,134 @@
+"""
+Shared HTTP Client Pool
+One application-lifetime aiohttp session reused by every collector
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from ..config import HTTP_POOL_CONFIG, DEFAULT_HEADERS
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPClientPool:
+    """
+    Owns a single ClientSession and TCPConnector for the whole application.
+
+    Connections are kept alive and reused across aggregations, DNS lookups
+    are cached, and each host is capped at a fixed number of connections.
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        self.config = {**HTTP_POOL_CONFIG, **(config or {})}
+        self.connector: Optional[aiohttp.TCPConnector] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.started_at = None
+
+        self.stats = {
+            'requests': 0,
+            'connections_created': 0,
+            'connections_reused': 0,
+            'dns_cache_hits': 0,
+            'dns_cache_misses': 0,
+        }
+
+    async def start(self):
+        """Create the connector and session"""
+        if self._session and not self._session.closed:
+            return
+
+        self.connector = aiohttp.TCPConnector(
+            limit=self.config['total_connections'],
+            limit_per_host=self.config['connections_per_host'],
+            use_dns_cache=True,
+            ttl_dns_cache=self.config['dns_cache_ttl'],
+            keepalive_timeout=self.config['keepalive_timeout'],
+        )
+
+        self._session = aiohttp.ClientSession(
+            connector=self.connector,
+            timeout=aiohttp.ClientTimeout(total=self.config['request_timeout']),
+            headers=DEFAULT_HEADERS.copy(),
+            trace_configs=[self._build_trace_config()],
+        )
+        self.started_at = datetime.utcnow()
+
+        logger.info(
+            f"HTTP client pool started ({self.config['total_connections']} connections, "
+            f"{self.config['connections_per_host']} per host)"
+        )
+
+    async def close(self):
+        """Close the session and every pooled connection"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+            logger.info("HTTP client pool closed")
+        self._session = None
+        self.connector = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            raise RuntimeError("HTTP client pool is not started")
+        return self._session
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        """Count connection and DNS cache events"""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            self.stats['requests'] += 1
+
+        async def on_connection_create_end(session, context, params):
+            self.stats['connections_created'] += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            self.stats['connections_reused'] += 1
+
+        async def on_dns_cache_hit(session, context, params):
+            self.stats['dns_cache_hits'] += 1
+
+        async def on_dns_cache_miss(session, context, params):
+            self.stats['dns_cache_misses'] += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+
+        return trace_config
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool-level connection statistics"""
+        in_use = 0
+        idle = 0
+        idle_by_host = {}
+
+        # aiohttp doesn't expose pool occupancy publicly, so read it defensively
+        if self.connector is not None:
+            in_use = len(getattr(self.connector, '_acquired', ()))
+            for key, conns in getattr(self.connector, '_conns', {}).items():
+                idle += len(conns)
+                host = getattr(key, 'host', str(key))
+                idle_by_host[host] = idle_by_host.get(host, 0) + len(conns)
+
+        acquired = self.stats['connections_created'] + self.stats['connections_reused']
+
+        return {
+            **self.stats,
+            'open_connections': in_use + idle,
+            'in_use_connections': in_use,
+            'idle_connections': idle,
+            'idle_by_host': idle_by_host,
+            'reuse_ratio': self.stats['connections_reused'] / acquired if acquired else 0.0,
+            'limits': {
+                'total': self.config['total_connections'],
+                'per_host': self.config['connections_per_host'],
+            },
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+        }
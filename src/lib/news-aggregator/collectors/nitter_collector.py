@@ -5,33 +5,54 @@ Collects Twitter content without using the Twitter API by leveraging Nitter inst
 
 import asyncio
 import aiohttp
-import feedparser
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 import hashlib
 import re
+import time
 from urllib.parse import urljoin
 
-from ..config import NITTER_INSTANCES, TWITTER_ACCOUNTS, RATE_LIMITS, DEFAULT_HEADERS
+from ..config import NITTER_INSTANCES, NITTER_CONFIG, TWITTER_ACCOUNTS, RATE_LIMITS, DEFAULT_HEADERS
+from .feed_cache import FeedCache, shared_feed_cache
+from .feed_state import FeedStateStore, shared_feed_state
+from .http_pool import HTTPClientPool
+from .nitter_instance_pool import NitterInstancePool, shared_nitter_instance_pool
+from .rate_limiter import HostRateLimiter, shared_rate_limiter
+from .registry import ArticleSink, gather_into
+from .timestamps import TimestampParser, as_utc, shared_timestamp_parser
+from .relevance_router import RelevanceRouter, shared_relevance_router
 
 logger = logging.getLogger(__name__)
 
 class NitterCollector:
-    def __init__(self):
+    def __init__(self, feed_cache: FeedCache = None, feed_state: FeedStateStore = None,
+                 http_pool: HTTPClientPool = None, rate_limiter: HostRateLimiter = None,
+                 relevance_router: RelevanceRouter = None, instance_pool: NitterInstancePool = None,
+                 timestamp_parser: TimestampParser = None):
         self.nitter_instances = NITTER_INSTANCES
         self.twitter_accounts = TWITTER_ACCOUNTS
         self.headers = DEFAULT_HEADERS.copy()
-        self.current_instance = 0
+        self.config = NITTER_CONFIG
         self.session = None
+        self.http_pool = http_pool
+        self.feed_cache = feed_cache or shared_feed_cache
+        self.feed_state = feed_state or shared_feed_state
         
-        # Track instance health
-        self.instance_health = {instance: True for instance in self.nitter_instances}
+        # Latency and error tracking per instance, shared across collectors
+        self.instance_pool = instance_pool or shared_nitter_instance_pool
         
         # Rate limiting
-        self.rate_limiter = asyncio.Semaphore(RATE_LIMITS['web_scraping']['concurrent_requests'])
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        self.relevance_router = relevance_router or shared_relevance_router
+        self.timestamps = timestamp_parser or shared_timestamp_parser
         
     async def __aenter__(self):
+        if self.http_pool:
+            # Borrow the application-wide session; the pool owns its lifetime
+            self.session = self.http_pool.session
+            return self
+        
         timeout = aiohttp.ClientTimeout(total=30)
         self.session = aiohttp.ClientSession(
             timeout=timeout,
@@ -41,38 +62,35 @@ class NitterCollector:
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and not self.http_pool:
             await self.session.close()
     
-    async def collect_for_match(self, home_team: str, away_team: str, match_date: datetime) -> List[Dict[str, Any]]:
-        """Collect Twitter content via Nitter RSS for a specific match"""
+    async def collect_for_match(self, home_team: str, away_team: str, match_date: datetime,
+                               match_id: str = None, sink: ArticleSink = None) -> List[Dict[str, Any]]:
+        """Collect Twitter content via Nitter RSS for a specific match; each account's tweets go to ``sink``"""
         queries = self._build_queries(home_team, away_team, match_date)
+        queries['match_id'] = self.relevance_router.register_match(match_id, home_team, away_team)
         
-        # Get relevant Twitter accounts
-        relevant_accounts = self._get_relevant_accounts(home_team, away_team)
-        
-        # Collect from all accounts
-        tasks = []
-        for account in relevant_accounts:
-            task = self._collect_from_account(account, queries)
-            tasks.append(task)
-        
-        # Execute all tasks concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Merge results
-        all_tweets = []
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Nitter collection error: {result}")
-                continue
-            all_tweets.extend(result)
-        
-        # Sort by relevance and recency
-        all_tweets.sort(key=lambda x: (x['relevance_score'], x['published_at']), reverse=True)
-        
-        logger.info(f"Collected {len(all_tweets)} tweets from {len(relevant_accounts)} accounts")
-        return all_tweets
+        try:
+            # Get relevant Twitter accounts
+            relevant_accounts = self._get_relevant_accounts(home_team, away_team)
+            
+            # Collect from all accounts
+            tasks = []
+            for account in relevant_accounts:
+                task = self._collect_from_account(account, queries)
+                tasks.append(task)
+            
+            # Execute all tasks concurrently
+            all_tweets = await gather_into(tasks, sink, 'Nitter')
+            
+            # Sort by relevance and recency
+            all_tweets.sort(key=lambda x: (x['relevance_score'], x['published_at']), reverse=True)
+            
+            logger.info(f"Collected {len(all_tweets)} tweets from {len(relevant_accounts)} accounts")
+            return all_tweets
+        finally:
+            self.relevance_router.unregister_match(queries['match_id'])
     
     def _build_queries(self, home_team: str, away_team: str, match_date: datetime) -> Dict[str, Any]:
         """Build search queries for Twitter content"""
@@ -150,86 +168,119 @@ class NitterCollector:
         return team_accounts
     
     async def _collect_from_account(self, account: str, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Collect tweets from a single Twitter account via Nitter"""
-        async with self.rate_limiter:
-            try:
-                # Add delay to be respectful
-                await asyncio.sleep(1)
-                
-                # Get RSS feed from working Nitter instance
-                rss_url = await self._get_account_rss_url(account)
-                if not rss_url:
-                    logger.warning(f"No working Nitter instance for {account}")
-                    return []
-                
-                # Fetch RSS feed
-                async with self.session.get(rss_url) as response:
-                    if response.status != 200:
-                        logger.warning(f"Failed to fetch {account} RSS: HTTP {response.status}")
-                        return []
-                    
-                    content = await response.text()
-                
-                # Parse RSS feed
-                feed = feedparser.parse(content)
-                
-                if not feed.entries:
-                    logger.warning(f"No entries found for {account}")
-                    return []
+        """Filter cached tweets of a single Twitter account for the match"""
+        try:
+            entries = await self._get_account_entries(account)
+            
+            # One scan per feed refresh scores every tweet against every in-flight match
+            routes = self.relevance_router.route_entries(f"nitter:{account.lower()}", entries, 'nitter', fields=('title',))
+            
+            # Process tweets
+            tweets = []
+            for entry, scores in zip(entries, routes):
+                if queries['match_id'] not in scores:
+                    continue
+                tweet = self._process_tweet_entry(entry, account, queries, scores[queries['match_id']])
+                if tweet:
+                    tweets.append(tweet)
+            
+            logger.info(f"Collected {len(tweets)} relevant tweets from @{account}")
+            return tweets
+            
+        except Exception as e:
+            logger.error(f"Error collecting from @{account}: {e}")
+            return []
+    
+    async def _get_account_entries(self, account: str) -> List[Any]:
+        """Get parsed feed entries for an account from the shared feed cache"""
+        # Keyed by account rather than URL since the Nitter instance rotates
+        return await self.feed_cache.get_entries(
+            f"nitter:{account.lower()}", lambda: self._fetch_shared(account)
+        )
+    
+    async def _fetch_shared(self, account: str) -> Optional[List[Any]]:
+        """
+        Fetch for the feed cache, independent of any aggregation's session.
+        
+        Other aggregations may still be waiting on the fetch after this
+        collector's own session has closed.
+        """
+        if self.http_pool:
+            return await self._fetch_account_entries(account, self.http_pool.session)
+        
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(timeout=timeout, headers=self.headers) as session:
+            return await self._fetch_account_entries(account, session)
+    
+    async def _fetch_account_entries(self, account: str, session: aiohttp.ClientSession) -> Optional[List[Any]]:
+        """Download and parse an account's RSS feed, returning None on failure"""
+        instance = self.instance_pool.choose()
+        if not instance:
+            logger.warning(f"No working Nitter instance for {account}")
+            return None
+        
+        tried = [instance]
+        pending = {asyncio.ensure_future(self._fetch_from_instance(instance, account, session))}
+        
+        try:
+            while pending:
+                # Hedge: if the latest instance is slower than its p90, race another one
+                can_add = len(tried) < self.config['max_attempts']
+                timeout = self.instance_pool.hedge_delay(tried[-1]) if can_add and self.config['hedge_requests'] else None
                 
-                # Process tweets
-                tweets = []
-                for entry in feed.entries:
-                    tweet = self._process_tweet_entry(entry, account, queries)
-                    if tweet:
-                        tweets.append(tweet)
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
                 
-                logger.info(f"Collected {len(tweets)} relevant tweets from @{account}")
-                return tweets
+                for task in done:
+                    entries = task.result()
+                    if entries is not None:
+                        return entries
                 
-            except Exception as e:
-                logger.error(f"Error collecting from @{account}: {e}")
-                return []
-    
-    async def _get_account_rss_url(self, account: str) -> Optional[str]:
-        """Get RSS URL for account from a working Nitter instance"""
-        for attempt in range(len(self.nitter_instances)):
-            instance = self._get_next_instance()
+                # Either a request failed or the hedge delay passed
+                if can_add:
+                    next_instance = self.instance_pool.choose(exclude=tried)
+                    if next_instance:
+                        if not done:
+                            logger.debug(f"Hedging @{account} on {next_instance} after slow {tried[-1]}")
+                        tried.append(next_instance)
+                        pending.add(asyncio.ensure_future(self._fetch_from_instance(next_instance, account, session)))
             
-            if not self.instance_health.get(instance, True):
-                continue
+            logger.warning(f"All tried Nitter instances failed for @{account}")
+            return None
             
-            rss_url = f"{instance}/{account}/rss"
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    async def _fetch_from_instance(self, instance: str, account: str,
+                                   session: aiohttp.ClientSession) -> Optional[List[Any]]:
+        """Fetch an account's feed from one instance and record the outcome"""
+        rss_url = f"{instance}/{account}/rss"
+        
+        try:
+            # Paced per instance host, shared with every other collector
+            await self.rate_limiter.acquire(rss_url, 'web_scraping', session=session)
             
-            try:
-                # Test the instance with a quick request
-                async with self.session.head(rss_url) as response:
-                    if response.status == 200:
-                        return rss_url
-                    else:
-                        # Mark instance as unhealthy if it returns error
-                        if response.status >= 500:
-                            self.instance_health[instance] = False
-                            logger.warning(f"Marking {instance} as unhealthy")
-                        
-            except Exception as e:
-                logger.warning(f"Instance {instance} failed for {account}: {e}")
-                self.instance_health[instance] = False
-                continue
+            started = time.monotonic()
+            # Conditional GET - a 304 reuses the stored entries
+            entries = await self.feed_state.fetch_entries(session, rss_url, f"@{account}")
+            
+        except asyncio.CancelledError:
+            self.instance_pool.release(instance)
+            raise
+        except Exception as e:
+            logger.warning(f"Instance {instance} failed for @{account}: {e}")
+            self.instance_pool.record_failure(instance)
+            return None
         
-        # If all instances failed, reset health status and try again
-        logger.warning("All Nitter instances failed, resetting health status")
-        self.instance_health = {instance: True for instance in self.nitter_instances}
+        if entries is None:
+            self.instance_pool.record_failure(instance)
+            return None
         
-        return None
-    
-    def _get_next_instance(self) -> str:
-        """Get next Nitter instance in rotation"""
-        instance = self.nitter_instances[self.current_instance]
-        self.current_instance = (self.current_instance + 1) % len(self.nitter_instances)
-        return instance
+        self.instance_pool.record_success(instance, time.monotonic() - started)
+        return entries
     
-    def _process_tweet_entry(self, entry: Any, account: str, queries: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _process_tweet_entry(self, entry: Any, account: str, queries: Dict[str, Any],
+                             relevance_score: float = None) -> Optional[Dict[str, Any]]:
         """Process a single tweet entry from RSS"""
         try:
             # Extract tweet content
@@ -245,12 +296,13 @@ class NitterCollector:
                 return None
             
             # Check relevance
-            relevance_score = self._calculate_tweet_relevance(title, queries)
+            if relevance_score is None:
+                relevance_score = self._calculate_tweet_relevance(title, queries)
             if relevance_score < 0.3:
                 return None
             
             # Parse publication date
-            pub_date = self._parse_date(published)
+            pub_date = self._parse_date(published, account)
             if not pub_date:
                 pub_date = datetime.utcnow()
             
@@ -308,39 +360,7 @@ class NitterCollector:
     
     def _calculate_tweet_relevance(self, content: str, queries: Dict[str, Any]) -> float:
         """Calculate relevance score for tweet content"""
-        content_lower = content.lower()
-        score = 0.0
-        
-        # Check for direct team mentions
-        for team in queries['teams']:
-            if team.lower() in content_lower:
-                score += 0.5
-        
-        # Check for team variations
-        for variation in queries['all_variations']:
-            if variation.lower() in content_lower:
-                score += 0.3
-        
-        # Check for match terms
-        for term in queries['match_terms']:
-            if term.lower() in content_lower:
-                score += 0.7
-        
-        # Check for keywords
-        for keyword in queries['keywords']:
-            if keyword.lower() in content_lower:
-                score += 0.1
-        
-        # Check for hashtags
-        for hashtag in queries['hashtags']:
-            if hashtag.lower() in content_lower:
-                score += 0.2
-        
-        # Bonus for breaking news indicators
-        if any(indicator in content_lower for indicator in ['breaking', 'confirmed', 'official', 'just in']):
-            score += 0.3
-        
-        return min(score, 1.0)
+        return self.relevance_router.score(queries['match_id'], 'nitter', content)
     
     def _calculate_tweet_quality(self, account: str, content: str, tweet_type: str) -> float:
         """Calculate quality score for tweet"""
@@ -452,27 +472,19 @@ class NitterCollector:
         except:
             return 'en'  # Default to English
     
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """Parse RSS date string"""
+    def _parse_date(self, date_str: str, account: str = None) -> Optional[datetime]:
+        """Parse RSS date string to naive UTC"""
         if not date_str:
             return None
         
-        # Try common RSS date formats
-        import email.utils
-        try:
-            parsed = email.utils.parsedate_tz(date_str)
-            if parsed:
-                return datetime(*parsed[:6])
-        except:
-            pass
-        
         # Fallback to current time
-        return datetime.utcnow()
+        return self.timestamps.parse(date_str, f"nitter:{account}" if account else None) or datetime.utcnow()
     
     def _is_date_relevant(self, pub_date: datetime, date_range: tuple) -> bool:
         """Check if tweet date is relevant"""
+        # Aware and naive datetimes don't compare; both sides become naive UTC
         start_date, end_date = date_range
-        return start_date <= pub_date <= end_date
+        return as_utc(start_date) <= as_utc(pub_date) <= as_utc(end_date)
     
     def _generate_hash(self, content: str, link: str) -> str:
         """Generate unique hash for deduplication"""
@@ -480,37 +492,22 @@ class NitterCollector:
         return hashlib.md5(hash_content.encode('utf-8')).hexdigest()
     
     async def get_nitter_health(self) -> Dict[str, Any]:
-        """Check health of Nitter instances"""
-        health_results = {}
+        """Health of Nitter instances as tracked from real requests"""
+        health_results = self.instance_pool.get_health()
         
-        for instance in self.nitter_instances:
-            try:
-                # Test with a simple request
-                test_url = f"{instance}/elonmusk/rss"  # Use a popular account for testing
-                
-                async with self.session.head(test_url) as response:
-                    health_results[instance] = {
-                        'status': 'healthy' if response.status == 200 else 'unhealthy',
-                        'status_code': response.status,
-                        'response_time': response.headers.get('server-timing', 'unknown'),
-                        'last_checked': datetime.utcnow().isoformat(),
-                        'currently_used': self.instance_health.get(instance, True)
-                    }
-                    
-            except Exception as e:
-                health_results[instance] = {
-                    'status': 'error',
-                    'error': str(e),
-                    'last_checked': datetime.utcnow().isoformat(),
-                    'currently_used': self.instance_health.get(instance, True)
-                }
+        for health in health_results.values():
+            health['last_checked'] = datetime.utcnow().isoformat()
         
         return health_results
     
     async def get_trending_hashtags(self, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Get trending hashtags related to the match"""
+        """Get trending hashtags related to the match, for queries from ``_build_queries``"""
         hashtag_counts = {}
         
+        # Tweets are routed by match id, as in collect_for_match
+        home_team, away_team = queries['teams']
+        queries = {**queries, 'match_id': self.relevance_router.register_match(queries.get('match_id'), home_team, away_team)}
+        
         try:
             # Collect from a few key accounts
             key_accounts = self.twitter_accounts['journalists'][:5] + self.twitter_accounts['clubs'][:5]
@@ -540,6 +537,8 @@ class NitterCollector:
         except Exception as e:
             logger.error(f"Failed to get trending hashtags: {e}")
             return []
+        finally:
+            self.relevance_router.unregister_match(queries['match_id'])
     
     async def search_tweets(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Search for tweets (limited functionality without Twitter API)"""
@@ -556,27 +555,18 @@ class NitterCollector:
         
         for account in accounts_to_search:
             try:
-                rss_url = await self._get_account_rss_url(account)
-                if not rss_url:
-                    continue
-                
-                async with self.session.get(rss_url) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        feed = feedparser.parse(content)
+                for entry in await self._get_account_entries(account):
+                    title = entry.get('title', '').strip()
+                    if query.lower() in title.lower():
+                        tweet = {
+                            'title': title,
+                            'link': entry.get('link', ''),
+                            'published_at': self._parse_date(entry.get('published', ''), account),
+                            'account': account,
+                            'relevance': title.lower().count(query.lower())
+                        }
+                        all_tweets.append(tweet)
                         
-                        for entry in feed.entries:
-                            title = entry.get('title', '').strip()
-                            if query.lower() in title.lower():
-                                tweet = {
-                                    'title': title,
-                                    'link': entry.get('link', ''),
-                                    'published_at': self._parse_date(entry.get('published', '')),
-                                    'account': account,
-                                    'relevance': title.lower().count(query.lower())
-                                }
-                                all_tweets.append(tweet)
-                                
             except Exception as e:
                 logger.warning(f"Search failed for {account}: {e}")
                 continue
@@ -0,0 +1,157 @@
+"""
+Nitter Instance Pool - Latency-aware routing across Nitter instances
+Tracks per-instance latency and errors behind a half-open circuit breaker
+"""
+
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..config import NITTER_CONFIG, NITTER_INSTANCES
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class _InstanceState:
+    """Rolling health of one Nitter instance"""
+
+    def __init__(self, url: str, config: Dict[str, Any]):
+        self.url = url
+        self.latency_ewma: Optional[float] = None
+        self.error_rate = 0.0
+        self.latencies = deque(maxlen=config['latency_window'])
+
+        self.circuit = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+
+        self.requests = 0
+        self.failures = 0
+        self.last_success: Optional[datetime] = None
+        self.last_failure: Optional[datetime] = None
+
+
+class NitterInstancePool:
+    """
+    Picks the fastest healthy Nitter instance for each request.
+
+    Latency and error rate are exponentially weighted. An instance whose
+    circuit opens after repeated failures is skipped for ``open_seconds``.
+    After that it is half-open: a single probe request decides whether it
+    closes again or stays open for another cooldown.
+    """
+
+    def __init__(self, instances: List[str], config: Dict[str, Any] = None):
+        self.config = {**NITTER_CONFIG, **(config or {})}
+        self.instances = {url: _InstanceState(url, self.config) for url in instances}
+
+    def choose(self, exclude: Iterable[str] = ()) -> Optional[str]:
+        """Fastest instance whose circuit admits a request, or None"""
+        exclude = set(exclude)
+        now = time.monotonic()
+        candidates = []
+
+        for state in self.instances.values():
+            if state.url in exclude:
+                continue
+
+            if state.circuit == OPEN:
+                if now - state.opened_at < self.config['open_seconds']:
+                    continue
+                state.circuit = HALF_OPEN
+                logger.info(f"Nitter instance {state.url} half-open, allowing a probe request")
+
+            if state.circuit == HALF_OPEN and state.probe_in_flight:
+                continue
+
+            candidates.append(state)
+
+        if not candidates:
+            return None
+
+        chosen = min(candidates, key=self._score)
+        if chosen.circuit == HALF_OPEN:
+            chosen.probe_in_flight = True
+        return chosen.url
+
+    def _score(self, state: _InstanceState) -> float:
+        """Expected cost of a request; lower is better"""
+        # Unmeasured instances look reasonably fast so they get tried
+        latency = state.latency_ewma if state.latency_ewma is not None else self.config['initial_latency']
+        return latency / max(0.05, 1.0 - state.error_rate)
+
+    def record_success(self, url: str, latency: float):
+        state = self.instances[url]
+        alpha = self.config['ewma_alpha']
+
+        state.requests += 1
+        state.latencies.append(latency)
+        state.latency_ewma = latency if state.latency_ewma is None else alpha * latency + (1 - alpha) * state.latency_ewma
+        state.error_rate = (1 - alpha) * state.error_rate
+        state.consecutive_failures = 0
+        state.last_success = datetime.utcnow()
+
+        if state.circuit != CLOSED:
+            logger.info(f"Nitter instance {url} recovered, closing circuit")
+        state.circuit = CLOSED
+        state.probe_in_flight = False
+
+    def record_failure(self, url: str):
+        state = self.instances[url]
+        alpha = self.config['ewma_alpha']
+
+        state.requests += 1
+        state.failures += 1
+        state.error_rate = alpha + (1 - alpha) * state.error_rate
+        state.consecutive_failures += 1
+        state.last_failure = datetime.utcnow()
+
+        if state.circuit == HALF_OPEN or state.consecutive_failures >= self.config['failure_threshold']:
+            if state.circuit != OPEN:
+                logger.warning(f"Opening circuit for Nitter instance {url} ({state.consecutive_failures} failures)")
+            state.circuit = OPEN
+            state.opened_at = time.monotonic()
+        state.probe_in_flight = False
+
+    def release(self, url: str):
+        """Forget an abandoned request (e.g. the losing side of a hedge)"""
+        self.instances[url].probe_in_flight = False
+
+    def hedge_delay(self, url: str) -> float:
+        """How long to wait on ``url`` before hedging: its p90 latency"""
+        state = self.instances[url]
+        if len(state.latencies) < self.config['min_samples_for_hedge']:
+            return self.config['initial_hedge_delay']
+
+        ordered = sorted(state.latencies)
+        p90 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))]
+        return max(self.config['min_hedge_delay'], p90)
+
+    def get_health(self) -> Dict[str, Dict[str, Any]]:
+        """Tracked health of every instance"""
+        health = {}
+        for url, state in self.instances.items():
+            health[url] = {
+                'status': 'healthy' if state.circuit == CLOSED else 'unhealthy',
+                'circuit': state.circuit,
+                'latency_ewma_seconds': round(state.latency_ewma, 3) if state.latency_ewma is not None else None,
+                'hedge_delay_seconds': round(self.hedge_delay(url), 3),
+                'error_rate': round(state.error_rate, 3),
+                'requests': state.requests,
+                'failures': state.failures,
+                'consecutive_failures': state.consecutive_failures,
+                'last_success': state.last_success.isoformat() if state.last_success else None,
+                'last_failure': state.last_failure.isoformat() if state.last_failure else None,
+            }
+        return health
+
+
+# Process-wide instance so every Nitter collector learns from the same requests
+shared_nitter_instance_pool = NitterInstancePool(NITTER_INSTANCES)
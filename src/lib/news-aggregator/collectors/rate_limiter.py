@@ -0,0 +1,166 @@
+"""
+Per-Host Rate Limiter - Token bucket politeness scheduler
+Paces requests per host across every collector instead of fixed sleeps
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from ..config import RATE_LIMITS
+
+logger = logging.getLogger(__name__)
+
+ROBOTS_USER_AGENT = 'MatchNewsAggregator'
+
+
+class TokenBucket:
+    """
+    Classic token bucket: ``capacity`` requests may go out immediately,
+    after which requests are released at ``rate`` per second.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+        self.acquired = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self) -> float:
+        """Take one token, waiting only as long as needed; returns seconds waited"""
+        waited = 0.0
+
+        # Waiters queue on the lock so tokens are handed out in FIFO order
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                delay = (1 - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self.tokens -= 1
+
+        self.acquired += 1
+        if waited > 0:
+            self.delayed += 1
+            self.total_wait += waited
+
+        return waited
+
+    def tighten(self, rate: float, capacity: int):
+        """Apply a stricter limit when another caller needs one for this host"""
+        self._refill()
+        self.rate = min(self.rate, rate)
+        self.capacity = max(1, min(self.capacity, capacity))
+        self.tokens = min(self.tokens, self.capacity)
+
+
+class HostRateLimiter:
+    """
+    Central per-host scheduler shared by all collectors.
+
+    Buckets are sized from RATE_LIMITS profiles; a host reached through more
+    than one profile gets the strictest limit. Profiles that set
+    ``respect_robots_txt`` also honour the host's robots.txt Crawl-delay.
+    """
+
+    def __init__(self):
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.crawl_delays: Dict[str, Optional[float]] = {}
+        self._robots_locks: Dict[str, asyncio.Lock] = {}
+
+    async def acquire(self, url: str, profile: str, session: Any = None, rate: float = None) -> float:
+        """
+        Wait for permission to send a request to ``url``'s host.
+
+        ``rate`` (requests per second) overrides the profile's
+        requests_per_minute when a source documents its own limit.
+        """
+        parsed = urlparse(url)
+        host = parsed.netloc.lower()
+        limits = RATE_LIMITS[profile]
+
+        if rate is None:
+            rate = limits['requests_per_minute'] / 60.0
+            if limits.get('delay_between_requests'):
+                rate = min(rate, 1.0 / limits['delay_between_requests'])
+        capacity = limits['concurrent_requests']
+
+        if limits.get('respect_robots_txt') and session is not None:
+            crawl_delay = await self._get_crawl_delay(parsed.scheme or 'https', host, session)
+            if crawl_delay:
+                rate = min(rate, 1.0 / crawl_delay)
+                capacity = 1
+
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(rate, capacity)
+            self.buckets[host] = bucket
+        elif rate < bucket.rate or capacity < bucket.capacity:
+            bucket.tighten(rate, capacity)
+
+        return await bucket.acquire()
+
+    async def _get_crawl_delay(self, scheme: str, host: str, session: Any) -> Optional[float]:
+        """Fetch robots.txt once per host and cache its Crawl-delay"""
+        if host in self.crawl_delays:
+            return self.crawl_delays[host]
+
+        lock = self._robots_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            if host in self.crawl_delays:
+                return self.crawl_delays[host]
+
+            crawl_delay = None
+            try:
+                async with session.get(f"{scheme}://{host}/robots.txt") as response:
+                    if response.status == 200:
+                        parser = RobotFileParser()
+                        parser.parse((await response.text()).splitlines())
+                        delay = parser.crawl_delay(ROBOTS_USER_AGENT)
+                        crawl_delay = float(delay) if delay else None
+            except Exception as e:
+                logger.debug(f"Could not read robots.txt for {host}: {e}")
+
+            if crawl_delay:
+                logger.info(f"Using robots.txt crawl-delay of {crawl_delay}s for {host}")
+
+            self.crawl_delays[host] = crawl_delay
+            return crawl_delay
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-host pacing statistics"""
+        hosts = {}
+        for host, bucket in self.buckets.items():
+            hosts[host] = {
+                'rate_per_second': round(bucket.rate, 3),
+                'capacity': bucket.capacity,
+                'requests': bucket.acquired,
+                'delayed_requests': bucket.delayed,
+                'total_wait_seconds': round(bucket.total_wait, 2),
+                'crawl_delay': self.crawl_delays.get(host),
+            }
+
+        return {
+            'hosts_tracked': len(self.buckets),
+            'total_requests': sum(b.acquired for b in self.buckets.values()),
+            'delayed_requests': sum(b.delayed for b in self.buckets.values()),
+            'hosts': hosts,
+        }
+
+
+# Process-wide instance so collectors hitting the same host coordinate
+shared_rate_limiter = HostRateLimiter()
@@ -4,92 +4,298 @@ Collects match threads, discussions, and fan reactions from Reddit
 """
 
 import asyncio
+import aiohttp
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 import re
 import hashlib
 
-try:
-    import praw
-    import prawcore
-    PRAW_AVAILABLE = True
-except ImportError:
-    PRAW_AVAILABLE = False
-    logging.warning("PRAW not available. Reddit collection will be disabled.")
-
-from ..config import REDDIT_CONFIG, TEAM_SUBREDDITS, RATE_LIMITS
+from ..config import REDDIT_CONFIG, TEAM_SUBREDDITS, RATE_LIMITS, DEFAULT_HEADERS
+from .http_pool import HTTPClientPool
+from .rate_limiter import HostRateLimiter, shared_rate_limiter
+from .reddit_query_planner import PlannedRequest, RedditQueryPlanner
+from .timestamps import as_utc
 
 logger = logging.getLogger(__name__)
 
+REDDIT_TOKEN_URL = 'https://www.reddit.com/api/v1/access_token'
+REDDIT_API_URL = 'https://oauth.reddit.com'
+
+# /api/info accepts at most 100 fullnames per call
+INFO_BATCH_SIZE = 100
+
+class RequestBudget:
+    """Counts the Reddit requests spent on one aggregation"""
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+    
+    def charge(self, count: int = 1):
+        self.used += count
+    
+    @property
+    def remaining(self) -> int:
+        return max(0, self.limit - self.used)
+
 class RedditCollector:
-    def __init__(self):
+    def __init__(self, http_pool: HTTPClientPool = None, rate_limiter: HostRateLimiter = None):
         self.config = REDDIT_CONFIG
         self.team_subreddits = TEAM_SUBREDDITS
-        self.rate_limiter = asyncio.Semaphore(RATE_LIMITS['reddit_api']['concurrent_requests'])
-        self.reddit = None
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        self.session = None
+        self.http_pool = http_pool
+        self.enabled = bool(self.config['client_id'] and self.config['client_secret'])
+        self.query_planner = RedditQueryPlanner(self.team_subreddits)
+        
+        # Application-only OAuth token, shared by every request
+        self._access_token = None
+        self._token_expires_at = 0.0
+        self._token_lock = asyncio.Lock()
+        
+        # Submission ids found per match, refreshed in bulk on later aggregations,
+        # with the end of the match's date range, after which the entry is dropped
+        self.tracked_submissions: Dict[str, set] = {}
+        self._tracked_until: Dict[str, datetime] = {}
         
-        if PRAW_AVAILABLE and self.config['client_id'] and self.config['client_secret']:
-            self._initialize_reddit()
+        self.stats = {
+            'aggregations': 0,
+            'requests': 0,
+            'listing_requests': 0,
+            'comment_requests': 0,
+            'comment_fetches_skipped': 0,
+        }
+        
+        if not self.enabled:
+            logger.warning("Reddit credentials not configured. Reddit collection will be disabled.")
+    
+    async def __aenter__(self):
+        if self.http_pool:
+            # Borrow the application-wide session; the pool owns its lifetime
+            self.session = self.http_pool.session
+            return self
+        
+        timeout = aiohttp.ClientTimeout(total=30)
+        self.session = aiohttp.ClientSession(
+            timeout=timeout,
+            headers=DEFAULT_HEADERS.copy(),
+            connector=aiohttp.TCPConnector(limit=RATE_LIMITS['reddit_api']['concurrent_requests'])
+        )
+        return self
+        
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.session and not self.http_pool:
+            await self.session.close()
     
-    def _initialize_reddit(self):
-        """Initialize Reddit API client"""
+    async def _get_access_token(self, force_refresh: bool = False) -> str:
+        """Get an application-only OAuth token, refreshing it shortly before expiry"""
+        async with self._token_lock:
+            if not force_refresh and self._access_token and time.monotonic() < self._token_expires_at:
+                return self._access_token
+            
+            await self.rate_limiter.acquire(REDDIT_TOKEN_URL, 'reddit_api')
+            async with self.session.post(
+                REDDIT_TOKEN_URL,
+                data={'grant_type': 'client_credentials'},
+                auth=aiohttp.BasicAuth(self.config['client_id'], self.config['client_secret']),
+                headers={'User-Agent': self.config['user_agent']},
+            ) as response:
+                response.raise_for_status()
+                payload = await response.json()
+            
+            self._access_token = payload['access_token']
+            self._token_expires_at = time.monotonic() + payload.get('expires_in', 3600) - 60
+            logger.info("Reddit API token acquired")
+            return self._access_token
+    
+    async def _api_get(self, path: str, params: Dict[str, Any] = None, budget: RequestBudget = None) -> Any:
+        """GET an OAuth API path and return the decoded JSON body"""
+        params = {**(params or {}), 'raw_json': 1}
+        url = f"{REDDIT_API_URL}{path}"
+        
+        for attempt in range(2):
+            token = await self._get_access_token(force_refresh=attempt > 0)
+            await self.rate_limiter.acquire(url, 'reddit_api')
+            self.stats['requests'] += 1
+            if budget is not None:
+                budget.charge()
+            
+            async with self.session.get(
+                url,
+                params=params,
+                headers={'Authorization': f"bearer {token}", 'User-Agent': self.config['user_agent']},
+            ) as response:
+                # Tokens can be revoked early; retry once with a fresh one
+                if response.status == 401 and attempt == 0:
+                    continue
+                response.raise_for_status()
+                return await response.json()
+    
+    async def _get_listing(self, path: str, params: Dict[str, Any] = None, budget: RequestBudget = None) -> List[Dict[str, Any]]:
+        """Fetch a listing endpoint and return the raw submission objects"""
+        self.stats['listing_requests'] += 1
+        listing = await self._api_get(path, params, budget)
+        return [child['data'] for child in listing.get('data', {}).get('children', []) if child.get('kind') == 't3']
+    
+    async def fetch_submissions(self, submission_ids: List[str], budget: RequestBudget = None) -> List[Dict[str, Any]]:
+        """Fetch current metadata for many submissions, 100 ids per /api/info call"""
+        fullnames = [sid if sid.startswith('t3_') else f"t3_{sid}" for sid in dict.fromkeys(submission_ids)]
+        batches = [fullnames[i:i + INFO_BATCH_SIZE] for i in range(0, len(fullnames), INFO_BATCH_SIZE)]
+        
+        results = await asyncio.gather(
+            *[self._get_listing('/api/info', {'id': ','.join(batch)}, budget) for batch in batches],
+            return_exceptions=True
+        )
+        
+        submissions = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching submission info: {result}")
+                continue
+            submissions.extend(result)
+        
+        return submissions
+    
+    async def _fetch_top_comments(self, submission_id: str, limit: int = 10, budget: RequestBudget = None) -> List[Dict[str, Any]]:
+        """Fetch the top-level comments of a submission"""
         try:
-            self.reddit = praw.Reddit(
-                client_id=self.config['client_id'],
-                client_secret=self.config['client_secret'],
-                user_agent=self.config['user_agent'],
-                ratelimit_seconds=600,  # 10 minutes
-                check_for_async=False
+            self.stats['comment_requests'] += 1
+            thread = await self._api_get(
+                f"/comments/{submission_id}", {'limit': limit, 'depth': 1, 'sort': 'top'}, budget
             )
-            self.reddit.read_only = True
-            logger.info("Reddit API initialized successfully")
+            children = thread[1]['data']['children'] if len(thread) > 1 else []
+            
+            top_comments = []
+            for child in children:
+                # Skip "more comments" stubs
+                if child.get('kind') != 't1':
+                    continue
+                comment = child['data']
+                if comment.get('body') and comment['body'] != '[deleted]':
+                    top_comments.append({
+                        'id': comment['id'],
+                        'body': comment['body'],
+                        'score': comment.get('score', 0),
+                        'author': comment.get('author') or '[deleted]',
+                        'created_utc': comment.get('created_utc'),
+                        'is_submitter': comment.get('is_submitter', False),
+                        'controversiality': comment.get('controversiality', 0),
+                    })
+            
+            return top_comments[:limit]
+            
         except Exception as e:
-            logger.error(f"Failed to initialize Reddit API: {e}")
-            self.reddit = None
+            logger.warning(f"Error extracting comments for {submission_id}: {e}")
+            return []
     
     async def collect_for_match(self, home_team: str, away_team: str, match_date: datetime) -> Dict[str, List[Dict[str, Any]]]:
         """Collect Reddit content for a specific match"""
-        if not self.reddit:
+        empty = {
+            'match_threads': [],
+            'pre_match_discussions': [],
+            'post_match_discussions': [],
+            'team_discussions': [],
+            'general_discussions': []
+        }
+        
+        if not self.enabled or not self.session:
             logger.warning("Reddit API not available")
-            return {
-                'match_threads': [],
-                'pre_match_discussions': [],
-                'post_match_discussions': [],
-                'team_discussions': [],
-                'general_discussions': []
-            }
+            return empty
         
         queries = self._build_queries(home_team, away_team, match_date)
+        budget = queries['request_budget']
+        self.stats['aggregations'] += 1
+        match_key = f"{home_team}|{away_team}|{match_date.date().isoformat()}"
         
-        # Collect from different sources
-        tasks = [
-            self._collect_match_threads(queries),
-            self._collect_team_discussions(queries),
-            self._collect_general_discussions(queries),
-        ]
+        # Phase one: lightweight listings only, no comment trees
+        planned_requests = self.query_planner.plan(queries)
+        tasks = [self._collect_planned_request(request, queries) for request in planned_requests]
         
         try:
             results = await asyncio.gather(*tasks, return_exceptions=True)
             
-            match_threads = results[0] if not isinstance(results[0], Exception) else []
-            team_discussions = results[1] if not isinstance(results[1], Exception) else []
-            general_discussions = results[2] if not isinstance(results[2], Exception) else []
+            # The same submission often turns up under several requests; earlier requests win
+            unique = {}
+            for request, result in zip(planned_requests, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Reddit {request.kind} request failed: {result}")
+                    continue
+                for discussion in result:
+                    unique.setdefault(discussion['id'], discussion)
+            discussions = list(unique.values())
+            
+            # Submissions found earlier can fall out of search results; refresh them in bulk
+            discussions.extend(await self._refresh_tracked_submissions(
+                match_key, queries['date_range'][1], discussions, budget
+            ))
+            
+            # Phase two: comments for the best-ranked submissions, within the budget
+            await self._attach_top_comments(discussions, queries, budget)
             
             # Categorize discussions
-            categorized = self._categorize_discussions(match_threads + team_discussions + general_discussions, queries)
+            categorized = self._categorize_discussions(discussions, queries)
             
+            logger.info(f"Reddit aggregation used {budget.used}/{budget.limit} requests for {len(discussions)} submissions")
             return categorized
             
         except Exception as e:
             logger.error(f"Error collecting Reddit content: {e}")
-            return {
-                'match_threads': [],
-                'pre_match_discussions': [],
-                'post_match_discussions': [],
-                'team_discussions': [],
-                'general_discussions': []
-            }
+            return empty
+    
+    async def _refresh_tracked_submissions(self, match_key: str, until: datetime, discussions: List[Dict[str, Any]],
+                                           budget: RequestBudget) -> List[Dict[str, Any]]:
+        """Re-fetch previously found submissions missing from this round's listings"""
+        self._forget_finished_matches()
+        
+        found_ids = {discussion['id'] for discussion in discussions}
+        tracked = self.tracked_submissions.setdefault(match_key, set())
+        self._tracked_until[match_key] = as_utc(until)
+        missing = tracked - found_ids
+        tracked.update(found_ids)
+        
+        if not missing:
+            return []
+        
+        refreshed = []
+        for submission in await self.fetch_submissions(list(missing), budget):
+            data = self._extract_submission_data(submission)
+            if data:
+                refreshed.append(data)
+        
+        logger.debug(f"Refreshed {len(refreshed)} tracked Reddit submissions for {match_key}")
+        return refreshed
+    
+    def _forget_finished_matches(self):
+        """Drop tracked submissions of matches whose date range has passed"""
+        now = datetime.utcnow()
+        for match_key in [key for key, until in self._tracked_until.items() if until < now]:
+            del self._tracked_until[match_key]
+            self.tracked_submissions.pop(match_key, None)
+    
+    async def _attach_top_comments(self, discussions: List[Dict[str, Any]], queries: Dict[str, Any], budget: RequestBudget):
+        """Fetch top comments for the highest-ranked discussions in parallel"""
+        # Submissions without comments never need a request
+        candidates = [discussion for discussion in discussions if discussion['num_comments'] > 0]
+        candidates.sort(key=lambda discussion: self._rank_submission(discussion, queries), reverse=True)
+        
+        fetch_count = min(self.config['comment_fetch_limit'], budget.remaining, len(candidates))
+        selected = candidates[:fetch_count]
+        self.stats['comment_fetches_skipped'] += len(candidates) - fetch_count
+        
+        comment_lists = await asyncio.gather(
+            *[self._fetch_top_comments(discussion['id'], budget=budget) for discussion in selected]
+        )
+        for discussion, top_comments in zip(selected, comment_lists):
+            discussion['top_comments'] = top_comments
+    
+    def _rank_submission(self, discussion: Dict[str, Any], queries: Dict[str, Any]) -> tuple:
+        """Rank a listing for comment fetching: match threads first, then engagement"""
+        title = discussion['title'].lower()
+        is_match_thread = any(indicator in title for indicator in ['match thread', 'live thread', 'game thread'])
+        mentions_both = all(team.lower() in title for team in queries['teams'])
+        return (is_match_thread, mentions_both, discussion['engagement_score'])
     
     def _build_queries(self, home_team: str, away_team: str, match_date: datetime) -> Dict[str, Any]:
         """Build search queries for Reddit"""
@@ -110,105 +316,38 @@ class RedditCollector:
                 'match thread', 'pre match', 'post match', 'vs', 'v',
                 'lineup', 'team news', 'injury', 'preview', 'prediction'
             ],
-            'subreddits': ['soccer', 'football', 'PremierLeague', 'ChampionsLeague'] + list(self.team_subreddits.values())
+            'subreddits': ['soccer', 'football', 'PremierLeague', 'ChampionsLeague'] + list(self.team_subreddits.values()),
+            'request_budget': RequestBudget(self.config['request_budget']),
         }
     
-    async def _collect_match_threads(self, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Collect official match threads from r/soccer"""
-        async with self.rate_limiter:
-            try:
-                soccer_sub = self.reddit.subreddit("soccer")
-                submissions = []
-                
-                # Search for match threads
-                for query in queries['match_queries']:
-                    search_results = soccer_sub.search(query, time_filter='week', limit=20)
-                    
-                    for submission in search_results:
-                        if self._is_match_thread(submission, queries):
-                            data = self._extract_submission_data(submission)
-                            if data:
-                                submissions.append(data)
-                
-                return submissions
-                
-            except Exception as e:
-                logger.error(f"Error collecting match threads: {e}")
-                return []
-    
-    async def _collect_team_discussions(self, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Collect discussions from team-specific subreddits"""
-        async with self.rate_limiter:
-            try:
-                submissions = []
-                
-                for team in queries['teams']:
-                    if team in self.team_subreddits:
-                        sub_name = self.team_subreddits[team]
-                        try:
-                            team_sub = self.reddit.subreddit(sub_name)
-                            
-                            # Get hot posts
-                            for submission in team_sub.hot(limit=25):
-                                if self._is_relevant_to_match(submission, queries):
-                                    data = self._extract_submission_data(submission)
-                                    if data:
-                                        data['team_subreddit'] = sub_name
-                                        submissions.append(data)
-                            
-                            # Get new posts
-                            for submission in team_sub.new(limit=25):
-                                if self._is_relevant_to_match(submission, queries):
-                                    data = self._extract_submission_data(submission)
-                                    if data:
-                                        data['team_subreddit'] = sub_name
-                                        submissions.append(data)
-                                        
-                        except Exception as e:
-                            logger.error(f"Error accessing {sub_name}: {e}")
-                            continue
-                
-                return submissions
-                
-            except Exception as e:
-                logger.error(f"Error collecting team discussions: {e}")
-                return []
-    
-    async def _collect_general_discussions(self, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Collect general football discussions"""
-        async with self.rate_limiter:
-            try:
-                submissions = []
-                general_subs = ['soccer', 'football', 'PremierLeague', 'ChampionsLeague', 'footballtactics']
-                
-                for sub_name in general_subs:
-                    try:
-                        subreddit = self.reddit.subreddit(sub_name)
-                        
-                        # Search for relevant discussions
-                        for query in queries['team_queries']:
-                            search_results = subreddit.search(query, time_filter='week', limit=15)
-                            
-                            for submission in search_results:
-                                if self._is_relevant_to_match(submission, queries):
-                                    data = self._extract_submission_data(submission)
-                                    if data:
-                                        data['source_subreddit'] = sub_name
-                                        submissions.append(data)
-                                        
-                    except Exception as e:
-                        logger.error(f"Error accessing {sub_name}: {e}")
-                        continue
-                
-                return submissions
-                
-            except Exception as e:
-                logger.error(f"Error collecting general discussions: {e}")
-                return []
+    async def _collect_planned_request(self, request: PlannedRequest, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run one planned listing request and keep the submissions relevant to the match"""
+        submissions = []
+        listing = await self._get_listing(request.path, request.params, queries['request_budget'])
+        
+        for submission in listing:
+            if request.kind == 'match_thread':
+                relevant = self._is_match_thread(submission, queries)
+            else:
+                relevant = self._is_relevant_to_match(submission, queries)
+            if not relevant:
+                continue
+            
+            data = self._extract_submission_data(submission)
+            if not data:
+                continue
+            
+            if request.kind == 'team':
+                data['team_subreddit'] = submission.get('subreddit', '')
+            elif request.kind == 'general':
+                data['source_subreddit'] = submission.get('subreddit', '')
+            submissions.append(data)
+        
+        return submissions
     
     def _is_match_thread(self, submission: Any, queries: Dict[str, Any]) -> bool:
         """Check if submission is a match thread"""
-        title = submission.title.lower()
+        title = submission['title'].lower()
         
         # Look for match thread indicators
         match_indicators = ['match thread', 'live thread', 'game thread', 'vs', 'v']
@@ -221,15 +360,15 @@ class RedditCollector:
         has_teams = any(team.lower() in title for team in queries['teams'])
         
         # Check date relevance
-        created_date = datetime.utcfromtimestamp(submission.created_utc)
+        created_date = datetime.utcfromtimestamp(submission['created_utc'])
         date_relevant = queries['date_range'][0] <= created_date <= queries['date_range'][1]
         
         return has_teams and date_relevant
     
     def _is_relevant_to_match(self, submission: Any, queries: Dict[str, Any]) -> bool:
         """Check if submission is relevant to the match"""
-        title = submission.title.lower()
-        content = getattr(submission, 'selftext', '').lower()
+        title = submission['title'].lower()
+        content = (submission.get('selftext') or '').lower()
         text = f"{title} {content}"
         
         # Check for team mentions
@@ -239,7 +378,7 @@ class RedditCollector:
             return False
         
         # Check date relevance
-        created_date = datetime.utcfromtimestamp(submission.created_utc)
+        created_date = datetime.utcfromtimestamp(submission['created_utc'])
         date_relevant = queries['date_range'][0] <= created_date <= queries['date_range'][1]
         
         # Check for relevant keywords
@@ -247,54 +386,32 @@ class RedditCollector:
         
         return date_relevant and (has_keywords or any(query.lower() in text for query in queries['match_queries']))
     
-    def _extract_submission_data(self, submission: Any) -> Optional[Dict[str, Any]]:
-        """Extract data from Reddit submission"""
+    def _extract_submission_data(self, submission: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Extract data from a Reddit submission object"""
         try:
             # Basic submission data
             data = {
-                'id': submission.id,
-                'title': submission.title,
-                'content': getattr(submission, 'selftext', ''),
-                'url': submission.url,
-                'score': submission.score,
-                'upvote_ratio': getattr(submission, 'upvote_ratio', 0),
-                'num_comments': submission.num_comments,
-                'created_utc': submission.created_utc,
-                'created_at': datetime.utcfromtimestamp(submission.created_utc),
-                'author': str(submission.author) if submission.author else '[deleted]',
-                'subreddit': str(submission.subreddit),
-                'flair': getattr(submission, 'link_flair_text', ''),
-                'is_stickied': getattr(submission, 'stickied', False),
-                'is_locked': getattr(submission, 'locked', False),
+                'id': submission['id'],
+                'title': submission['title'],
+                'content': submission.get('selftext') or '',
+                'url': submission.get('url', ''),
+                'permalink': submission.get('permalink', ''),
+                'score': submission.get('score', 0),
+                'upvote_ratio': submission.get('upvote_ratio', 0),
+                'num_comments': submission.get('num_comments', 0),
+                'created_utc': submission['created_utc'],
+                'created_at': datetime.utcfromtimestamp(submission['created_utc']),
+                'author': submission.get('author') or '[deleted]',
+                'subreddit': submission.get('subreddit', ''),
+                'flair': submission.get('link_flair_text') or '',
+                'is_stickied': submission.get('stickied', False),
+                'is_locked': submission.get('locked', False),
                 'source_type': 'reddit',
-                'hash': self._generate_hash(submission.title, submission.id),
+                'hash': self._generate_hash(submission['title'], submission['id']),
                 'collected_at': datetime.utcnow(),
+                'top_comments': [],
             }
             
-            # Extract top comments
-            try:
-                submission.comments.replace_more(limit=0)  # Remove "more comments"
-                top_comments = []
-                
-                for comment in submission.comments[:10]:  # Top 10 comments
-                    if hasattr(comment, 'body') and comment.body != '[deleted]':
-                        comment_data = {
-                            'id': comment.id,
-                            'body': comment.body,
-                            'score': comment.score,
-                            'author': str(comment.author) if comment.author else '[deleted]',
-                            'created_utc': comment.created_utc,
-                            'is_submitter': comment.is_submitter,
-                            'controversiality': getattr(comment, 'controversiality', 0),
-                        }
-                        top_comments.append(comment_data)
-                
-                data['top_comments'] = top_comments
-                
-            except Exception as e:
-                logger.warning(f"Error extracting comments for {submission.id}: {e}")
-                data['top_comments'] = []
-            
             # Calculate engagement metrics
             data['engagement_score'] = self._calculate_engagement_score(data)
             data['sentiment_indicators'] = self._extract_sentiment_indicators(data)
@@ -388,55 +505,53 @@ class RedditCollector:
     
     async def get_subreddit_health(self) -> Dict[str, Dict[str, Any]]:
         """Check health of relevant subreddits"""
-        if not self.reddit:
+        if not self.enabled or not self.session:
             return {}
         
-        health_results = {}
         subreddits_to_check = ['soccer', 'football', 'PremierLeague'] + list(self.team_subreddits.values())
+        results = await asyncio.gather(
+            *[self._get_listing(f"/r/{sub_name}/new", {'limit': 5}) for sub_name in subreddits_to_check],
+            return_exceptions=True
+        )
         
-        for sub_name in subreddits_to_check:
-            try:
-                subreddit = self.reddit.subreddit(sub_name)
-                
-                # Try to get recent posts
-                recent_posts = list(subreddit.new(limit=5))
-                
-                health_results[sub_name] = {
-                    'status': 'healthy' if len(recent_posts) > 0 else 'unhealthy',
-                    'recent_posts_count': len(recent_posts),
-                    'last_checked': datetime.utcnow().isoformat(),
-                    'accessible': True
-                }
-                
-            except Exception as e:
+        health_results = {}
+        for sub_name, recent_posts in zip(subreddits_to_check, results):
+            if isinstance(recent_posts, Exception):
                 health_results[sub_name] = {
                     'status': 'error',
-                    'error': str(e),
+                    'error': str(recent_posts),
                     'last_checked': datetime.utcnow().isoformat(),
                     'accessible': False
                 }
+                continue
+            
+            health_results[sub_name] = {
+                'status': 'healthy' if len(recent_posts) > 0 else 'unhealthy',
+                'recent_posts_count': len(recent_posts),
+                'last_checked': datetime.utcnow().isoformat(),
+                'accessible': True
+            }
         
         return health_results
     
     async def get_trending_topics(self, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get trending topics related to the match"""
-        if not self.reddit:
+        if not self.enabled or not self.session:
             return []
         
         try:
-            soccer_sub = self.reddit.subreddit("soccer")
-            hot_posts = list(soccer_sub.hot(limit=50))
+            hot_posts = await self._get_listing('/r/soccer/hot', {'limit': 50})
             
             relevant_topics = []
             for post in hot_posts:
                 if self._is_relevant_to_match(post, queries):
                     topic_data = {
-                        'title': post.title,
-                        'score': post.score,
-                        'comments': post.num_comments,
-                        'created_at': datetime.utcfromtimestamp(post.created_utc),
-                        'url': post.url,
-                        'trending_score': post.score + (post.num_comments * 2)
+                        'title': post['title'],
+                        'score': post.get('score', 0),
+                        'comments': post.get('num_comments', 0),
+                        'created_at': datetime.utcfromtimestamp(post['created_utc']),
+                        'url': post.get('url', ''),
+                        'trending_score': post.get('score', 0) + (post.get('num_comments', 0) * 2)
                     }
                     relevant_topics.append(topic_data)
             
@@ -447,4 +562,15 @@ class RedditCollector:
             
         except Exception as e:
             logger.error(f"Error getting trending topics: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get Reddit request statistics"""
+        aggregations = self.stats['aggregations']
+        return {
+            **self.stats,
+            'requests_per_aggregation': self.stats['requests'] / aggregations if aggregations else 0.0,
+            'request_budget': self.config['request_budget'],
+            'comment_fetch_limit': self.config['comment_fetch_limit'],
+            'query_planner': self.query_planner.get_stats(),
+        }
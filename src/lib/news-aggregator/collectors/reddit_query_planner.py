@@ -0,0 +1,106 @@
+"""
+Reddit Query Planner - Collapses per-match Reddit searches
+Merges query permutations into boolean OR searches over multi-subreddit paths
+"""
+
+import logging
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Subreddits searched for general discussion about either team
+GENERAL_SUBREDDITS = ['soccer', 'football', 'PremierLeague', 'ChampionsLeague', 'footballtactics']
+
+# Reddit rejects search queries longer than this
+MAX_QUERY_LENGTH = 512
+
+
+class PlannedRequest:
+    """One Reddit listing request and the kind of results it produces"""
+
+    def __init__(self, kind: str, path: str, params: Dict[str, Any], subreddits: List[str]):
+        self.kind = kind
+        self.path = path
+        self.params = params
+        self.subreddits = subreddits
+
+    def __repr__(self) -> str:
+        return f"PlannedRequest({self.kind}, {self.path}, {self.params.get('q', '')!r})"
+
+
+class RedditQueryPlanner:
+    """
+    Turns one match's queries into the fewest listing requests.
+
+    Match-thread permutations become one OR search on r/soccer, team
+    subreddits share one multi-subreddit hot and new listing, and both team
+    names are searched across every general subreddit in a single call.
+    """
+
+    def __init__(self, team_subreddits: Dict[str, str], general_subreddits: List[str] = None):
+        self.team_subreddits = team_subreddits
+        self.general_subreddits = general_subreddits or GENERAL_SUBREDDITS
+
+        self.stats = {
+            'plans': 0,
+            'planned_requests': 0,
+            'unplanned_requests': 0,
+        }
+
+    def plan(self, queries: Dict[str, Any]) -> List[PlannedRequest]:
+        """Build the listing requests for one match"""
+        requests = [
+            PlannedRequest(
+                'match_thread',
+                '/r/soccer/search',
+                self._search_params(queries['match_queries'], limit=50),
+                ['soccer'],
+            )
+        ]
+
+        team_subs = [self.team_subreddits[team] for team in queries['teams'] if team in self.team_subreddits]
+        if team_subs:
+            multi = '+'.join(team_subs)
+            for sort in ('hot', 'new'):
+                requests.append(PlannedRequest('team', f"/r/{multi}/{sort}", {'limit': 25 * len(team_subs)}, team_subs))
+
+        requests.append(
+            PlannedRequest(
+                'general',
+                f"/r/{'+'.join(self.general_subreddits)}/search",
+                self._search_params(queries['team_queries'], limit=100),
+                list(self.general_subreddits),
+            )
+        )
+
+        self.stats['plans'] += 1
+        self.stats['planned_requests'] += len(requests)
+        self.stats['unplanned_requests'] += self._unplanned_request_count(queries, len(team_subs))
+
+        return requests
+
+    def _search_params(self, terms: List[str], limit: int) -> Dict[str, Any]:
+        """Search parameters for an OR of quoted phrases"""
+        query = ' OR '.join(f'"{term}"' for term in terms)
+        if len(query) > MAX_QUERY_LENGTH:
+            logger.warning(f"Reddit search query truncated to {MAX_QUERY_LENGTH} characters")
+            query = query[:MAX_QUERY_LENGTH].rsplit(' OR ', 1)[0]
+
+        return {'q': query, 't': 'week', 'limit': limit, 'restrict_sr': 1}
+
+    def _unplanned_request_count(self, queries: Dict[str, Any], team_sub_count: int) -> int:
+        """Requests the same match needs with one call per query and subreddit"""
+        return (
+            len(queries['match_queries'])
+            + 2 * team_sub_count
+            + len(self.general_subreddits) * len(queries['team_queries'])
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get planning statistics"""
+        plans = self.stats['plans']
+        return {
+            **self.stats,
+            'requests_per_plan': self.stats['planned_requests'] / plans if plans else 0.0,
+            'requests_saved': self.stats['unplanned_requests'] - self.stats['planned_requests'],
+        }
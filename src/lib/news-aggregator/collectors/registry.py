@@ -0,0 +1,243 @@
+"""
+Collector Registry - Pluggable collectors with per-collector deadlines
+Runs every registered collector for a match and keeps whatever each one produced by its deadline
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Tuple
+
+from ..config import COLLECTOR_CONFIG
+
+logger = logging.getLogger(__name__)
+
+HealthFn = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+class ArticleSink:
+    """
+    Where a collector hands over its articles, batch by batch, as they arrive.
+
+    Batches are tagged with the collector and weighted, then either kept
+    here or forwarded to a bounded queue for the streaming pipeline, in
+    which case ``add`` waits while downstream stages catch up. Whatever was
+    handed over before a missed deadline has already been kept.
+    """
+
+    def __init__(self, name: str, weight: float = 1.0, queue: asyncio.Queue = None):
+        self.name = name
+        self.weight = weight
+        self.queue = queue
+        self.articles: List[Dict[str, Any]] = []
+        self.count = 0
+
+    async def add(self, articles: List[Dict[str, Any]]):
+        if not articles:
+            return
+
+        for article in articles:
+            article['collector'] = self.name
+            article['quality_score'] = min(article.get('quality_score', 0.5) * self.weight, 1.0)
+        self.count += len(articles)
+
+        if self.queue is not None:
+            await self.queue.put((self.name, articles))
+        else:
+            self.articles.extend(articles)
+
+
+# Collectors receive the match and a sink to hand their articles to as they arrive
+CollectFn = Callable[[Dict[str, Any], ArticleSink], Awaitable[Any]]
+
+
+async def gather_into(tasks: Iterable[Awaitable[List[Dict[str, Any]]]], sink: ArticleSink = None,
+                      label: str = 'collection') -> List[Dict[str, Any]]:
+    """
+    Run ``tasks`` concurrently and merge their lists of articles.
+
+    Each result goes to ``sink`` as soon as its task finishes, so a caller
+    cancelled at a deadline has already handed over every finished task's
+    articles. Failed tasks are logged and skipped.
+    """
+    merged = []
+    pending = [asyncio.ensure_future(task) for task in tasks]
+
+    try:
+        for future in asyncio.as_completed(pending):
+            try:
+                articles = await future
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"{label} task failed: {e}")
+                continue
+
+            merged.extend(articles)
+            if sink is not None:
+                await sink.add(articles)
+    finally:
+        # Cut off at a deadline: don't leave the remaining fetches running
+        for task in pending:
+            if not task.done():
+                task.cancel()
+
+    return merged
+
+
+class RegisteredCollector:
+    """One collector's entry point, deadline, weight and running totals"""
+
+    def __init__(self, name: str, collect: CollectFn, timeout: float, weight: float,
+                 health: HealthFn = None):
+        self.name = name
+        self.collect = collect
+        self.timeout = timeout
+        self.weight = weight
+        self.health = health
+
+        self.stats = {
+            'runs': 0,
+            'timeouts': 0,
+            'failures': 0,
+            'articles': 0,
+            'total_seconds': 0.0,
+        }
+
+
+class CollectorRegistry:
+    """
+    Collectors keyed by name, run together for each match.
+
+    Every collector runs under its own timeout. When one misses it, it is
+    cancelled and the articles it had already handed over are kept, so a
+    slow source costs at most its deadline rather than its HTTP timeouts.
+    Each article's quality score is scaled by its collector's weight, which
+    lets deduplication and ranking prefer the more trusted source.
+    Articles are either gathered and returned, or streamed batch by batch
+    into a queue as collectors produce them.
+    """
+
+    def __init__(self, config: Dict[str, Dict[str, Any]] = None):
+        self.config = config or COLLECTOR_CONFIG
+        self._collectors: Dict[str, RegisteredCollector] = {}
+
+    def register(self, name: str, collect: CollectFn, timeout: float = None, weight: float = None,
+                 health: HealthFn = None) -> bool:
+        """Add a collector; returns False if the configuration disables it"""
+        config = self.config.get(name, {})
+        if not config.get('enabled', True):
+            logger.info(f"Collector {name} disabled in configuration")
+            return False
+
+        self._collectors[name] = RegisteredCollector(
+            name,
+            collect,
+            timeout if timeout is not None else config.get('timeout', 30),
+            weight if weight is not None else config.get('weight', 1.0),
+            health,
+        )
+        return True
+
+    def unregister(self, name: str):
+        self._collectors.pop(name, None)
+
+    def names(self) -> List[str]:
+        return list(self._collectors)
+
+    def __len__(self) -> int:
+        return len(self._collectors)
+
+    async def collect_all(self, match: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        Run every collector for ``match``.
+
+        Returns the merged articles and a report per collector with its
+        status ('completed', 'timeout' or 'failed'), article yield, latency
+        and weight.
+        """
+        sinks = {name: ArticleSink(name, collector.weight) for name, collector in self._collectors.items()}
+        report = await self._run_all(match, sinks)
+        return [article for sink in sinks.values() for article in sink.articles], report
+
+    async def stream_all(self, match: Dict[str, Any], queue: asyncio.Queue) -> Dict[str, Dict[str, Any]]:
+        """
+        Run every collector for ``match``, putting ``(collector, articles)``
+        batches on ``queue`` as they arrive. Returns the per-collector report.
+        """
+        sinks = {name: ArticleSink(name, collector.weight, queue) for name, collector in self._collectors.items()}
+        return await self._run_all(match, sinks)
+
+    async def _run_all(self, match: Dict[str, Any], sinks: Dict[str, ArticleSink]) -> Dict[str, Dict[str, Any]]:
+        collectors = list(self._collectors.values())
+        reports = await asyncio.gather(*[
+            self._run_collector(collector, match, sinks[collector.name]) for collector in collectors
+        ])
+        return {collector.name: report for collector, report in zip(collectors, reports)}
+
+    async def _run_collector(self, collector: RegisteredCollector, match: Dict[str, Any],
+                             sink: ArticleSink) -> Dict[str, Any]:
+        error = None
+        started = time.perf_counter()
+
+        try:
+            await asyncio.wait_for(collector.collect(match, sink), collector.timeout)
+            status = 'completed'
+        except asyncio.TimeoutError:
+            status = 'timeout'
+            error = f"{collector.name} missed its {collector.timeout}s deadline"
+            logger.warning(f"{error}; keeping {sink.count} articles collected so far")
+        except Exception as e:
+            status = 'failed'
+            error = f"{collector.name} failed: {e}"
+            logger.error(error)
+
+        elapsed = time.perf_counter() - started
+
+        collector.stats['runs'] += 1
+        collector.stats['articles'] += sink.count
+        collector.stats['total_seconds'] += elapsed
+        if status == 'timeout':
+            collector.stats['timeouts'] += 1
+        elif status == 'failed':
+            collector.stats['failures'] += 1
+
+        report = {
+            'status': status,
+            'articles': sink.count,
+            'seconds': round(elapsed, 3),
+            'timeout_seconds': collector.timeout,
+            'weight': collector.weight,
+        }
+        if error:
+            report['error'] = error
+
+        return report
+
+    async def check_health(self) -> Dict[str, Any]:
+        """Health of every collector that provides a check"""
+        results = {}
+        for collector in self._collectors.values():
+            if collector.health is None:
+                continue
+            try:
+                results[collector.name] = await collector.health()
+            except Exception as e:
+                logger.error(f"Health check for {collector.name} failed: {e}")
+                results[collector.name] = {'status': 'error', 'error': str(e)}
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-collector yield, latency and deadline misses"""
+        stats = {}
+        for collector in self._collectors.values():
+            runs = collector.stats['runs']
+            stats[collector.name] = {
+                **collector.stats,
+                'timeout_seconds': collector.timeout,
+                'weight': collector.weight,
+                'avg_articles': collector.stats['articles'] / runs if runs else 0.0,
+                'avg_seconds': collector.stats['total_seconds'] / runs if runs else 0.0,
+                'timeout_rate': collector.stats['timeouts'] / runs if runs else 0.0,
+            }
+        return stats
@@ -0,0 +1,320 @@
+"""
+Relevance Router - Multi-match relevance scoring in a single pass
+Compiles the terms of every in-flight match into one automaton and routes entries to matches
+"""
+
+import logging
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..config import TEAM_VARIATIONS
+
+logger = logging.getLogger(__name__)
+
+# Per-collector weights and match-independent terms, mirroring each collector's scoring
+RELEVANCE_PROFILES = {
+    'rss': {
+        'weights': {'team': 0.4, 'variation': 0.2, 'match': 0.6, 'keyword': 0.1, 'exclude': -0.3, 'title_team': 0.2},
+        'keywords': [
+            'match preview', 'team news', 'injury report', 'starting eleven',
+            'head to head', 'prediction', 'betting odds', 'live stream',
+            'match report', 'post match', 'highlights', 'goals', 'result'
+        ],
+        'exclude_terms': ['women', 'youth', 'u21', 'u19', 'reserves', 'academy'],
+    },
+    'api': {
+        'weights': {'team': 0.5, 'variation': 0.2, 'match': 0.7, 'keyword': 0.1, 'exclude': -0.4, 'title_team': 0.3},
+        'keywords': [
+            'football', 'soccer', 'match', 'game', 'fixture',
+            'preview', 'prediction', 'team news', 'injury',
+            'lineup', 'starting eleven', 'tactics'
+        ],
+        'exclude_terms': ['women', 'youth', 'u21', 'u19', 'reserves'],
+    },
+    'scraper': {
+        'weights': {'team': 0.5, 'variation': 0.3, 'match': 0.7, 'keyword': 0.1, 'title_team': 0.3},
+        'keywords': [
+            'match', 'game', 'fixture', 'preview', 'report', 'news',
+            'team news', 'injury', 'lineup', 'squad', 'tactics'
+        ],
+    },
+    'nitter': {
+        'weights': {'team': 0.5, 'variation': 0.3, 'match': 0.7, 'keyword': 0.1, 'hashtag': 0.2, 'indicator': 0.3},
+        'keywords': [
+            'match', 'game', 'fixture', 'vs', 'v', 'preview', 'prediction',
+            'team news', 'lineup', 'starting eleven', 'injury', 'goal',
+            'result', 'highlights', 'final', 'live'
+        ],
+        'hashtags': ['#football', '#soccer', '#premierleague', '#championsleague'],
+        # Counted once however many appear
+        'indicators': ['breaking', 'confirmed', 'official', 'just in'],
+    },
+}
+
+# Categories that tie a term to a specific match
+MATCH_CATEGORIES = ('team', 'variation', 'match', 'hashtag')
+
+
+def build_match_terms(home_team: str, away_team: str) -> Dict[str, List[str]]:
+    """Terms identifying one match, by category"""
+    return {
+        'team': [home_team, away_team],
+        'variation': TEAM_VARIATIONS.get(home_team, [home_team]) + TEAM_VARIATIONS.get(away_team, [away_team]),
+        'match': [
+            f"{home_team} vs {away_team}",
+            f"{away_team} vs {home_team}",
+            f"{home_team} v {away_team}",
+            f"{away_team} v {home_team}",
+        ],
+        'hashtag': [
+            f"#{home_team.replace(' ', '')}",
+            f"#{away_team.replace(' ', '')}",
+        ],
+    }
+
+
+def _trie_pattern(node: Dict[str, Any]) -> str:
+    """Regex for a character trie; greedy optionals prefer the longest term"""
+    terminal = '' in node
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+
+    if not branches:
+        return ''
+
+    if len(branches) == 1:
+        pattern = branches[0]
+        if terminal:
+            pattern = f"(?:{pattern})?" if len(branches[0]) > 1 else f"{pattern}?"
+        return pattern
+
+    pattern = f"(?:{'|'.join(branches)})"
+    return f"{pattern}?" if terminal else pattern
+
+
+def _is_boundary_prefix(prefix: str, term: str) -> bool:
+    """Whether ``prefix`` is a whole-word prefix of ``term``"""
+    if not term.startswith(prefix):
+        return False
+    if len(prefix) == len(term):
+        return True
+    return not (term[len(prefix)].isalnum() or term[len(prefix)] == '_')
+
+
+class RelevanceRouter:
+    """
+    Scores text against every registered match with one regex scan.
+
+    Terms from all in-flight matches and all collector profiles are compiled
+    into a single trie-shaped pattern with word boundaries. Scanning returns
+    the longest term at each position; shorter whole-word prefixes of that
+    term are added from a precomputed table so overlapping terms still count.
+
+    Exclude terms are matched as word prefixes by a separate pattern, so
+    "womens" or "u21s" still excludes, as the collectors' substring checks
+    did.
+    """
+
+    def __init__(self):
+        self._matches: Dict[str, Dict[str, List[str]]] = {}
+        self._refcounts: Dict[str, int] = defaultdict(int)
+
+        self._pattern: Optional[re.Pattern] = None
+        self._implied: Dict[str, List[str]] = {}
+        self._match_roles: Dict[str, List[Tuple[str, str]]] = {}
+        self._profile_roles: Dict[str, List[Tuple[str, str]]] = {}
+        self._exclude_pattern: Optional[re.Pattern] = None
+        self._exclude_profiles: Dict[str, List[str]] = {}
+        self._dirty = True
+
+        # Bumped whenever the registered matches change
+        self.version = 0
+        self._route_cache: Dict[Tuple[str, str], Tuple[int, Any, List[Dict[str, float]]]] = {}
+
+        self.stats = {
+            'compiles': 0,
+            'entries_scanned': 0,
+            'entries_routed': 0,
+            'route_cache_hits': 0,
+        }
+
+    def register_match(self, match_id: Optional[str], home_team: str, away_team: str) -> str:
+        """Add a match to the automaton; returns its id (derived from the teams if not given)"""
+        match_id = match_id or f"{home_team}|{away_team}"
+
+        if match_id not in self._matches:
+            self._matches[match_id] = build_match_terms(home_team, away_team)
+            self._invalidate()
+            logger.debug(f"Registered {match_id} for relevance routing ({len(self._matches)} active)")
+
+        self._refcounts[match_id] += 1
+        return match_id
+
+    def unregister_match(self, match_id: str):
+        """Drop a match once its last aggregation has finished"""
+        if match_id not in self._matches:
+            return
+
+        self._refcounts[match_id] -= 1
+        if self._refcounts[match_id] <= 0:
+            del self._matches[match_id]
+            del self._refcounts[match_id]
+            self._invalidate()
+
+    def _invalidate(self):
+        self._dirty = True
+        self.version += 1
+        self._route_cache.clear()
+
+    def _compile(self):
+        """Rebuild the pattern and term role tables"""
+        match_roles = defaultdict(list)
+        profile_roles = defaultdict(list)
+        exclude_profiles = defaultdict(list)
+
+        for match_id, terms in self._matches.items():
+            for category, values in terms.items():
+                for value in values:
+                    match_roles[value.lower()].append((match_id, category))
+
+        for profile, config in RELEVANCE_PROFILES.items():
+            for category, key in (('keyword', 'keywords'), ('hashtag', 'hashtags'), ('indicator', 'indicators')):
+                for value in config.get(key, []):
+                    profile_roles[value.lower()].append((profile, category))
+            for value in config.get('exclude_terms', []):
+                exclude_profiles[value.lower()].append(profile)
+
+        terms = sorted(set(match_roles) | set(profile_roles))
+
+        trie: Dict[str, Any] = {}
+        for term in terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        self._pattern = re.compile(rf"(?<!\w)(?=({_trie_pattern(trie)})(?!\w))") if terms else None
+        self._implied = {
+            term: [other for other in terms if _is_boundary_prefix(other, term)]
+            for term in terms
+        }
+        self._match_roles = dict(match_roles)
+        self._profile_roles = dict(profile_roles)
+
+        # Longest first, so a term that extends another is the one reported
+        excludes = sorted(exclude_profiles, key=len, reverse=True)
+        self._exclude_pattern = re.compile(
+            rf"(?<!\w)({'|'.join(re.escape(term) for term in excludes)})"
+        ) if excludes else None
+        self._exclude_profiles = dict(exclude_profiles)
+        self._dirty = False
+        self.stats['compiles'] += 1
+
+        logger.debug(f"Compiled relevance automaton: {len(terms)} terms, {len(self._matches)} matches")
+
+    def _scan(self, text: str) -> set:
+        """Distinct terms present in already-lowercased text"""
+        found = set()
+        for longest in self._pattern.findall(text):
+            found.update(self._implied[longest])
+        return found
+
+    def route(self, profile: str, title: str, *parts: str) -> Dict[str, float]:
+        """Score one entry against every registered match; returns match_id -> score"""
+        if self._dirty:
+            self._compile()
+        if self._pattern is None or not self._matches:
+            return {}
+
+        self.stats['entries_scanned'] += 1
+        config = RELEVANCE_PROFILES[profile]
+        weights = config['weights']
+
+        text = ' '.join((title,) + parts).lower()
+        found = self._scan(text)
+
+        # Terms per match and category, counted once each like the per-match loops did
+        hits: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        for term in found:
+            for match_id, category in self._match_roles.get(term, ()):
+                hits[match_id][category] += 1
+
+        if not hits:
+            return {}
+
+        shared_score = 0.0
+        has_indicator = False
+        for term in found:
+            for term_profile, category in self._profile_roles.get(term, ()):
+                if term_profile != profile:
+                    continue
+                if category == 'indicator':
+                    has_indicator = True
+                else:
+                    shared_score += weights.get(category, 0.0)
+        if has_indicator:
+            shared_score += weights.get('indicator', 0.0)
+
+        if weights.get('exclude') and self._exclude_pattern is not None:
+            for term in set(self._exclude_pattern.findall(text)):
+                if profile in self._exclude_profiles[term]:
+                    shared_score += weights['exclude']
+
+        title_hits = defaultdict(int)
+        if weights.get('title_team'):
+            title_lower = title.lower()
+            for term in self._scan(title_lower) if parts else found:
+                for match_id, category in self._match_roles.get(term, ()):
+                    if category == 'team':
+                        title_hits[match_id] += 1
+
+        scores = {}
+        for match_id, categories in hits.items():
+            score = shared_score
+            for category in MATCH_CATEGORIES:
+                score += weights.get(category, 0.0) * categories.get(category, 0)
+            score += weights.get('title_team', 0.0) * title_hits.get(match_id, 0)
+            scores[match_id] = min(score, 1.0)
+
+        self.stats['entries_routed'] += 1
+        return scores
+
+    def score(self, match_id: str, profile: str, title: str, *parts: str) -> float:
+        """Relevance of one entry to a single match"""
+        return self.route(profile, title, *parts).get(match_id, 0.0)
+
+    def route_entries(self, feed_key: str, entries: List[Dict[str, Any]], profile: str,
+                      fields: Iterable[str] = ('title', 'summary')) -> List[Dict[str, float]]:
+        """
+        Route every entry of a shared feed, once per feed refresh.
+
+        Results are cached until the feed's entry list is replaced or the set
+        of registered matches changes, so concurrent aggregations reading the
+        same feed reuse one scan.
+        """
+        cache_key = (feed_key, profile)
+        cached = self._route_cache.get(cache_key)
+        if cached and cached[0] == self.version and cached[1] is entries:
+            self.stats['route_cache_hits'] += 1
+            return cached[2]
+
+        fields = list(fields)
+        routes = [
+            self.route(profile, *[(entry.get(field, '') or '').strip() for field in fields])
+            for entry in entries
+        ]
+        self._route_cache[cache_key] = (self.version, entries, routes)
+        return routes
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get routing statistics"""
+        return {
+            **self.stats,
+            'active_matches': len(self._matches),
+            'terms': len(self._implied),
+            'version': self.version,
+        }
+
+
+# Process-wide instance shared by every collector
+shared_relevance_router = RelevanceRouter()
@@ -5,7 +5,7 @@ Collects news from RSS feeds across multiple football sources
 
 import asyncio
 import aiohttp
-import feedparser
+import functools
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
@@ -14,17 +14,37 @@ import hashlib
 import re
 
 from ..config import RSS_SOURCES, RATE_LIMITS, DEFAULT_HEADERS, TEAM_VARIATIONS
+from .feed_cache import FeedCache, shared_feed_cache
+from .feed_scheduler import FeedScheduler
+from .feed_state import FeedStateStore, shared_feed_state
+from .http_pool import HTTPClientPool
+from .rate_limiter import HostRateLimiter, shared_rate_limiter
+from .registry import ArticleSink, gather_into
+from .timestamps import TimestampParser, as_utc, shared_timestamp_parser
+from .relevance_router import RelevanceRouter, shared_relevance_router
 
 logger = logging.getLogger(__name__)
 
 class RSSCollector:
-    def __init__(self):
+    def __init__(self, feed_cache: FeedCache = None, feed_state: FeedStateStore = None,
+                 http_pool: HTTPClientPool = None, rate_limiter: HostRateLimiter = None,
+                 relevance_router: RelevanceRouter = None, timestamp_parser: TimestampParser = None):
         self.sources = RSS_SOURCES
         self.headers = DEFAULT_HEADERS.copy()
-        self.rate_limiter = asyncio.Semaphore(RATE_LIMITS['rss_feeds']['concurrent_requests'])
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        self.relevance_router = relevance_router or shared_relevance_router
         self.session = None
+        self.http_pool = http_pool
+        self.feed_cache = feed_cache or shared_feed_cache
+        self.feed_state = feed_state or shared_feed_state
+        self.timestamps = timestamp_parser or shared_timestamp_parser
         
     async def __aenter__(self):
+        if self.http_pool:
+            # Borrow the application-wide session; the pool owns its lifetime
+            self.session = self.http_pool.session
+            return self
+        
         timeout = aiohttp.ClientTimeout(total=30)
         self.session = aiohttp.ClientSession(
             timeout=timeout,
@@ -34,37 +54,34 @@ class RSSCollector:
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and not self.http_pool:
             await self.session.close()
     
-    async def collect_for_match(self, home_team: str, away_team: str, match_date: datetime) -> List[Dict[str, Any]]:
-        """Collect RSS articles relevant to a specific match"""
+    async def collect_for_match(self, home_team: str, away_team: str, match_date: datetime,
+                               match_id: str = None, sink: ArticleSink = None) -> List[Dict[str, Any]]:
+        """Collect RSS articles relevant to a specific match; each feed's articles go to ``sink`` as it finishes"""
         queries = self._build_queries(home_team, away_team, match_date)
+        queries['match_id'] = self.relevance_router.register_match(match_id, home_team, away_team)
         
-        # Get relevant feeds based on teams
-        relevant_feeds = self._get_relevant_feeds(home_team, away_team)
-        
-        # Collect from all feeds
-        tasks = []
-        for source_name, feed_url in relevant_feeds.items():
-            task = self._collect_from_feed(source_name, feed_url, queries)
-            tasks.append(task)
-        
-        # Execute all tasks concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Merge and deduplicate results
-        all_articles = []
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Error collecting from feed: {result}")
-                continue
-            all_articles.extend(result)
-        
-        # Sort by relevance and recency
-        all_articles.sort(key=lambda x: (x['relevance_score'], x['published_at']), reverse=True)
-        
-        return all_articles
+        try:
+            # Get relevant feeds based on teams
+            relevant_feeds = self._get_relevant_feeds(home_team, away_team)
+            
+            # Collect from all feeds
+            tasks = []
+            for source_name, feed_url in relevant_feeds.items():
+                task = self._collect_from_feed(source_name, feed_url, queries)
+                tasks.append(task)
+            
+            # Execute all tasks concurrently
+            all_articles = await gather_into(tasks, sink, 'RSS feed')
+            
+            # Sort by relevance and recency
+            all_articles.sort(key=lambda x: (x['relevance_score'], x['published_at']), reverse=True)
+            
+            return all_articles
+        finally:
+            self.relevance_router.unregister_match(queries['match_id'])
     
     def _build_queries(self, home_team: str, away_team: str, match_date: datetime) -> Dict[str, Any]:
         """Build comprehensive search queries"""
@@ -177,42 +194,70 @@ class RSSCollector:
         return league_feeds
     
     async def _collect_from_feed(self, source_name: str, feed_url: str, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Collect and filter articles from a single RSS feed"""
-        async with self.rate_limiter:
-            try:
-                # Add random delay to be respectful
-                await asyncio.sleep(0.5)
-                
-                # Fetch RSS feed
-                async with self.session.get(feed_url) as response:
-                    if response.status != 200:
-                        logger.warning(f"Failed to fetch {source_name}: HTTP {response.status}")
-                        return []
-                    
-                    content = await response.text()
-                
-                # Parse RSS feed
-                feed = feedparser.parse(content)
-                
-                if not feed.entries:
-                    logger.warning(f"No entries found in {source_name}")
-                    return []
-                
-                # Filter and process entries
-                articles = []
-                for entry in feed.entries:
-                    article = self._process_entry(entry, source_name, queries)
-                    if article:
-                        articles.append(article)
-                
-                logger.info(f"Collected {len(articles)} articles from {source_name}")
-                return articles
-                
-            except Exception as e:
-                logger.error(f"Error collecting from {source_name}: {e}")
-                return []
+        """Filter cached entries of a single RSS feed for the match"""
+        try:
+            # Feed is downloaded and parsed once, then shared across matches
+            entries = await self.feed_cache.get_entries(
+                feed_url, functools.partial(self._fetch_shared, source_name, feed_url)
+            )
+            
+            # One scan per feed refresh scores every entry against every in-flight match
+            routes = self.relevance_router.route_entries(feed_url, entries, 'rss')
+            
+            # Filter and process entries
+            articles = []
+            for entry, scores in zip(entries, routes):
+                if queries['match_id'] not in scores:
+                    continue
+                article = self._process_entry(entry, source_name, queries, scores[queries['match_id']])
+                if article:
+                    articles.append(article)
+            
+            logger.info(f"Collected {len(articles)} articles from {source_name}")
+            return articles
+            
+        except Exception as e:
+            logger.error(f"Error collecting from {source_name}: {e}")
+            return []
+    
+    async def _fetch_feed_entries(self, source_name: str, feed_url: str,
+                                  session: aiohttp.ClientSession = None) -> Optional[List[Any]]:
+        """Download and parse a single RSS feed, returning None on failure"""
+        try:
+            # Paced per host, shared with every other collector
+            await self.rate_limiter.acquire(feed_url, 'rss_feeds')
+            
+            # Conditional GET - a 304 reuses the stored entries
+            return await self.feed_state.fetch_entries(session or self.session, feed_url, source_name)
+            
+        except Exception as e:
+            logger.error(f"Error fetching {source_name}: {e}")
+            return None
     
-    def _process_entry(self, entry: Any, source_name: str, queries: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def schedule_feeds(self, scheduler: FeedScheduler):
+        """Hand every feed to the background scheduler so aggregations read already-fresh entries"""
+        for source_name, feed_url in self.sources.items():
+            scheduler.register_feed(
+                feed_url, functools.partial(self._fetch_shared, source_name, feed_url), label=source_name
+            )
+        scheduler.set_fixture_feeds(lambda home_team, away_team: self._get_relevant_feeds(home_team, away_team).values())
+    
+    async def _fetch_shared(self, source_name: str, feed_url: str) -> Optional[List[Any]]:
+        """
+        Fetch for the feed cache and scheduler, independent of any aggregation's session.
+        
+        Other aggregations may still be waiting on the fetch after this
+        collector's own session has closed.
+        """
+        if self.http_pool:
+            return await self._fetch_feed_entries(source_name, feed_url, self.http_pool.session)
+        
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(timeout=timeout, headers=self.headers) as session:
+            return await self._fetch_feed_entries(source_name, feed_url, session)
+    
+    def _process_entry(self, entry: Any, source_name: str, queries: Dict[str, Any],
+                       relevance_score: float = None) -> Optional[Dict[str, Any]]:
         """Process a single RSS entry"""
         try:
             # Extract basic info
@@ -224,12 +269,13 @@ class RSSCollector:
                 return None
             
             # Check relevance
-            relevance_score = self._calculate_relevance(title, summary, queries)
+            if relevance_score is None:
+                relevance_score = self._calculate_relevance(title, summary, queries)
             if relevance_score < 0.3:  # Minimum relevance threshold
                 return None
             
             # Parse publication date
-            pub_date = self._parse_date(entry.get('published', ''))
+            pub_date = self._parse_date(entry.get('published', ''), source_name)
             if not pub_date:
                 pub_date = datetime.utcnow()
             
@@ -269,41 +315,7 @@ class RSSCollector:
     
     def _calculate_relevance(self, title: str, summary: str, queries: Dict[str, Any]) -> float:
         """Calculate relevance score based on content matching"""
-        text = f"{title} {summary}".lower()
-        score = 0.0
-        
-        # Check for direct team mentions
-        for term in queries['primary_terms']:
-            if term.lower() in text:
-                score += 0.4
-        
-        # Check for team variations
-        for variation in queries['team_variations']:
-            if variation.lower() in text:
-                score += 0.2
-        
-        # Check for match-specific terms
-        for term in queries['match_terms']:
-            if term.lower() in text:
-                score += 0.6
-        
-        # Check for football keywords
-        for keyword in queries['keywords']:
-            if keyword.lower() in text:
-                score += 0.1
-        
-        # Penalize excluded terms
-        for exclude_term in queries['exclude_terms']:
-            if exclude_term.lower() in text:
-                score -= 0.3
-        
-        # Bonus for title matches
-        title_lower = title.lower()
-        for term in queries['primary_terms']:
-            if term.lower() in title_lower:
-                score += 0.2
-        
-        return min(score, 1.0)
+        return self.relevance_router.score(queries['match_id'], 'rss', title, summary)
     
     def _calculate_quality_score(self, source_name: str, title: str, summary: str) -> float:
         """Calculate quality score based on source and content"""
@@ -327,41 +339,15 @@ class RSSCollector:
         
         return min(base_score, 1.0)
     
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """Parse various date formats"""
-        if not date_str:
-            return None
-        
-        # Try feedparser's built-in parser first
-        try:
-            import email.utils
-            parsed = email.utils.parsedate_tz(date_str)
-            if parsed:
-                return datetime(*parsed[:6])
-        except:
-            pass
-        
-        # Try common formats
-        formats = [
-            '%a, %d %b %Y %H:%M:%S %z',
-            '%a, %d %b %Y %H:%M:%S %Z',
-            '%Y-%m-%dT%H:%M:%S%z',
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d',
-        ]
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        
-        return None
+    def _parse_date(self, date_str: str, source_name: str = None) -> Optional[datetime]:
+        """Parse an entry date to naive UTC with the shared parser"""
+        return self.timestamps.parse(date_str, source_name)
     
     def _is_date_relevant(self, pub_date: datetime, date_range: tuple) -> bool:
         """Check if publication date is within relevant range"""
+        # Aware and naive datetimes don't compare; both sides become naive UTC
         start_date, end_date = date_range
-        return start_date <= pub_date <= end_date
+        return as_utc(start_date) <= as_utc(pub_date) <= as_utc(end_date)
     
     def _generate_hash(self, title: str, link: str) -> str:
         """Generate unique hash for deduplication"""
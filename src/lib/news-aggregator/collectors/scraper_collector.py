@@ -7,18 +7,11 @@ import asyncio
 import aiohttp
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import hashlib
 from urllib.parse import urljoin, urlparse
 import re
-from bs4 import BeautifulSoup
-
-try:
-    from newspaper import Article
-    NEWSPAPER_AVAILABLE = True
-except ImportError:
-    NEWSPAPER_AVAILABLE = False
-    logging.warning("Newspaper3k not available. Article extraction will be limited.")
+from collections import Counter, defaultdict
 
 try:
     from pygooglenews import GoogleNews
@@ -27,16 +20,51 @@ except ImportError:
     GOOGLE_NEWS_AVAILABLE = False
     logging.warning("PyGoogleNews not available. Google News scraping will be disabled.")
 
-from ..config import CLUB_WEBSITES, RATE_LIMITS, DEFAULT_HEADERS, TEAM_VARIATIONS
+from ..config import CLUB_WEBSITES, RATE_LIMITS, DEFAULT_HEADERS, TEAM_VARIATIONS, SCRAPER_CONFIG
+from .content_cache import ContentCache, canonical_url, shared_content_cache
+from .html_extraction import PARSER_BACKEND, extract_article_text, extract_listing_items
+from .http_pool import HTTPClientPool
+from .rate_limiter import HostRateLimiter, shared_rate_limiter
+from .relevance_router import RelevanceRouter, shared_relevance_router
+from .registry import ArticleSink, gather_into
+from .timestamps import RELATIVE, TimestampParser, as_utc, shared_timestamp_parser
+from .site_profiles import SiteProfileStore, shared_site_profiles
+from .worker_pool import WorkerPool, shared_worker_pool
 
 logger = logging.getLogger(__name__)
 
+# Common news page paths tried on club websites without a learned profile
+CLUB_NEWS_PATHS = ['/news', '/en/news', '/news/first-team', '/first-team/news']
+
 class ScraperCollector:
-    def __init__(self):
+    def __init__(self, http_pool: HTTPClientPool = None, rate_limiter: HostRateLimiter = None,
+                 relevance_router: RelevanceRouter = None, worker_pool: WorkerPool = None,
+                 site_profiles: SiteProfileStore = None, content_cache: ContentCache = None,
+                 timestamp_parser: TimestampParser = None):
         self.club_websites = CLUB_WEBSITES
         self.headers = DEFAULT_HEADERS.copy()
-        self.rate_limiter = asyncio.Semaphore(RATE_LIMITS['web_scraping']['concurrent_requests'])
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        self.relevance_router = relevance_router or shared_relevance_router
+        self.worker_pool = worker_pool or shared_worker_pool
+        self.site_profiles = site_profiles or shared_site_profiles
+        self.content_cache = content_cache or shared_content_cache
+        self.timestamps = timestamp_parser or shared_timestamp_parser
         self.session = None
+        self.http_pool = http_pool
+        self.config = SCRAPER_CONFIG
+        
+        # In-flight request slots per host; pacing itself is the rate limiter's job
+        self.host_slots: Dict[str, asyncio.Semaphore] = {}
+        
+        # HTML parsing runs on the worker pool; times are per page, measured in the worker
+        self.stats = {
+            'pages_parsed': 0,
+            'articles_parsed': 0,
+            'parse_failures': 0,
+            'listing_parse_seconds': 0.0,
+            'article_parse_seconds': 0.0,
+            'max_page_parse_seconds': 0.0,
+        }
         
         # Initialize Google News if available
         self.google_news = None
@@ -72,6 +100,11 @@ class ScraperCollector:
         }
     
     async def __aenter__(self):
+        if self.http_pool:
+            # Borrow the application-wide session; the pool owns its lifetime
+            self.session = self.http_pool.session
+            return self
+        
         timeout = aiohttp.ClientTimeout(total=30)
         self.session = aiohttp.ClientSession(
             timeout=timeout,
@@ -81,41 +114,38 @@ class ScraperCollector:
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and not self.http_pool:
             await self.session.close()
     
-    async def collect_for_match(self, home_team: str, away_team: str, match_date: datetime) -> List[Dict[str, Any]]:
-        """Collect articles by scraping club websites and Google News"""
+    async def collect_for_match(self, home_team: str, away_team: str, match_date: datetime,
+                               match_id: str = None, sink: ArticleSink = None) -> List[Dict[str, Any]]:
+        """Collect articles by scraping club websites and Google News; each source's articles go to ``sink``"""
         queries = self._build_queries(home_team, away_team, match_date)
+        queries['match_id'] = self.relevance_router.register_match(match_id, home_team, away_team)
         
-        # Collect from different sources
-        tasks = []
-        
-        # Club websites
-        tasks.append(self._scrape_club_websites(queries))
-        
-        # Google News
-        if self.google_news:
-            tasks.append(self._scrape_google_news(queries))
-        
-        # Additional news websites
-        tasks.append(self._scrape_general_news_sites(queries))
-        
-        # Execute all tasks
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Merge results
-        all_articles = []
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Scraping task failed: {result}")
-                continue
-            all_articles.extend(result)
-        
-        # Sort by relevance and quality
-        all_articles.sort(key=lambda x: (x['relevance_score'], x['quality_score']), reverse=True)
-        
-        return all_articles
+        try:
+            # Collect from different sources
+            tasks = []
+            
+            # Club websites
+            tasks.append(self._scrape_club_websites(queries))
+            
+            # Google News
+            if self.google_news:
+                tasks.append(self._scrape_google_news(queries))
+            
+            # Additional news websites
+            tasks.append(self._scrape_general_news_sites(queries))
+            
+            # Execute all tasks
+            all_articles = await gather_into(tasks, sink, 'Scraping')
+            
+            # Sort by relevance and quality
+            all_articles.sort(key=lambda x: (x['relevance_score'], x['quality_score']), reverse=True)
+            
+            return all_articles
+        finally:
+            self.relevance_router.unregister_match(queries['match_id'])
     
     def _build_queries(self, home_team: str, away_team: str, match_date: datetime) -> Dict[str, Any]:
         """Build search queries for scraping"""
@@ -148,174 +178,289 @@ class ScraperCollector:
     
     async def _scrape_club_websites(self, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Scrape official club websites"""
-        articles = []
+        tasks = [
+            self._scrape_single_club_website(self.club_websites[team], team, queries)
+            for team in queries['teams']
+            if team in self.club_websites
+        ]
         
-        for team in queries['teams']:
-            if team in self.club_websites:
-                club_url = self.club_websites[team]
-                team_articles = await self._scrape_single_club_website(club_url, team, queries)
-                articles.extend(team_articles)
+        articles = []
+        for team_articles in await asyncio.gather(*tasks):
+            articles.extend(team_articles)
         
         return articles
     
-    async def _scrape_single_club_website(self, base_url: str, team: str, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Scrape a single club website"""
-        async with self.rate_limiter:
-            try:
-                # Add respectful delay
-                await asyncio.sleep(RATE_LIMITS['web_scraping']['delay_between_requests'])
-                
-                # Common news page paths
-                news_paths = ['/news', '/en/news', '/news/first-team', '/first-team/news']
-                
-                articles = []
-                
-                for path in news_paths:
-                    news_url = urljoin(base_url, path)
-                    
-                    try:
-                        async with self.session.get(news_url) as response:
-                            if response.status == 200:
-                                html = await response.text()
-                                page_articles = await self._extract_articles_from_page(
-                                    html, news_url, team, queries
-                                )
-                                articles.extend(page_articles)
-                                
-                                # Don't scrape too many pages from the same site
-                                if len(articles) >= 20:
-                                    break
-                                    
-                    except Exception as e:
-                        logger.warning(f"Failed to scrape {news_url}: {e}")
-                        continue
-                
-                # Get full article content for relevant articles
-                for article in articles:
-                    if article.get('link'):
-                        full_content = await self._extract_full_article_content(article['link'])
-                        if full_content:
-                            article['content'] = full_content
-                
-                logger.info(f"Scraped {len(articles)} articles from {team}")
-                return articles
-                
-            except Exception as e:
-                logger.error(f"Failed to scrape {team} website: {e}")
-                return []
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent requests to one host"""
+        host = urlparse(url).netloc.lower()
+        if host not in self.host_slots:
+            self.host_slots[host] = asyncio.Semaphore(RATE_LIMITS['web_scraping']['concurrent_requests'])
+        return self.host_slots[host]
+    
+    async def _fetch_html(self, url: str) -> Optional[str]:
+        """GET a page, holding a host slot only for the request itself"""
+        # Paced per host (and robots.txt crawl-delay)
+        await self.rate_limiter.acquire(url, 'web_scraping', session=self.session)
+        
+        async with self._host_slot(url):
+            async with self.session.get(url) as response:
+                if response.status != 200:
+                    return None
+                return await response.text()
     
-    async def _extract_articles_from_page(self, html: str, page_url: str, team: str, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Extract articles from a webpage"""
+    async def _scrape_single_club_website(self, base_url: str, team: str, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Scrape a single club website within the per-site deadline"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config['site_deadline']
+        domain = urlparse(base_url).netloc.lower()
+        
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            articles = []
+            # Go straight to what worked last time; rediscover only when it stops producing items
+            profile = self.site_profiles.get(domain)
+            if profile:
+                articles, learned, reachable = await self._scrape_news_paths(
+                    base_url, team, queries, profile['news_paths'], profile, deadline
+                )
+                if learned:
+                    self.site_profiles.learn(domain, {
+                        **profile,
+                        **{field: value for field, value in learned.items() if value and field != 'news_paths'}
+                    })
+                elif reachable and loop.time() < deadline:
+                    self.site_profiles.invalidate(domain)
+                    profile = None
             
-            # Try different selectors to find news items
-            news_items = []
-            for selector in self.news_selectors['generic']:
-                items = soup.select(selector)
-                if items:
-                    news_items.extend(items[:10])  # Limit to 10 items per selector
-                    break
+            if not profile:
+                articles, learned, _ = await self._scrape_news_paths(
+                    base_url, team, queries, CLUB_NEWS_PATHS, None, deadline
+                )
+                if learned:
+                    self.site_profiles.learn(domain, learned)
             
-            for item in news_items:
-                try:
-                    # Extract title
-                    title_elem = None
-                    for selector in self.news_selectors['title_selectors']:
-                        title_elem = item.select_one(selector)
-                        if title_elem:
-                            break
-                    
-                    if not title_elem:
-                        continue
-                    
-                    title = title_elem.get_text(strip=True)
-                    
-                    # Check relevance
-                    relevance_score = self._calculate_relevance(title, '', queries)
-                    if relevance_score < 0.3:
-                        continue
-                    
-                    # Extract link
-                    link_elem = item.select_one('a')
-                    if not link_elem:
-                        continue
-                    
-                    link = link_elem.get('href', '')
-                    if link:
-                        # Make absolute URL
-                        link = urljoin(page_url, link)
-                    
-                    # Extract summary/description
-                    summary = ''
-                    for selector in self.news_selectors['content_selectors']:
-                        summary_elem = item.select_one(selector)
-                        if summary_elem:
-                            summary = summary_elem.get_text(strip=True)
-                            break
-                    
-                    # Extract date
-                    pub_date = self._extract_date_from_element(item)
-                    
-                    # Check date relevance
-                    if pub_date and not self._is_date_relevant(pub_date, queries['date_range']):
-                        continue
-                    
-                    article = {
-                        'title': title,
-                        'summary': summary,
-                        'content': summary,  # Will be enhanced later
-                        'link': link,
-                        'author': team,  # Use team as author for club websites
-                        'published_at': pub_date or datetime.utcnow(),
-                        'source': f"{team} Official",
-                        'source_type': 'scrape',
-                        'relevance_score': relevance_score,
-                        'quality_score': 0.85,  # Official club sources have high quality
-                        'hash': self._generate_hash(title, link),
-                        'collected_at': datetime.utcnow(),
-                        'language': 'en',
-                        'tags': ['official', 'club', team.lower().replace(' ', '_')],
-                        'scrape_info': {
-                            'source_url': page_url,
-                            'scrape_method': 'club_website'
-                        }
-                    }
-                    
-                    articles.append(article)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to extract article from item: {e}")
-                    continue
+            # Get full article content for relevant articles
+            await self._extract_full_contents(articles, deadline)
             
+            logger.info(f"Scraped {len(articles)} articles from {team}")
             return articles
             
         except Exception as e:
-            logger.error(f"Failed to extract articles from page: {e}")
+            logger.error(f"Failed to scrape {team} website: {e}")
             return []
     
+    async def _scrape_news_paths(self, base_url: str, team: str, queries: Dict[str, Any], paths: List[str],
+                                 profile: Optional[Dict[str, Any]],
+                                 deadline: float) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]], bool]:
+        """
+        Scrape listing pages under ``base_url``.
+        
+        Returns the articles, the profile learned from the pages that
+        produced items (None if none did) and whether any page loaded with a 200.
+        """
+        loop = asyncio.get_running_loop()
+        articles = []
+        learned = None
+        productive_paths = []
+        reachable = False
+        
+        for path in paths:
+            news_url = urljoin(base_url, path)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            
+            try:
+                html = await asyncio.wait_for(self._fetch_html(news_url), timeout=remaining)
+                # Only a page that loads counts; a 429 or 503 says nothing about the profile
+                if html is not None:
+                    reachable = True
+                if html:
+                    page_articles, page_profile = await self._extract_articles_from_page(
+                        html, news_url, team, queries, profile
+                    )
+                    articles.extend(page_articles)
+                    
+                    if page_profile:
+                        learned = learned or page_profile
+                        productive_paths.append(path)
+                    
+                    # Don't scrape too many pages from the same site
+                    if len(articles) >= self.config['max_articles_per_site']:
+                        break
+                        
+            except Exception as e:
+                logger.warning(f"Failed to scrape {news_url}: {e}")
+                continue
+        
+        if learned:
+            learned['news_paths'] = productive_paths
+        return articles, learned, reachable
+    
+    async def _extract_full_contents(self, articles: List[Dict[str, Any]], deadline: float):
+        """Fetch full content for articles concurrently, keeping whatever finishes by the deadline"""
+        # One fetch per canonical URL, none for links extracted recently
+        by_url = defaultdict(list)
+        for article in articles:
+            if article.get('link'):
+                by_url[canonical_url(article['link'])].append(article)
+        
+        tasks = {}
+        for url, group in by_url.items():
+            cached = self.content_cache.get(url)
+            if cached is None:
+                tasks[asyncio.ensure_future(self._extract_full_article_content(group[0]['link']))] = group
+            elif cached:
+                for article in group:
+                    article['content'] = cached
+        
+        if not tasks:
+            return
+        
+        timeout = max(0.0, deadline - asyncio.get_running_loop().time())
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.info(f"Site deadline reached: {len(done)}/{len(tasks)} full articles extracted")
+        
+        for task in done:
+            full_content = task.result()
+            if full_content:
+                for article in tasks[task]:
+                    article['content'] = full_content
+    
+    async def _parse_listing(self, html: str, page_url: str, item_selectors: List[str], title_selectors: List[str],
+                             summary_selectors: List[str], limit: int,
+                             profile: Optional[Dict[str, Any]] = None) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Parse a listing page on the worker pool into plain item records.
+        
+        With a learned profile only its selectors are applied. Returns the
+        items, each with ``published_at`` parsed, and the profile this page
+        supports (None when it yielded no items).
+        """
+        date_selectors = self.news_selectors['date_selectors']
+        date_format = None
+        if profile:
+            item_selectors, title_selectors, summary_selectors, date_selectors = [
+                [profile[field]] if profile.get(field) else []
+                for field in ('item_selector', 'title_selector', 'summary_selector', 'date_selector')
+            ]
+            date_format = profile.get('date_format')
+        
+        try:
+            result = await self.worker_pool.run(
+                extract_listing_items, html, page_url, item_selectors, title_selectors,
+                summary_selectors, date_selectors, limit
+            )
+        except Exception as e:
+            self.stats['parse_failures'] += 1
+            logger.error(f"Failed to parse {page_url}: {e}")
+            return [], None
+        
+        self._record_parse_time('listing', page_url, result)
+        
+        items = result['items']
+        if not items:
+            return [], None
+        
+        formats = Counter()
+        for item in items:
+            item['published_at'], matched_format = self._parse_date_with_format(item['date_text'], date_format)
+            if matched_format:
+                formats[matched_format] += 1
+        
+        selectors = result['selectors']
+        page_profile = {
+            'item_selector': selectors['item'],
+            'title_selector': selectors['title'],
+            'summary_selector': selectors['summary'],
+            'date_selector': selectors['date'],
+            'date_format': formats.most_common(1)[0][0] if formats else date_format,
+        }
+        return items, page_profile
+    
+    def _record_parse_time(self, kind: str, url: str, result: Dict[str, Any]):
+        """Account one page's parse time"""
+        seconds = result['parse_seconds']
+        self.stats['pages_parsed' if kind == 'listing' else 'articles_parsed'] += 1
+        self.stats[f"{kind}_parse_seconds"] += seconds
+        self.stats['max_page_parse_seconds'] = max(self.stats['max_page_parse_seconds'], seconds)
+        logger.debug(f"Parsed {kind} page {url} with {result['parser']} in {seconds * 1000:.1f} ms")
+    
+    async def _extract_articles_from_page(self, html: str, page_url: str, team: str, queries: Dict[str, Any],
+                                          profile: Optional[Dict[str, Any]] = None) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Extract articles from a webpage, along with the profile that found them"""
+        items, page_profile = await self._parse_listing(
+            html, page_url,
+            self.news_selectors['generic'],
+            self.news_selectors['title_selectors'],
+            self.news_selectors['content_selectors'],
+            limit=10,  # Limit to 10 items per page
+            profile=profile
+        )
+        
+        articles = []
+        
+        for item in items:
+            try:
+                title = item['title']
+                link = item['link']
+                
+                # Check relevance
+                relevance_score = self._calculate_relevance(title, '', queries)
+                if relevance_score < 0.3:
+                    continue
+                
+                # Check date relevance
+                pub_date = item['published_at']
+                if pub_date and not self._is_date_relevant(pub_date, queries['date_range']):
+                    continue
+                
+                article = {
+                    'title': title,
+                    'summary': item['summary'],
+                    'content': item['summary'],  # Will be enhanced later
+                    'link': link,
+                    'author': team,  # Use team as author for club websites
+                    'published_at': pub_date or datetime.utcnow(),
+                    'source': f"{team} Official",
+                    'source_type': 'scrape',
+                    'relevance_score': relevance_score,
+                    'quality_score': 0.85,  # Official club sources have high quality
+                    'hash': self._generate_hash(title, link),
+                    'collected_at': datetime.utcnow(),
+                    'language': 'en',
+                    'tags': ['official', 'club', team.lower().replace(' ', '_')],
+                    'scrape_info': {
+                        'source_url': page_url,
+                        'scrape_method': 'club_website'
+                    }
+                }
+                
+                articles.append(article)
+                
+            except Exception as e:
+                logger.warning(f"Failed to extract article from item: {e}")
+                continue
+        
+        return articles, page_profile
+    
     async def _extract_full_article_content(self, article_url: str) -> Optional[str]:
         """Extract full article content from URL"""
-        if not NEWSPAPER_AVAILABLE:
-            return None
-        
         try:
-            async with self.rate_limiter:
-                await asyncio.sleep(1)  # Be respectful
+            html = await self._fetch_html(article_url)
+            if html:
+                # Content extraction runs on the worker pool
+                result = await self.worker_pool.run(extract_article_text, html, article_url, 2000)
+                self._record_parse_time('article', article_url, result)
+                
+                # Remember pages without extractable text too, so they aren't refetched
+                self.content_cache.set(article_url, result['text'])
+                
+                if result['text']:
+                    return result['text']
                 
-                async with self.session.get(article_url) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        
-                        # Use newspaper3k for content extraction
-                        article = Article(article_url)
-                        article.set_html(html)
-                        article.parse()
-                        
-                        if article.text:
-                            return article.text[:2000]  # Limit content length
-                        
         except Exception as e:
             logger.warning(f"Failed to extract full content from {article_url}: {e}")
         
@@ -332,6 +477,9 @@ class ScraperCollector:
             # Search for different query combinations
             for query in queries['search_terms'][:3]:  # Limit to 3 queries
                 try:
+                    # Pace searches through the shared per-host limiter
+                    await self.rate_limiter.acquire('https://news.google.com', 'web_scraping')
+                    
                     # Search with time filter
                     search_results = self.google_news.search(f"{query} football", when='7d')
                     
@@ -351,7 +499,7 @@ class ScraperCollector:
                                 continue
                             
                             # Parse date
-                            pub_date = self._parse_date_string(published)
+                            pub_date = self._parse_date_string(published, 'google_news')
                             
                             # Check date relevance
                             if pub_date and not self._is_date_relevant(pub_date, queries['date_range']):
@@ -384,9 +532,6 @@ class ScraperCollector:
                             logger.warning(f"Failed to process Google News entry: {e}")
                             continue
                     
-                    # Add delay between searches
-                    await asyncio.sleep(2)
-                    
                 except Exception as e:
                     logger.error(f"Google News search failed for query '{query}': {e}")
                     continue
@@ -408,221 +553,127 @@ class ScraperCollector:
             'https://www.telegraph.co.uk/football',
         ]
         
-        articles = []
+        results = await asyncio.gather(*[self._scrape_news_site(site_url, queries) for site_url in news_sites])
         
-        for site_url in news_sites:
-            try:
-                async with self.rate_limiter:
-                    await asyncio.sleep(RATE_LIMITS['web_scraping']['delay_between_requests'])
-                    
-                    async with self.session.get(site_url) as response:
-                        if response.status == 200:
-                            html = await response.text()
-                            site_articles = await self._extract_articles_from_news_site(
-                                html, site_url, queries
-                            )
-                            articles.extend(site_articles[:5])  # Limit per site
-                            
-            except Exception as e:
-                logger.warning(f"Failed to scrape {site_url}: {e}")
-                continue
+        articles = []
+        for site_articles in results:
+            articles.extend(site_articles[:5])  # Limit per site
         
         return articles
     
-    async def _extract_articles_from_news_site(self, html: str, site_url: str, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Extract articles from general news sites"""
+    async def _scrape_news_site(self, site_url: str, queries: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Scrape one general news site within the per-site deadline"""
+        domain = urlparse(site_url).netloc.lower()
+        
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            articles = []
+            html = await asyncio.wait_for(self._fetch_html(site_url), timeout=self.config['site_deadline'])
+            if not html:
+                return []
             
-            # Common news article selectors
-            article_selectors = [
-                'article', '.story', '.article-item', '.news-item',
-                '[class*="story"]', '[class*="article"]'
-            ]
+            profile = self.site_profiles.get(domain)
+            articles, learned = await self._extract_articles_from_news_site(html, site_url, queries, profile)
             
-            news_items = []
-            for selector in article_selectors:
-                items = soup.select(selector)
-                if items:
-                    news_items.extend(items[:20])
-                    break
+            if profile and not learned:
+                # Layout changed; rediscover on the page already fetched
+                self.site_profiles.invalidate(domain)
+                profile = None
+                articles, learned = await self._extract_articles_from_news_site(html, site_url, queries)
             
-            for item in news_items:
-                try:
-                    # Extract title
-                    title_elem = item.select_one('h1, h2, h3, .headline, .title')
-                    if not title_elem:
-                        continue
-                    
-                    title = title_elem.get_text(strip=True)
-                    
-                    # Check relevance
-                    relevance_score = self._calculate_relevance(title, '', queries)
-                    if relevance_score < 0.4:
-                        continue
-                    
-                    # Extract link
-                    link_elem = item.select_one('a')
-                    if not link_elem:
-                        continue
-                    
-                    link = link_elem.get('href', '')
-                    if link:
-                        link = urljoin(site_url, link)
-                    
-                    # Extract summary
-                    summary_elem = item.select_one('p, .summary, .description')
-                    summary = summary_elem.get_text(strip=True) if summary_elem else ''
-                    
-                    # Extract date
-                    pub_date = self._extract_date_from_element(item)
-                    
-                    # Determine source name
-                    domain = urlparse(site_url).netloc
-                    source_name = domain.replace('www.', '').replace('.com', '').replace('.co.uk', '').title()
-                    
-                    article = {
-                        'title': title,
-                        'summary': summary,
-                        'content': summary,
-                        'link': link,
-                        'author': source_name,
-                        'published_at': pub_date or datetime.utcnow(),
-                        'source': source_name,
-                        'source_type': 'scrape',
-                        'relevance_score': relevance_score,
-                        'quality_score': 0.7,  # General news sites have good quality
-                        'hash': self._generate_hash(title, link),
-                        'collected_at': datetime.utcnow(),
-                        'language': 'en',
-                        'tags': ['news', 'general'],
-                        'scrape_info': {
-                            'source_url': site_url,
-                            'scrape_method': 'general_news'
-                        }
-                    }
-                    
-                    articles.append(article)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to extract article from news site: {e}")
-                    continue
+            if learned:
+                learned = {**(profile or {}), **{field: value for field, value in learned.items() if value}}
+                learned['news_paths'] = [urlparse(site_url).path or '/']
+                self.site_profiles.learn(domain, learned)
             
             return articles
             
         except Exception as e:
-            logger.error(f"Failed to extract articles from news site: {e}")
+            logger.warning(f"Failed to scrape {site_url}: {e}")
             return []
     
-    def _calculate_relevance(self, title: str, summary: str, queries: Dict[str, Any]) -> float:
-        """Calculate relevance score for scraped content"""
-        text = f"{title} {summary}".lower()
-        score = 0.0
-        
-        # Check for direct team mentions
-        for team in queries['teams']:
-            if team.lower() in text:
-                score += 0.5
-        
-        # Check for team variations
-        for variation in queries['all_variations']:
-            if variation.lower() in text:
-                score += 0.3
-        
-        # Check for match queries
-        for query in queries['match_queries']:
-            if query.lower() in text:
-                score += 0.7
-        
-        # Check for keywords
-        for keyword in queries['keywords']:
-            if keyword.lower() in text:
-                score += 0.1
-        
-        # Bonus for title matches
-        title_lower = title.lower()
-        for team in queries['teams']:
-            if team.lower() in title_lower:
-                score += 0.3
-        
-        return min(score, 1.0)
-    
-    def _extract_date_from_element(self, element) -> Optional[datetime]:
-        """Extract publication date from HTML element"""
-        try:
-            # Try different date selectors
-            for selector in self.news_selectors['date_selectors']:
-                date_elem = element.select_one(selector)
-                if date_elem:
-                    # Try datetime attribute first
-                    datetime_attr = date_elem.get('datetime')
-                    if datetime_attr:
-                        return self._parse_date_string(datetime_attr)
-                    
-                    # Try text content
-                    date_text = date_elem.get_text(strip=True)
-                    if date_text:
-                        return self._parse_date_string(date_text)
-            
-            return None
-            
-        except Exception as e:
-            logger.warning(f"Failed to extract date: {e}")
-            return None
-    
-    def _parse_date_string(self, date_str: str) -> Optional[datetime]:
-        """Parse date string into datetime object"""
-        if not date_str:
-            return None
-        
-        # Common date formats
-        formats = [
-            '%Y-%m-%dT%H:%M:%S%z',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d',
-            '%d %B %Y',
-            '%d %b %Y',
-            '%B %d, %Y',
-            '%b %d, %Y',
-            '%d/%m/%Y',
-            '%m/%d/%Y',
+    async def _extract_articles_from_news_site(self, html: str, site_url: str, queries: Dict[str, Any],
+                                               profile: Optional[Dict[str, Any]] = None) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Extract articles from general news sites, along with the profile that found them"""
+        # Common news article selectors
+        article_selectors = [
+            'article', '.story', '.article-item', '.news-item',
+            '[class*="story"]', '[class*="article"]'
         ]
         
-        for fmt in formats:
+        items, page_profile = await self._parse_listing(
+            html, site_url, article_selectors,
+            ['h1, h2, h3, .headline, .title'],
+            ['p, .summary, .description'],
+            limit=20,
+            profile=profile
+        )
+        
+        # Determine source name
+        domain = urlparse(site_url).netloc
+        source_name = domain.replace('www.', '').replace('.com', '').replace('.co.uk', '').title()
+        
+        articles = []
+        
+        for item in items:
             try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
+                title = item['title']
+                link = item['link']
+                
+                # Check relevance
+                relevance_score = self._calculate_relevance(title, '', queries)
+                if relevance_score < 0.4:
+                    continue
+                
+                pub_date = item['published_at']
+                
+                article = {
+                    'title': title,
+                    'summary': item['summary'],
+                    'content': item['summary'],
+                    'link': link,
+                    'author': source_name,
+                    'published_at': pub_date or datetime.utcnow(),
+                    'source': source_name,
+                    'source_type': 'scrape',
+                    'relevance_score': relevance_score,
+                    'quality_score': 0.7,  # General news sites have good quality
+                    'hash': self._generate_hash(title, link),
+                    'collected_at': datetime.utcnow(),
+                    'language': 'en',
+                    'tags': ['news', 'general'],
+                    'scrape_info': {
+                        'source_url': site_url,
+                        'scrape_method': 'general_news'
+                    }
+                }
+                
+                articles.append(article)
+                
+            except Exception as e:
+                logger.warning(f"Failed to extract article from news site: {e}")
                 continue
         
-        # Try relative dates
-        date_str_lower = date_str.lower()
-        now = datetime.utcnow()
-        
-        if 'today' in date_str_lower:
-            return now
-        elif 'yesterday' in date_str_lower:
-            return now - timedelta(days=1)
-        elif 'hour' in date_str_lower and 'ago' in date_str_lower:
-            # Extract hours
-            hours_match = re.search(r'(\d+)\s*hour', date_str_lower)
-            if hours_match:
-                hours = int(hours_match.group(1))
-                return now - timedelta(hours=hours)
-        elif 'minute' in date_str_lower and 'ago' in date_str_lower:
-            # Extract minutes
-            minutes_match = re.search(r'(\d+)\s*minute', date_str_lower)
-            if minutes_match:
-                minutes = int(minutes_match.group(1))
-                return now - timedelta(minutes=minutes)
+        return articles, page_profile
+    
+    def _calculate_relevance(self, title: str, summary: str, queries: Dict[str, Any]) -> float:
+        """Calculate relevance score for scraped content"""
+        return self.relevance_router.score(queries['match_id'], 'scraper', title, summary)
+    
+    def _parse_date_string(self, date_str: str, source: str = None) -> Optional[datetime]:
+        """Parse date string into a naive UTC datetime"""
+        return self.timestamps.parse(date_str, source)
+    
+    def _parse_date_with_format(self, date_str: str, preferred_format: str = None) -> Tuple[Optional[datetime], Optional[str]]:
+        """Parse a date string, trying ``preferred_format`` first; returns the date and the format that matched"""
+        parsed, matched_format = self.timestamps.parse_with_format(date_str, preferred_format)
         
-        return None
+        # Relative dates ("2 hours ago") say nothing about the site's format
+        return parsed, matched_format if matched_format != RELATIVE else None
     
     def _is_date_relevant(self, pub_date: datetime, date_range: tuple) -> bool:
         """Check if date is within relevant range"""
+        # Aware and naive datetimes don't compare; both sides become naive UTC
         start_date, end_date = date_range
-        return start_date <= pub_date <= end_date
+        return as_utc(start_date) <= as_utc(pub_date) <= as_utc(end_date)
     
     def _clean_summary(self, summary: str) -> str:
         """Clean and normalize summary text"""
@@ -646,6 +697,19 @@ class ScraperCollector:
         content = f"{title}{link}"
         return hashlib.md5(content.encode('utf-8')).hexdigest()
     
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scraper statistics"""
+        pages = self.stats['pages_parsed']
+        articles = self.stats['articles_parsed']
+        return {
+            **self.stats,
+            'parser': PARSER_BACKEND,
+            'site_profiles': self.site_profiles.get_stats(),
+            'content_cache': self.content_cache.get_stats(),
+            'avg_listing_parse_ms': self.stats['listing_parse_seconds'] * 1000 / pages if pages else 0.0,
+            'avg_article_parse_ms': self.stats['article_parse_seconds'] * 1000 / articles if articles else 0.0,
+        }
+    
     async def get_scraping_health(self) -> Dict[str, Any]:
         """Check health of scraping targets"""
         health_results = {}
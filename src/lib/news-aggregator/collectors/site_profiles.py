@@ -0,0 +1,122 @@
+"""
+Site Profile Store - Learned scraping profiles per domain
+Remembers which news paths, selectors and date format worked on each site
+"""
+
+import json
+import logging
+import os
+import re
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from ..config import CACHE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Fields a profile records; selectors may be None when nothing matched that role
+PROFILE_FIELDS = ['news_paths', 'item_selector', 'title_selector', 'summary_selector', 'date_selector', 'date_format']
+
+
+class SiteProfileStore:
+    """
+    Stores what scraping discovery found on each domain under the cache directory.
+
+    A profile lets later runs fetch only the paths that produced items and
+    apply one selector per role instead of walking every generic selector.
+    Collectors invalidate a profile once it stops producing items, which
+    sends the next run back through discovery.
+    """
+
+    def __init__(self, directory: str = None):
+        self.directory = os.path.join(directory or CACHE_CONFIG['directory'], 'site_profiles')
+        self._profiles: Dict[str, Optional[Dict[str, Any]]] = {}
+
+        self.stats = {
+            'profile_hits': 0,
+            'discoveries': 0,
+            'invalidations': 0,
+        }
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Site profile directory unavailable ({e}), profiles kept in memory only")
+
+    def get(self, domain: str) -> Optional[Dict[str, Any]]:
+        """Learned profile for a domain, loading it from disk if needed"""
+        if domain not in self._profiles:
+            self._profiles[domain] = self._load(domain)
+
+        profile = self._profiles[domain]
+        if profile is not None:
+            self.stats['profile_hits'] += 1
+        return profile
+
+    def _load(self, domain: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(domain), 'r', encoding='utf-8') as f:
+                profile = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable site profile for {domain}: {e}")
+            return None
+
+        if not profile.get('news_paths') or not profile.get('item_selector'):
+            return None
+        return profile
+
+    def learn(self, domain: str, learned: Dict[str, Any]):
+        """Store the profile discovery produced for a domain"""
+        profile = {field: learned.get(field) for field in PROFILE_FIELDS}
+        profile['domain'] = domain
+        profile['updated_at'] = datetime.utcnow().isoformat()
+
+        previous = self._profiles.get(domain)
+        if previous and all(previous.get(field) == profile[field] for field in PROFILE_FIELDS):
+            return
+
+        if previous is None:
+            self.stats['discoveries'] += 1
+            logger.info(f"Learned scraping profile for {domain}: {profile['news_paths']} / {profile['item_selector']}")
+        self._profiles[domain] = profile
+
+        path = self._path(domain)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(profile, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to persist site profile for {domain}: {e}")
+
+    def invalidate(self, domain: str):
+        """Forget a profile that no longer produces items"""
+        if self._profiles.get(domain) is None:
+            return
+
+        self._profiles[domain] = None
+        self.stats['invalidations'] += 1
+        logger.info(f"Scraping profile for {domain} stopped producing items, rediscovering")
+
+        try:
+            os.remove(self._path(domain))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove site profile for {domain}: {e}")
+
+    def _path(self, domain: str) -> str:
+        return os.path.join(self.directory, f"{re.sub(r'[^a-z0-9.-]', '_', domain.lower())}.json")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get site profile statistics"""
+        return {
+            **self.stats,
+            'known_profiles': sum(1 for profile in self._profiles.values() if profile is not None),
+        }
+
+
+# Process-wide instance shared by every scraper
+shared_site_profiles = SiteProfileStore()
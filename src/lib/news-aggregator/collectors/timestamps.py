@@ -0,0 +1,273 @@
+"""
+Timestamp Normalisation - One date parser shared by every collector
+Fast ISO-8601 and RFC-822 paths, a memo of the format each source uses, and UTC output
+"""
+
+import email.utils
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Zone names seen in football feeds, as UTC offsets in seconds. email.utils
+# reports unknown names as +0000, so British Summer Time would be an hour out.
+TZ_ABBREVIATIONS = {
+    'UT': 0,
+    'UTC': 0,
+    'GMT': 0,
+    'Z': 0,
+    'EST': -18000,
+    'EDT': -14400,
+    'CST': -21600,
+    'CDT': -18000,
+    'MST': -25200,
+    'MDT': -21600,
+    'PST': -28800,
+    'PDT': -25200,
+    'BST': 3600,
+    'IST': 3600,  # Irish Standard Time
+    'WET': 0,
+    'WEST': 3600,
+    'CET': 3600,
+    'CEST': 7200,
+    'EET': 7200,
+    'EEST': 10800,
+    'MSK': 10800,
+}
+
+# Tried after the ISO-8601 and RFC-822 paths; day-first before month-first for European sites
+STRPTIME_FORMATS = [
+    '%d %B %Y',
+    '%d %b %Y',
+    '%B %d, %Y',
+    '%b %d, %Y',
+    '%d %B %Y %H:%M',
+    '%d %b %Y %H:%M',
+    '%B %d, %Y %I:%M %p',
+    '%b %d, %Y %I:%M %p',
+    '%d/%m/%Y',
+    '%m/%d/%Y',
+    '%d.%m.%Y',
+    '%d/%m/%Y %H:%M',
+]
+
+ISO = 'iso8601'
+RFC822 = 'rfc822'
+RELATIVE = 'relative'
+
+MONTHS = {name: number for number, name in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], 1)}
+
+RELATIVE_PATTERN = re.compile(r'(\d+)\s*(second|sec|minute|min|hour|hr|day|week)s?\s+ago')
+RELATIVE_UNITS = {
+    'second': 'seconds', 'sec': 'seconds',
+    'minute': 'minutes', 'min': 'minutes',
+    'hour': 'hours', 'hr': 'hours',
+    'day': 'days',
+    'week': 'weeks',
+}
+
+
+def as_utc(value: datetime) -> datetime:
+    """
+    Normalise a datetime to naive UTC, the form stored and compared everywhere.
+
+    Aware values are converted using their offset; naive values are
+    already UTC by convention (``datetime.utcnow()``, MongoDB).
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _looks_iso(text: str) -> bool:
+    return len(text) >= 10 and text[4] == '-' and text[:4].isdigit()
+
+
+def _looks_relative(text: str) -> bool:
+    lowered = text[-9:].lower()
+    return lowered.endswith('ago') or lowered.endswith('now') or lowered.endswith('today') or lowered.endswith('yesterday')
+
+
+def _zone_offset(zone: str) -> Optional[int]:
+    """Seconds east of UTC for '+0100', '-05:00' or a known zone name"""
+    if zone[0] in '+-' and len(zone) in (5, 6):
+        digits = zone[1:].replace(':', '')
+        if len(digits) != 4 or not digits.isdigit():
+            return None
+        offset = int(digits[:2]) * 3600 + int(digits[2:]) * 60
+        return -offset if zone[0] == '-' else offset
+    return TZ_ABBREVIATIONS.get(zone.upper())
+
+
+class TimestampParser:
+    """
+    Parses the date strings collectors meet into naive UTC datetimes.
+
+    ISO-8601 strings go through ``datetime.fromisoformat`` and RFC-822
+    strings through ``email.utils.parsedate_tz``; offsets and zone names are
+    applied rather than dropped. Anything else falls back to a list of
+    strptime formats and then to relative dates ("3 hours ago"). The method
+    that last worked for each source is tried first next time, since a
+    feed or site formats every date the same way.
+    """
+
+    def __init__(self):
+        self._winners: Dict[str, str] = {}
+
+        self.stats = {
+            'parsed': 0,
+            'failed': 0,
+            'memo_hits': 0,
+            ISO: 0,
+            RFC822: 0,
+            'strptime': 0,
+            RELATIVE: 0,
+        }
+
+    def parse(self, value: Any, source: str = None, now: datetime = None) -> Optional[datetime]:
+        """Naive UTC datetime for ``value``, or None if it is not a date"""
+        parsed, method = self.parse_with_format(value, self._winners.get(source) if source else None, now)
+        if source and method:
+            self._winners[source] = method
+        return parsed
+
+    def parse_with_format(self, value: Any, preferred: str = None,
+                          now: datetime = None) -> Tuple[Optional[datetime], Optional[str]]:
+        """
+        Parse ``value``, trying ``preferred`` first.
+
+        Returns the naive UTC datetime and the method that matched: 'iso8601',
+        'rfc822', 'relative' or a strptime format. Both are None on failure.
+        """
+        if isinstance(value, datetime):
+            return as_utc(value), None
+        if not value or not isinstance(value, str):
+            return None, None
+
+        text = value.strip()
+        if not text:
+            return None, None
+
+        if preferred:
+            parsed = self._try(preferred, text, now)
+            if parsed is not None:
+                self.stats['memo_hits'] += 1
+                return self._found(parsed, preferred)
+
+        for method in self._candidates(text):
+            if method == preferred:
+                continue
+            parsed = self._try(method, text, now)
+            if parsed is not None:
+                return self._found(parsed, method)
+
+        self.stats['failed'] += 1
+        return None, None
+
+    def _found(self, parsed: datetime, method: str) -> Tuple[datetime, str]:
+        self.stats['parsed'] += 1
+        self.stats[method if method in (ISO, RFC822, RELATIVE) else 'strptime'] += 1
+        return parsed, method
+
+    def _candidates(self, text: str):
+        if _looks_iso(text):
+            yield ISO
+        elif _looks_relative(text):
+            yield RELATIVE
+            return
+        else:
+            yield RFC822
+        yield from STRPTIME_FORMATS
+        yield RELATIVE
+
+    def _try(self, method: str, text: str, now: datetime = None) -> Optional[datetime]:
+        if method == ISO:
+            return self._parse_iso(text)
+        if method == RFC822:
+            return self._parse_rfc822(text)
+        if method == RELATIVE:
+            return self._parse_relative(text, now)
+
+        try:
+            return as_utc(datetime.strptime(text, method))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _parse_iso(text: str) -> Optional[datetime]:
+        if not _looks_iso(text):
+            return None
+        if text[-1] in 'Zz':
+            text = text[:-1] + '+00:00'
+        try:
+            return as_utc(datetime.fromisoformat(text))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _parse_rfc822(text: str) -> Optional[datetime]:
+        # The common 'Sat, 11 May 2024 14:32:07 GMT' shape, split by hand
+        fields = text.split()
+        if len(fields) == 6 and fields[0].endswith(','):
+            month = MONTHS.get(fields[2][:3].lower())
+            clock = fields[4].split(':')
+            offset = _zone_offset(fields[5])
+            if month and offset is not None and len(clock) in (2, 3):
+                try:
+                    parsed = datetime(int(fields[3]), month, int(fields[1]), int(clock[0]), int(clock[1]),
+                                      int(clock[2]) if len(clock) == 3 else 0)
+                    return parsed - timedelta(seconds=offset)
+                except ValueError:
+                    pass
+
+        try:
+            parts = email.utils.parsedate_tz(text)
+            if parts is None:
+                return None
+
+            offset = parts[9] or 0
+            zone = text.rsplit(None, 1)[-1].upper()
+            if zone in TZ_ABBREVIATIONS:
+                offset = TZ_ABBREVIATIONS[zone]
+
+            return datetime(*parts[:6]) - timedelta(seconds=offset)
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return None
+
+    @staticmethod
+    def _parse_relative(text: str, now: datetime = None) -> Optional[datetime]:
+        now = now or datetime.utcnow()
+        lowered = text.lower()
+
+        if 'just now' in lowered or lowered == 'now':
+            return now
+        if 'today' in lowered:
+            return now
+        if 'yesterday' in lowered:
+            return now - timedelta(days=1)
+
+        match = RELATIVE_PATTERN.search(lowered)
+        if match:
+            return now - timedelta(**{RELATIVE_UNITS[match.group(2)]: int(match.group(1))})
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get parser statistics"""
+        attempts = self.stats['parsed'] + self.stats['failed']
+        return {
+            **self.stats,
+            'memo_hit_rate': self.stats['memo_hits'] / attempts if attempts else 0.0,
+            'known_sources': len(self._winners),
+        }
+
+
+# Process-wide instance so every collector shares what it learns about each source
+shared_timestamp_parser = TimestampParser()
+
+
+def parse_timestamp(value: Any, source: str = None) -> Optional[datetime]:
+    """Parse with the shared parser; see ``TimestampParser.parse``"""
+    return shared_timestamp_parser.parse(value, source)
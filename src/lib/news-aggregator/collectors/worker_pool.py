@@ -0,0 +1,95 @@
+"""
+Worker Pool - Shared executor for CPU-bound collector work
+Keeps feed and HTML parsing off the event loop
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from ..config import WORKER_POOL_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerPool:
+    """
+    Lazily created process (or thread) pool shared by every collector.
+
+    Functions submitted in process mode must be module-level and take
+    picklable arguments. If a process pool cannot be created (restricted
+    containers, missing semaphores) the pool falls back to threads.
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        self.config = {**WORKER_POOL_CONFIG, **(config or {})}
+        self._executor: Optional[Executor] = None
+        self.mode = None
+
+        self.stats = {
+            'tasks': 0,
+            'failures': 0,
+            'total_task_seconds': 0.0,
+        }
+
+    def _get_executor(self) -> Executor:
+        if self._executor is not None:
+            return self._executor
+
+        max_workers = self.config['max_workers']
+        if self.config['mode'] == 'process':
+            try:
+                self._executor = ProcessPoolExecutor(max_workers=max_workers)
+                self.mode = 'process'
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"Process pool unavailable ({e}), using threads for parsing")
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='collector-worker')
+            self.mode = 'thread'
+
+        logger.info(f"Worker pool started in {self.mode} mode")
+        return self._executor
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run ``func`` in the pool and await its result"""
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        self.stats['tasks'] += 1
+
+        try:
+            return await loop.run_in_executor(self._get_executor(), functools.partial(func, *args, **kwargs))
+        except Exception:
+            self.stats['failures'] += 1
+            raise
+        finally:
+            self.stats['total_task_seconds'] += time.monotonic() - started
+
+    def shutdown(self):
+        """Stop the workers; a later ``run`` starts a fresh pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("Worker pool shut down")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get worker pool statistics"""
+        tasks = self.stats['tasks']
+        return {
+            **self.stats,
+            'mode': self.mode,
+            'max_workers': self.config['max_workers'],
+            'avg_task_seconds': self.stats['total_task_seconds'] / tasks if tasks else 0.0,
+        }
+
+
+# Process-wide instance shared by every collector
+shared_worker_pool = WorkerPool()
+
+
+async def run_in_worker(func: Callable, *args, **kwargs) -> Any:
+    """Run ``func`` on the shared worker pool"""
+    return await shared_worker_pool.run(func, *args, **kwargs)
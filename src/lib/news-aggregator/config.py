@@ -53,6 +53,8 @@ REDDIT_CONFIG = {
     'client_secret': os.getenv('REDDIT_CLIENT_SECRET', ''),
     'user_agent': 'MatchNewsAggregator/1.0',
     'read_only': True,
+    'request_budget': 40,  # Reddit API requests per match aggregation
+    'comment_fetch_limit': 10,  # Submissions whose comments are fetched per aggregation
     'target_subreddits': [
         'soccer',
         'PremierLeague',
@@ -105,6 +107,20 @@ NITTER_INSTANCES = [
     'https://nitter.pussthecat.org',
 ]
 
+# Nitter Instance Routing Configuration
+NITTER_CONFIG = {
+    'ewma_alpha': 0.3,  # Weight of the newest latency/error sample
+    'latency_window': 50,  # Samples kept per instance for the p90 latency
+    'initial_latency': 1.0,  # Assumed latency (seconds) of an unmeasured instance
+    'failure_threshold': 3,  # Consecutive failures that open the circuit
+    'open_seconds': 120,  # Cooldown before a half-open probe is allowed
+    'max_attempts': 3,  # Instances tried per feed fetch
+    'hedge_requests': True,  # Race a second instance when the first is slow
+    'min_samples_for_hedge': 5,
+    'initial_hedge_delay': 2.0,  # Hedge delay (seconds) before p90 is known
+    'min_hedge_delay': 0.3,
+}
+
 # Key Twitter Accounts to Monitor
 TWITTER_ACCOUNTS = {
     'journalists': [
@@ -156,18 +172,25 @@ NEWS_APIS = {
         'key': os.getenv('GUARDIAN_API_KEY', ''),
         'daily_limit': 5000,
         'rate_limit': 12,  # requests per second
+        'calls_per_match': 2,  # one search per team
+        'max_or_terms': 4,  # Teams folded into one search
+        'page_size': 50,
+        'max_pages': 2,  # Further result pages are fetched concurrently
     },
     'newsdata': {
         'url': 'https://newsdata.io/api/1/news',
         'key': os.getenv('NEWSDATA_API_KEY', ''),
         'daily_limit': 200,
         'rate_limit': 1,  # requests per second
+        'calls_per_match': 1,
     },
     'currents': {
         'url': 'https://api.currentsapi.services/v1/search',
         'key': os.getenv('CURRENTS_API_KEY', ''),
         'daily_limit': 600,
         'rate_limit': 1,
+        'calls_per_match': 2,  # one search per team
+        'max_or_terms': 1,  # Keyword search has no documented OR across phrases
     }
 }
 
@@ -187,6 +210,15 @@ CLUB_WEBSITES = {
     'Borussia Dortmund': 'https://www.bvb.de',
 }
 
+# News API Quota Ledger Configuration
+QUOTA_CONFIG = {
+    'ledger_file': 'api_quota.json',  # Under CACHE_CONFIG['directory'], used when MongoDB is unavailable
+    'reserved_priorities': ['high', 'urgent'],  # May spend the quota held back from everyone else
+    'aggregations_per_fixture': 2,  # Expected aggregations of each fixture today, less those already completed
+    'max_reserve_fraction': 0.5,  # Never hold back more than this share of a daily limit
+    'reserve_refresh_seconds': 300,
+}
+
 # MongoDB Configuration (Free Atlas Tier)
 MONGODB_CONFIG = {
     'connection_string': os.getenv('MONGODB_CONNECTION_STRING', ''),
@@ -196,6 +228,7 @@ MONGODB_CONFIG = {
         'matches': 'matches',
         'contexts': 'match_contexts',
         'sources': 'source_stats',
+        'quota': 'api_quota',
     },
     'indexes': [
         [('match_id', 1), ('published_at', -1)],
@@ -244,8 +277,12 @@ QUALITY_SCORING = {
 CACHE_CONFIG = {
     'directory': '/tmp/match_news_cache',
     'default_expire': 3600,  # 1 hour
+    'feeds_expire': 300,  # 5 minutes - shared parsed feed entries
+    'api_responses_expire': 1800,  # 30 minutes - news API search results per team and date window
     'contexts_expire': 7200,  # 2 hours
     'source_stats_expire': 86400,  # 24 hours
+    'contents_expire': 86400,  # 24 hours - extracted article bodies
+    'contents_size_limit': 256 * 1024 * 1024,  # 256MB, least recently used evicted first
 }
 
 # Rate Limiting Configuration
@@ -262,6 +299,7 @@ RATE_LIMITS = {
         'requests_per_minute': 30,
         'concurrent_requests': 3,
         'delay_between_requests': 2,
+        'respect_robots_txt': True,
     },
     'news_apis': {
         'requests_per_minute': 10,
@@ -269,6 +307,83 @@ RATE_LIMITS = {
     }
 }
 
+# Shared HTTP Client Pool Configuration
+HTTP_POOL_CONFIG = {
+    'total_connections': 100,
+    'connections_per_host': 8,
+    'dns_cache_ttl': 300,  # seconds
+    'keepalive_timeout': 60,  # seconds an idle connection is kept for reuse
+    'request_timeout': 30,
+}
+
+# Web Scraper Configuration
+SCRAPER_CONFIG = {
+    'site_deadline': 25,  # Seconds per site before returning what has been extracted
+    'max_articles_per_site': 20,
+}
+
+# Collector Registry Configuration
+# timeout: seconds before a collector is cut off and its articles so far kept
+# weight: multiplier on the quality score of the collector's articles
+COLLECTOR_CONFIG = {
+    'rss': {'enabled': True, 'timeout': 15, 'weight': 1.0},
+    'api': {'enabled': True, 'timeout': 20, 'weight': 1.0},
+    'reddit': {'enabled': True, 'timeout': 25, 'weight': 0.8},
+    'nitter': {'enabled': True, 'timeout': 15, 'weight': 0.7},
+    'scraper': {'enabled': True, 'timeout': 30, 'weight': 0.9},  # Outlasts the per-site deadline
+}
+
+# Streaming Aggregation Pipeline Configuration
+PIPELINE_CONFIG = {
+    'queue_size': 8,  # Batches buffered between stages before the upstream stage waits
+    'store_batch_size': 50,  # Articles per storage write...
+    'store_flush_seconds': 1.0,  # ...or fewer once the oldest pending article has waited this long
+    'context_article_limit': 1000,  # Stored articles read back to rebuild a re-aggregated match's context
+}
+
+# Deduplication Configuration
+# A pair is a duplicate when any field's difflib ratio reaches its threshold.
+# The ratio is only computed for pairs that share an LSH bucket on some field;
+# bands and rows set where each field's bucket-sharing S-curve rises.
+DEDUP_CONFIG = {
+    'title_similarity_threshold': 0.85,
+    'content_similarity_threshold': 0.75,
+    'url_similarity_threshold': 0.90,
+    'memory_ttl': 172800,  # Articles stored in the last 2 days are skipped when a match is re-aggregated
+    'lsh': {
+        'title': {'shingle': 'char', 'size': 3, 'bands': 32, 'rows': 4},  # Rises near Jaccard 0.42
+        'content': {'shingle': 'word', 'size': 2, 'bands': 20, 'rows': 3},
+        'url': {'shingle': 'char', 'size': 4, 'bands': 16, 'rows': 4},  # Near 0.5: same-site paths overlap heavily
+    },
+    # Content SimHash: bodies whose 64-bit fingerprints differ in at most max_distance
+    # bits are duplicates outright, like a hash match. Articles are short, so a one-word
+    # edit moves the fingerprint up to ~5 bits; unrelated match reports stay 8+ apart.
+    # Changing the shingling invalidates the fingerprints already stored.
+    'simhash': {'shingle': 'char', 'size': 5, 'max_distance': 4, 'min_shingles': 50},
+}
+
+# Background Feed Refresh Configuration
+FEED_SCHEDULER_CONFIG = {
+    'default_interval': 900,  # 15 minutes until a feed's publish rate has been observed
+    'min_interval': 120,  # Never poll one feed more often than every 2 minutes
+    'max_interval': 21600,  # Poll even weekly feeds every 6 hours
+    'interval_fraction': 0.5,  # Poll at half the typical gap between a feed's entries
+    'history_entries': 20,  # Newest entries used to learn that gap
+    'kickoff_before': 10800,  # Fast cadence from 3 hours before kickoff...
+    'kickoff_after': 10800,  # ...until 3 hours after
+    'kickoff_interval': 120,
+    'cache_grace': 120,  # Refreshed entries stay fresh this long past the next scheduled refresh
+    'fixture_priorities': ['low', 'normal', 'high', 'urgent'],
+    'fixtures_refresh_seconds': 600,
+    'max_concurrent_refreshes': 8,
+}
+
+# Worker Pool Configuration (CPU-bound parsing)
+WORKER_POOL_CONFIG = {
+    'mode': 'process',  # 'process' or 'thread'
+    'max_workers': 2,
+}
+
 # Language Detection Configuration
 LANGUAGE_CONFIG = {
     'supported_languages': ['en', 'es', 'fr', 'de', 'it', 'pt'],
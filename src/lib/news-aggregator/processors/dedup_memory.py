@@ -0,0 +1,114 @@
+"""
+Deduplication Memory - Articles already stored, remembered across aggregations
+A bounded LRU with expiry, keyed by match and article hash and warm-loaded from MongoDB
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def memory_key(match_id: str, article_hash: str) -> str:
+    return f"{match_id}:{article_hash}"
+
+
+class DedupMemory:
+    """
+    Which articles each match has already stored.
+
+    Re-aggregating a match collects mostly the articles stored by the last
+    run. Remembering them lets the pipeline drop them before content
+    processing and storage rather than redoing both. Keys are per match,
+    matching what the pipeline stores; the least recently seen keys are
+    evicted beyond ``max_entries`` and every key expires after ``ttl``
+    seconds, so an article is processed again once it may have left
+    storage or changed.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: 'OrderedDict[str, float]' = OrderedDict()
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'remembered': 0,
+            'warm_loaded': 0,
+            'evictions': 0,
+            'expirations': 0,
+        }
+
+    def seen(self, key: str) -> bool:
+        """Whether ``key`` was remembered and has not expired; counts a hit or miss"""
+        expires_at = self._entries.get(key)
+        if expires_at is not None and expires_at < time.monotonic():
+            del self._entries[key]
+            self.stats['expirations'] += 1
+            expires_at = None
+
+        if expires_at is None:
+            self.stats['misses'] += 1
+            return False
+
+        self._entries.move_to_end(key)
+        self.stats['hits'] += 1
+        return True
+
+    def remember(self, key: str, stored_at: Optional[datetime] = None):
+        """Remember ``key``; ``stored_at`` backdates its expiry for keys loaded from storage"""
+        ttl = self.ttl
+        if stored_at is not None:
+            ttl -= (datetime.utcnow() - stored_at).total_seconds()
+            if ttl <= 0:
+                return
+
+        self._entries[key] = time.monotonic() + ttl
+        self._entries.move_to_end(key)
+        self.stats['remembered'] += 1
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def load(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Remember stored articles, given newest first as ``match_id``,
+        ``hash``, ``stored_at`` and the hashes of duplicates merged into them.
+        """
+        records = list(records)
+        before = self.stats['remembered']
+
+        # Oldest first, so the newest end up most recently used
+        for record in reversed(records):
+            match_id = record.get('match_id')
+            if not match_id or not record.get('hash'):
+                continue
+            stored_at = record.get('stored_at')
+            merged = record.get('deduplication_info', {}).get('merged_hashes', [])
+            for article_hash in [*merged, record['hash']]:
+                self.remember(memory_key(match_id, article_hash), stored_at)
+
+        loaded = self.stats['remembered'] - before
+        self.stats['warm_loaded'] += loaded
+        return loaded
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl,
+            'hit_rate': self.stats['hits'] / lookups if lookups else 0.0,
+        }
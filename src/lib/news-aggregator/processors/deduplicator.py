@@ -6,25 +6,78 @@ Handles duplicate detection across multiple sources and formats
 import hashlib
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Set, Optional, Tuple
+from typing import List, Dict, Any, Set, Optional, Tuple, Collection
 import difflib
 import re
 from collections import defaultdict
 
+from ..config import DEDUP_CONFIG
+from .dedup_memory import DedupMemory, memory_key
+from .minhash import LSHIndex, MinHasher, Signature, char_shingles, word_shingles
+from .simhash import SimHashIndex, from_hex, simhash, to_hex
+from ..storage.mongodb_storage import MongoDBStorage
+
 logger = logging.getLogger(__name__)
 
+URL_SCHEME_RE = re.compile(r'^https?://')
+URL_WWW_RE = re.compile(r'^www\.')
+URL_TRACKING_RE = re.compile(r'[?&](utm_|ref=|source=|fbclid=|gclid=)[^&]*')
+PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n|</p>|<p>')
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
+class ArticleFingerprint:
+    """
+    Everything deduplication compares about one article, normalised once.
+    
+    Holds the normalised title, content and URL, the shingle sets and
+    MinHash signatures built from them, the content's SimHash and the
+    article's hashes. Each text keeps a ``SequenceMatcher`` with it as the
+    second sequence, which difflib caches its analysis of, for comparing
+    new articles against.
+    """
+    
+    def __init__(self, title: str, content: str, url: str, hashes: Dict[str, str],
+                 shingles: Dict[str, Set[str]], signatures: Dict[str, Optional[Signature]],
+                 simhash: Optional[int] = None):
+        self.title = title
+        self.content = content
+        self.url = url
+        self.hashes = hashes
+        self.shingles = shingles
+        self.signatures = signatures
+        self.simhash = simhash
+        self._matchers: Dict[str, difflib.SequenceMatcher] = {}
+    
+    def text(self, field: str) -> str:
+        return getattr(self, field)
+    
+    def matcher(self, field: str) -> difflib.SequenceMatcher:
+        """A matcher with this article's ``field`` as the second sequence"""
+        matcher = self._matchers.get(field)
+        if matcher is None:
+            matcher = self._matchers[field] = difflib.SequenceMatcher(None, '', self.text(field))
+        return matcher
+
+
 class Deduplicator:
-    def __init__(self, cache_size: int = 10000):
-        self.seen_hashes: Set[str] = set()
-        self.title_hashes: Set[str] = set()
-        self.content_hashes: Set[str] = set()
-        self.url_hashes: Set[str] = set()
+    def __init__(self, cache_size: int = 10000, config: Dict[str, Any] = None):
+        self.config = config or DEDUP_CONFIG
         self.cache_size = cache_size
         
+        # Articles already stored per match, shared by every aggregation
+        self.memory = DedupMemory(cache_size, self.config['memory_ttl'])
+        
         # Similarity thresholds
-        self.title_similarity_threshold = 0.85
-        self.content_similarity_threshold = 0.75
-        self.url_similarity_threshold = 0.90
+        self.title_similarity_threshold = self.config['title_similarity_threshold']
+        self.content_similarity_threshold = self.config['content_similarity_threshold']
+        self.url_similarity_threshold = self.config['url_similarity_threshold']
+        
+        # MinHash per field, sized for that field's LSH banding
+        self.minhashers = {
+            field: MinHasher(settings['bands'] * settings['rows'])
+            for field, settings in self.config['lsh'].items()
+        }
         
         # Patterns for normalization
         self.title_patterns = [
@@ -39,6 +92,9 @@ class Deduplicator:
             r'\s+',      # Multiple whitespace
             r'^\s+|\s+$',  # Leading/trailing whitespace
         ]
+        
+        self._title_regexes = [re.compile(pattern, re.IGNORECASE) for pattern in self.title_patterns]
+        self._content_regexes = [re.compile(pattern) for pattern in self.content_patterns]
     
     def deduplicate_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -48,83 +104,75 @@ class Deduplicator:
         if not articles:
             return []
         
-        # Sort by quality score (highest first) to prioritize better articles
-        sorted_articles = sorted(articles, key=lambda x: x.get('quality_score', 0), reverse=True)
+        session = self.start_session()
+        session.add(articles)
         
-        unique_articles = []
-        processed_hashes = set()
+        logger.info(f"Deduplicated {len(articles)} articles to {len(session.unique_articles)} unique articles")
+        return session.unique_articles
+    
+    def start_session(self) -> 'DeduplicationSession':
+        """Deduplicate one aggregation incrementally, batch by batch"""
+        return DeduplicationSession(self)
+    
+    def fingerprint(self, article: Dict[str, Any]) -> ArticleFingerprint:
+        """Normalise an article once into everything deduplication compares"""
+        title = article.get('title', '')
+        content = article.get('content', '') or article.get('summary', '')
+        url = article.get('link', '') or article.get('url', '')
         
-        for article in sorted_articles:
-            # Generate multiple hash strategies
-            hashes = self._generate_article_hashes(article)
-            
-            # Check if we've seen any of these hashes
-            if self._is_duplicate_by_hash(hashes, processed_hashes):
-                # Find the original article and merge information
-                original_article = self._find_original_article(article, unique_articles)
-                if original_article:
-                    self._merge_article_info(original_article, article)
-                continue
-            
-            # Check for similarity-based duplicates
-            duplicate_found = False
-            for existing_article in unique_articles:
-                if self._is_similar_article(article, existing_article):
-                    self._merge_article_info(existing_article, article)
-                    duplicate_found = True
-                    break
-            
-            if not duplicate_found:
-                # Add tracking information
-                article['deduplication_info'] = {
-                    'is_original': True,
-                    'merged_count': 0,
-                    'merged_sources': [],
-                    'first_seen': datetime.utcnow(),
-                    'hashes': hashes
-                }
-                unique_articles.append(article)
-                
-                # Store hashes
-                for hash_val in hashes.values():
-                    processed_hashes.add(hash_val)
+        normalized_title = self._normalize_title(title)
+        normalized_content = self._normalize_content(content)
+        normalized_url = self._normalize_url(url)
         
-        logger.info(f"Deduplicated {len(articles)} articles to {len(unique_articles)} unique articles")
-        return unique_articles
-    
-    def _generate_article_hashes(self, article: Dict[str, Any]) -> Dict[str, str]:
-        """Generate multiple hash strategies for an article"""
         hashes = {}
         
         # Title hash (normalized)
-        title = article.get('title', '')
-        normalized_title = self._normalize_title(title)
         hashes['title'] = self._hash_string(normalized_title)
         
         # Content hash (first paragraph)
-        content = article.get('content', '') or article.get('summary', '')
+        first_paragraph_content = ''
         if content:
-            first_paragraph = self._extract_first_paragraph(content)
-            normalized_content = self._normalize_content(first_paragraph)
-            hashes['content'] = self._hash_string(normalized_content)
+            first_paragraph_content = self._normalize_content(self._extract_first_paragraph(content))
+            hashes['content'] = self._hash_string(first_paragraph_content)
         
         # URL hash (domain + path)
-        url = article.get('link', '') or article.get('url', '')
         if url:
-            normalized_url = self._normalize_url(url)
             hashes['url'] = self._hash_string(normalized_url)
         
         # Combined hash
-        combined_content = f"{normalized_title}{normalized_content}"
-        hashes['combined'] = self._hash_string(combined_content)
+        hashes['combined'] = self._hash_string(f"{normalized_title}{first_paragraph_content}")
         
         # Exact hash (for exact matches)
-        exact_content = f"{title}{content}{url}"
-        hashes['exact'] = self._hash_string(exact_content)
-        
-        return hashes
+        hashes['exact'] = self._hash_string(f"{title}{content}{url}")
+        
+        # Shingles and MinHash signatures of the fields _is_similar_fingerprint compares,
+        # left empty where it would skip the field
+        texts = {
+            'title': normalized_title,
+            'content': normalized_content if len(normalized_content) > 50 else '',
+            'url': normalized_url,
+        }
+        shingles = {}
+        signatures = {}
+        for field, settings in self.config['lsh'].items():
+            shingle = char_shingles if settings['shingle'] == 'char' else word_shingles
+            shingles[field] = shingle(texts[field], settings['size'])
+            signatures[field] = self.minhashers[field].signature(shingles[field])
+        
+        # SimHash of the whole body, for copies edited too much for the first-paragraph hash
+        settings = self.config['simhash']
+        shingle = char_shingles if settings['shingle'] == 'char' else word_shingles
+        content_shingles = shingle(normalized_content, settings['size'])
+        content_simhash = simhash(content_shingles) if len(content_shingles) >= settings['min_shingles'] else None
+        
+        return ArticleFingerprint(normalized_title, normalized_content, normalized_url, hashes, shingles, signatures,
+                                  content_simhash)
+    
+    def _generate_article_hashes(self, article: Dict[str, Any]) -> Dict[str, str]:
+        """Generate multiple hash strategies for an article"""
+        return self.fingerprint(article).hashes
     
-    def _is_duplicate_by_hash(self, hashes: Dict[str, str], processed_hashes: Set[str]) -> bool:
+    def _is_duplicate_by_hash(self, hashes: Dict[str, str], processed_hashes: Collection[str]) -> bool:
         """Check if article is duplicate based on hash matching"""
         # Check exact match first
         if hashes.get('exact') in processed_hashes:
@@ -146,52 +194,44 @@ class Deduplicator:
     
     def _is_similar_article(self, article1: Dict[str, Any], article2: Dict[str, Any]) -> bool:
         """Check if two articles are similar using content analysis"""
+        return self._is_similar_fingerprint(self.fingerprint(article1), self.fingerprint(article2))
+    
+    def _is_similar_fingerprint(self, new: ArticleFingerprint, existing: ArticleFingerprint) -> bool:
+        """Check if a new article is similar to an existing one, by their fingerprints"""
         # Title similarity
-        title1 = self._normalize_title(article1.get('title', ''))
-        title2 = self._normalize_title(article2.get('title', ''))
-        
-        if title1 and title2:
-            title_similarity = difflib.SequenceMatcher(None, title1, title2).ratio()
-            if title_similarity >= self.title_similarity_threshold:
+        if new.title and existing.title:
+            if self._ratio_reaches(new.title, existing.matcher('title'), self.title_similarity_threshold):
                 return True
         
         # Content similarity
-        content1 = self._normalize_content(article1.get('content', '') or article1.get('summary', ''))
-        content2 = self._normalize_content(article2.get('content', '') or article2.get('summary', ''))
-        
-        if content1 and content2 and len(content1) > 50 and len(content2) > 50:
-            content_similarity = difflib.SequenceMatcher(None, content1, content2).ratio()
-            if content_similarity >= self.content_similarity_threshold:
+        if len(new.content) > 50 and len(existing.content) > 50:
+            if self._ratio_reaches(new.content, existing.matcher('content'), self.content_similarity_threshold):
                 return True
         
         # URL similarity
-        url1 = self._normalize_url(article1.get('link', '') or article1.get('url', ''))
-        url2 = self._normalize_url(article2.get('link', '') or article2.get('url', ''))
-        
-        if url1 and url2:
-            url_similarity = difflib.SequenceMatcher(None, url1, url2).ratio()
-            if url_similarity >= self.url_similarity_threshold:
+        if new.url and existing.url:
+            if self._ratio_reaches(new.url, existing.matcher('url'), self.url_similarity_threshold):
                 return True
         
         return False
     
-    def _find_original_article(self, duplicate_article: Dict[str, Any], unique_articles: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-        """Find the original article that this duplicate matches"""
-        duplicate_hashes = self._generate_article_hashes(duplicate_article)
-        
-        for article in unique_articles:
-            article_hashes = article.get('deduplication_info', {}).get('hashes', {})
-            
-            # Check for hash matches
-            for hash_type, hash_val in duplicate_hashes.items():
-                if hash_val in article_hashes.values():
-                    return article
-            
-            # Check for similarity
-            if self._is_similar_article(duplicate_article, article):
-                return article
-        
-        return None
+    @staticmethod
+    def _ratio_reaches(text: str, matcher: difflib.SequenceMatcher, threshold: float) -> bool:
+        """
+        Whether ``text``'s ratio against ``matcher``'s second sequence reaches
+        ``threshold``, skipping the quadratic ratio when a cheap upper bound falls short
+        """
+        matcher.set_seq1(text)
+        return (matcher.real_quick_ratio() >= threshold
+                and matcher.quick_ratio() >= threshold
+                and matcher.ratio() >= threshold)
+    
+    def create_lsh_indexes(self) -> Dict[str, LSHIndex]:
+        """An empty LSH index per compared field"""
+        return {
+            field: LSHIndex(settings['bands'], settings['rows'])
+            for field, settings in self.config['lsh'].items()
+        }
     
     def _merge_article_info(self, original_article: Dict[str, Any], duplicate_article: Dict[str, Any]):
         """Merge information from duplicate article into original"""
@@ -213,6 +253,10 @@ class Deduplicator:
         merged_sources.append(duplicate_source)
         dedup_info['merged_sources'] = merged_sources
         
+        # Lets later runs recognise the duplicate without reprocessing it
+        if duplicate_article.get('hash'):
+            dedup_info['merged_hashes'] = dedup_info.get('merged_hashes', []) + [duplicate_article['hash']]
+        
         # Update quality score if duplicate has higher score
         if duplicate_article.get('quality_score', 0) > original_article.get('quality_score', 0):
             original_article['quality_score'] = duplicate_article['quality_score']
@@ -243,8 +287,8 @@ class Deduplicator:
         normalized = title.lower()
         
         # Apply normalization patterns
-        for pattern in self.title_patterns:
-            normalized = re.sub(pattern, '', normalized, flags=re.IGNORECASE)
+        for regex in self._title_regexes:
+            normalized = regex.sub('', normalized)
         
         # Remove extra whitespace
         normalized = ' '.join(normalized.split())
@@ -259,8 +303,8 @@ class Deduplicator:
         normalized = content.lower()
         
         # Apply normalization patterns
-        for pattern in self.content_patterns:
-            normalized = re.sub(pattern, ' ', normalized)
+        for regex in self._content_regexes:
+            normalized = regex.sub(' ', normalized)
         
         # Remove extra whitespace
         normalized = ' '.join(normalized.split())
@@ -274,11 +318,11 @@ class Deduplicator:
         
         # Remove protocol and www
         normalized = url.lower()
-        normalized = re.sub(r'^https?://', '', normalized)
-        normalized = re.sub(r'^www\.', '', normalized)
+        normalized = URL_SCHEME_RE.sub('', normalized)
+        normalized = URL_WWW_RE.sub('', normalized)
         
         # Remove common URL parameters
-        normalized = re.sub(r'[?&](utm_|ref=|source=|fbclid=|gclid=)[^&]*', '', normalized)
+        normalized = URL_TRACKING_RE.sub('', normalized)
         
         # Remove trailing slash
         normalized = normalized.rstrip('/')
@@ -291,12 +335,12 @@ class Deduplicator:
             return ""
         
         # Split by double newlines or paragraph tags
-        paragraphs = re.split(r'\n\s*\n|</p>|<p>', content)
+        paragraphs = PARAGRAPH_SPLIT_RE.split(content)
         
         if paragraphs:
             first_paragraph = paragraphs[0].strip()
             # Remove HTML tags
-            first_paragraph = re.sub(r'<[^>]+>', '', first_paragraph)
+            first_paragraph = HTML_TAG_RE.sub('', first_paragraph)
             return first_paragraph
         
         return content[:500]  # Fallback to first 500 characters
@@ -336,23 +380,211 @@ class Deduplicator:
             }
         }
     
+    async def load_memory(self, storage: MongoDBStorage) -> int:
+        """Warm the cross-run memory with the articles stored within its TTL"""
+        since = datetime.utcnow() - timedelta(seconds=self.memory.ttl)
+        records = await storage.get_recent_article_hashes(since, self.cache_size)
+        loaded = self.memory.load(records)
+        logger.info(f"Deduplication memory warmed with {loaded} hashes from {len(records)} stored articles")
+        return loaded
+    
+    def split_seen(self, articles: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Split articles into those not yet stored for their match and those already stored"""
+        fresh, seen = [], []
+        for article in articles:
+            if article.get('hash') and self.memory.seen(memory_key(article.get('match_id'), article['hash'])):
+                seen.append(article)
+            else:
+                fresh.append(article)
+        return fresh, seen
+    
+    def remember_articles(self, articles: List[Dict[str, Any]]):
+        """Remember stored articles, and the duplicates merged into them, for later runs"""
+        for article in articles:
+            match_id = article.get('match_id')
+            if not match_id or not article.get('hash'):
+                continue
+            merged = article.get('deduplication_info', {}).get('merged_hashes', [])
+            for article_hash in [*merged, article['hash']]:
+                self.memory.remember(memory_key(match_id, article_hash))
+    
     def clear_cache(self):
         """Clear the deduplication cache"""
-        self.seen_hashes.clear()
-        self.title_hashes.clear()
-        self.content_hashes.clear()
-        self.url_hashes.clear()
+        self.memory.clear()
         logger.info("Deduplication cache cleared")
     
-    def get_cache_stats(self) -> Dict[str, int]:
+    def get_cache_stats(self) -> Dict[str, Any]:
         """Get current cache statistics"""
-        return {
-            'total_hashes': len(self.seen_hashes),
-            'title_hashes': len(self.title_hashes),
-            'content_hashes': len(self.content_hashes),
-            'url_hashes': len(self.url_hashes),
-            'cache_size_limit': self.cache_size
-        }
+        return self.memory.get_stats()
+
+
+class DeduplicationSession:
+    """
+    Incremental deduplication state for one aggregation.
+    
+    Batches are deduplicated against everything the session has already
+    kept, so articles can be stored as they arrive instead of after the
+    slowest source. Within a batch, higher-quality articles are kept first.
+    
+    Kept articles are indexed by MinHash LSH on title, content and URL, and
+    an article is only compared in full with those it shares a bucket
+    with, rather than with every article kept so far. Every hash of a kept
+    article maps to its position, so a hash match finds the article to
+    merge into directly.
+    
+    Bodies are also indexed by SimHash, and one within a few bits of a
+    kept body is merged like a hash match, which catches lightly edited
+    wire copy without a difflib comparison.
+    
+    Articles a previous aggregation already stored are indexed too, via
+    ``add_known``, and the stored SimHashes of the match's articles via
+    ``add_stored_simhashes``. They are not returned again; duplicates of
+    them are dropped and remembered rather than merged.
+    """
+    
+    def __init__(self, deduplicator: Deduplicator):
+        self.deduplicator = deduplicator
+        self.unique_articles: List[Dict[str, Any]] = []
+        self.hash_index: Dict[str, int] = {}
+        self.articles_seen = 0
+        self.lsh_indexes = deduplicator.create_lsh_indexes()
+        self.similarity_checks = 0
+        self.known_articles = 0
+        self.simhash_duplicates = 0
+        self.simhash_index = SimHashIndex(deduplicator.config['simhash']['max_distance'])
+        self.stored_simhashes = SimHashIndex(deduplicator.config['simhash']['max_distance'])
+        
+        # Unique and known articles and their fingerprints, by the position the indexes refer to
+        self._indexed: List[Dict[str, Any]] = []
+        self._fingerprints: List[ArticleFingerprint] = []
+        self._known: Set[int] = set()
+    
+    def add_known(self, articles: List[Dict[str, Any]]):
+        """Index articles that are already stored, so later duplicates of them are dropped"""
+        dedup = self.deduplicator
+        for article in articles:
+            fingerprint = dedup.fingerprint(article)
+            if dedup._is_duplicate_by_hash(fingerprint.hashes, self.hash_index):
+                continue
+            self._known.add(id(article))
+            self._index(article, fingerprint)
+            self.known_articles += 1
+    
+    def add_stored_simhashes(self, records: List[Dict[str, Any]]):
+        """Index the SimHashes of articles already stored for the match, as ``hash`` and hex ``simhash``"""
+        for record in records:
+            self.stored_simhashes.add(record.get('hash'), from_hex(record.get('simhash')))
+    
+    def add(self, articles: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Deduplicate a batch against the session.
+        
+        Returns the batch's new unique articles, and previously kept
+        articles that absorbed a duplicate from this batch and so changed.
+        """
+        dedup = self.deduplicator
+        new_articles = []
+        updated = {}
+        
+        # Sort by quality score (highest first) to prioritize better articles
+        for article in sorted(articles, key=lambda x: x.get('quality_score', 0), reverse=True):
+            self.articles_seen += 1
+            
+            # Normalise once: hashes, shingles and signatures for every comparison below
+            fingerprint = dedup.fingerprint(article)
+            hashes = fingerprint.hashes
+            
+            # Check if we've seen any of these hashes
+            if dedup._is_duplicate_by_hash(hashes, self.hash_index):
+                # Merge into the earliest kept article sharing a hash
+                position = min(self.hash_index[hash_val] for hash_val in hashes.values() if hash_val in self.hash_index)
+                self._merge(position, article, updated)
+                continue
+            
+            # Check for lightly edited copies of a stored or kept body
+            if self.stored_simhashes.find(fingerprint.simhash) is not None:
+                self.simhash_duplicates += 1
+                dedup.remember_articles([article])
+                continue
+            
+            position = self.simhash_index.find(fingerprint.simhash)
+            if position is not None:
+                self.simhash_duplicates += 1
+                self._merge(position, article, updated)
+                continue
+            
+            # Check for similarity-based duplicates among the LSH candidates, oldest first
+            candidates = set()
+            for field, index in self.lsh_indexes.items():
+                candidates.update(index.candidates(fingerprint.signatures[field]))
+            
+            duplicate_found = False
+            for position in sorted(candidates):
+                self.similarity_checks += 1
+                if dedup._is_similar_fingerprint(fingerprint, self._fingerprints[position]):
+                    self._merge(position, article, updated)
+                    duplicate_found = True
+                    break
+            
+            if not duplicate_found:
+                # Add tracking information
+                article['deduplication_info'] = {
+                    'is_original': True,
+                    'merged_count': 0,
+                    'merged_sources': [],
+                    'first_seen': datetime.utcnow(),
+                    'hashes': hashes
+                }
+                self._index(article, fingerprint)
+                self.unique_articles.append(article)
+                new_articles.append(article)
+        
+        new_ids = {id(article) for article in new_articles}
+        changed = [article for key, article in updated.items() if key not in new_ids]
+        return new_articles, changed
+    
+    def _index(self, article: Dict[str, Any], fingerprint: ArticleFingerprint):
+        position = len(self._indexed)
+        for field, index in self.lsh_indexes.items():
+            index.add(position, fingerprint.signatures[field])
+        self.simhash_index.add(position, fingerprint.simhash)
+        self._indexed.append(article)
+        self._fingerprints.append(fingerprint)
+        
+        # Stored with the article, so later runs can compare against it
+        if fingerprint.simhash is not None:
+            article['simhash'] = to_hex(fingerprint.simhash)
+        
+        # Store hashes; an earlier article keeps a hash it shares
+        for hash_val in fingerprint.hashes.values():
+            self.hash_index.setdefault(hash_val, position)
+    
+    def _merge(self, position: int, article: Dict[str, Any], updated: Dict[int, Dict[str, Any]]):
+        original_article = self._indexed[position]
+        if id(original_article) in self._known:
+            # Already stored by an earlier run: nothing to write, just don't see it again
+            self.deduplicator.remember_articles([article])
+            return
+        
+        text_before = original_article.get('content', '') or original_article.get('summary', '')
+        self.deduplicator._merge_article_info(original_article, article)
+        updated[id(original_article)] = original_article
+        
+        # A longer body from the duplicate replaces the original's: compare against that from now on
+        if (original_article.get('content', '') or original_article.get('summary', '')) != text_before:
+            previous, fingerprint = self._fingerprints[position], self.deduplicator.fingerprint(original_article)
+            self._fingerprints[position] = fingerprint
+            for field, index in self.lsh_indexes.items():
+                if fingerprint.signatures[field] != previous.signatures[field]:
+                    index.add(position, fingerprint.signatures[field])
+            if fingerprint.simhash != previous.simhash:
+                self.simhash_index.add(position, fingerprint.simhash)
+                if fingerprint.simhash is not None:
+                    original_article['simhash'] = to_hex(fingerprint.simhash)
+    
+    @property
+    def duplicates_removed(self) -> int:
+        return self.articles_seen - len(self.unique_articles)
 
 
 class SmartMerger:
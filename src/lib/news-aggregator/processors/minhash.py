@@ -0,0 +1,124 @@
+"""
+MinHash LSH - Candidate lookup for near-duplicate articles
+Shingle sets are reduced to MinHash signatures and bucketed by LSH bands, so similar texts share a bucket
+"""
+
+import random
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+_MASK = (1 << 64) - 1
+
+Signature = Tuple[int, ...]
+
+
+def char_shingles(text: str, size: int) -> Set[str]:
+    """Overlapping character n-grams; short texts are one shingle"""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def word_shingles(text: str, size: int) -> Set[str]:
+    """Overlapping word n-grams; short texts are one shingle"""
+    words = text.split()
+    if len(words) <= size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """
+    One-permutation MinHash.
+
+    Each shingle is hashed once and lands in one of ``num_bins`` bins by
+    its hash; a bin keeps the smallest hash it receives. Each empty bin
+    copies a filled bin found by walking its own fixed pseudo-random
+    sequence of donors, so short texts still give full signatures without
+    neighbouring bins all borrowing the same value, which would make LSH
+    bands collide together. For two shingle sets, the chance that a bin
+    matches approximates their Jaccard similarity, as with classic MinHash,
+    at the cost of one hash per shingle rather than one per permutation.
+
+    Signatures use Python's string hash, which is salted per process: they
+    can be compared within a process but must not be persisted.
+    """
+
+    def __init__(self, num_bins: int = 64, seed: int = 1):
+        self.num_bins = num_bins
+        rng = random.Random(seed)
+        self._donors = [[rng.randrange(num_bins) for _ in range(4 * num_bins)] for _ in range(num_bins)]
+
+    def signature(self, shingles: Iterable[str]) -> Optional[Signature]:
+        num_bins = self.num_bins
+        bins: List[Optional[int]] = [None] * num_bins
+
+        for shingle in shingles:
+            value = hash(shingle) & _MASK
+            index = value % num_bins
+            value //= num_bins
+            current = bins[index]
+            if current is None or value < current:
+                bins[index] = value
+
+        filled = [index for index, value in enumerate(bins) if value is not None]
+        if not filled:
+            return None
+
+        if len(filled) < num_bins:
+            own = list(bins)
+            for index in range(num_bins):
+                if own[index] is not None:
+                    continue
+                donor = next((d for d in self._donors[index] if own[d] is not None), filled[index % len(filled)])
+                bins[index] = own[donor]
+
+        return tuple(bins)
+
+
+class LSHIndex:
+    """
+    Banded LSH index over MinHash signatures.
+
+    A signature is split into ``bands`` bands of ``rows`` values; keys whose
+    signatures agree on every value of any band are candidates for each
+    other. Two texts with Jaccard similarity ``s`` become candidates with
+    probability ``1 - (1 - s**rows)**bands``, an S-curve that rises around
+    ``(1 / bands) ** (1 / rows)``.
+    """
+
+    def __init__(self, bands: int, rows: int):
+        self.bands = bands
+        self.rows = rows
+        self._buckets: Dict[Tuple[int, Signature], List[Hashable]] = defaultdict(list)
+        self._size = 0
+
+    @property
+    def num_bins(self) -> int:
+        return self.bands * self.rows
+
+    def _band_keys(self, signature: Signature):
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, signature[band * rows:(band + 1) * rows]
+
+    def add(self, key: Hashable, signature: Optional[Signature]):
+        if signature is None:
+            return
+        for band_key in self._band_keys(signature):
+            self._buckets[band_key].append(key)
+        self._size += 1
+
+    def candidates(self, signature: Optional[Signature]) -> Set[Hashable]:
+        """Keys sharing at least one band bucket with ``signature``"""
+        found: Set[Hashable] = set()
+        if signature is None:
+            return found
+        for band_key in self._band_keys(signature):
+            bucket = self._buckets.get(band_key)
+            if bucket:
+                found.update(bucket)
+        return found
+
+    def __len__(self) -> int:
+        return self._size
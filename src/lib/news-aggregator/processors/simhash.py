@@ -0,0 +1,95 @@
+"""
+SimHash - 64-bit fingerprints of article text and a Hamming-distance index
+Lightly edited copies of a text get fingerprints a few bits apart, found by exact lookups on bit blocks
+"""
+
+import hashlib
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+BITS = 64
+
+# BIT_TABLES[b] maps every byte to 1 if bit b is set in it, else 0
+BIT_TABLES = [bytes((value >> bit) & 1 for value in range(256)) for bit in range(8)]
+
+
+def simhash(shingles: Iterable[str]) -> Optional[int]:
+    """
+    64-bit SimHash of a set of shingles, or None if there are none.
+
+    Each bit is set when most shingle hashes have it set. Shingles are
+    hashed with BLAKE2b rather than Python's salted ``hash`` because
+    fingerprints are stored and compared across processes.
+    """
+    digests = b''.join(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest() for shingle in shingles)
+    count = len(digests) // 8
+    if not count:
+        return None
+
+    value = 0
+    for byte in range(8):
+        # Every digest's byte at this position, bits counted in C rather than per shingle
+        column = digests[byte::8]
+        for bit in range(8):
+            if column.translate(BIT_TABLES[bit]).count(1) * 2 > count:
+                value |= 1 << (byte * 8 + bit)
+    return value
+
+
+def to_hex(value: int) -> str:
+    """Stored form: MongoDB integers are signed, so fingerprints are kept as 16 hex digits"""
+    return f"{value:016x}"
+
+
+def from_hex(text: str) -> Optional[int]:
+    try:
+        return int(text, 16)
+    except (TypeError, ValueError):
+        return None
+
+
+def hamming_distance(first: int, second: int) -> int:
+    return (first ^ second).bit_count()
+
+
+class SimHashIndex:
+    """
+    Fingerprints within ``max_distance`` bits of a query, without a scan.
+
+    The 64 bits are cut into ``max_distance + 1`` blocks. Two fingerprints
+    that differ in at most ``max_distance`` bits agree exactly on at least
+    one block, so each block is a table keyed by its value, the permuted
+    tables of Manku et al. with one table per block. A lookup reads one
+    bucket per table and measures the distance only to what it finds there.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        blocks = max_distance + 1
+        edges = [BITS * i // blocks for i in range(blocks + 1)]
+        self._blocks = [(start, (1 << (end - start)) - 1) for start, end in zip(edges, edges[1:])]
+        self._tables: List[Dict[int, List[Tuple[int, int, Hashable]]]] = [defaultdict(list) for _ in self._blocks]
+        self._size = 0
+
+    def add(self, key: Hashable, value: Optional[int]):
+        if value is None:
+            return
+        entry = (self._size, value, key)
+        for table, (shift, mask) in zip(self._tables, self._blocks):
+            table[(value >> shift) & mask].append(entry)
+        self._size += 1
+
+    def find(self, value: Optional[int]) -> Optional[Hashable]:
+        """Key of the earliest added fingerprint within ``max_distance`` bits of ``value``"""
+        if value is None:
+            return None
+
+        best = None
+        for table, (shift, mask) in zip(self._tables, self._blocks):
+            for entry in table.get((value >> shift) & mask, ()):
+                if (best is None or entry[0] < best[0]) and hamming_distance(value, entry[1]) <= self.max_distance:
+                    best = entry
+        return best[2] if best else None
+
+    def __len__(self) -> int:
+        return self._size
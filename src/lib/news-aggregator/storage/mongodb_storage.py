@@ -4,10 +4,11 @@ Optimized for MongoDB Atlas Free Tier (512MB storage)
 """
 
 import asyncio
+import hashlib
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
-from pymongo import MongoClient, IndexModel, ASCENDING, DESCENDING
+from pymongo import MongoClient, IndexModel, ASCENDING, DESCENDING, ReturnDocument
 from pymongo.errors import DuplicateKeyError, ConnectionFailure
 import motor.motor_asyncio
 
@@ -15,6 +16,17 @@ from ..config import MONGODB_CONFIG, DATA_RETENTION
 
 logger = logging.getLogger(__name__)
 
+
+def article_hash(article: Dict[str, Any]) -> str:
+    """The key an article is stored under: a hash of its title, URL and content"""
+    title = article.get('title', '')
+    url = article.get('link', '') or article.get('url', '')
+    content = article.get('content', '') or article.get('summary', '')
+    
+    hash_content = f"{title}{url}{content}"
+    return hashlib.md5(hash_content.encode('utf-8')).hexdigest()
+
+
 class MongoDBStorage:
     def __init__(self, connection_string: str = None):
         self.connection_string = connection_string or MONGODB_CONFIG['connection_string']
@@ -30,6 +42,7 @@ class MongoDBStorage:
         self.matches_collection = None
         self.contexts_collection = None
         self.sources_collection = None
+        self.quota_collection = None
         
         # Storage statistics
         self.storage_stats = {
@@ -57,6 +70,7 @@ class MongoDBStorage:
             self.matches_collection = self.db[self.collections['matches']]
             self.contexts_collection = self.db[self.collections['contexts']]
             self.sources_collection = self.db[self.collections['sources']]
+            self.quota_collection = self.db[self.collections['quota']]
             
             # Create indexes
             await self._create_indexes()
@@ -83,6 +97,7 @@ class MongoDBStorage:
                 IndexModel([('source_type', ASCENDING), ('quality_score', DESCENDING)]),
                 IndexModel([('expires_at', ASCENDING)]),
                 IndexModel([('collected_at', DESCENDING)]),
+                IndexModel([('stored_at', DESCENDING)]),
                 IndexModel([('relevance_score', DESCENDING)]),
                 IndexModel([('tags', ASCENDING)]),
                 IndexModel([('language_info.language', ASCENDING)]),
@@ -109,6 +124,11 @@ class MongoDBStorage:
                 IndexModel([('date', DESCENDING)]),
             ])
             
+            # Quota collection: day documents expire on their own
+            await self.quota_collection.create_indexes([
+                IndexModel([('expires_at', ASCENDING)], expireAfterSeconds=0),
+            ])
+            
             logger.info("Database indexes created successfully")
             
         except Exception as e:
@@ -222,6 +242,34 @@ class MongoDBStorage:
             logger.error(f"Failed to get articles for match {match_id}: {e}")
             return []
     
+    async def get_recent_article_hashes(self, since: datetime, limit: int) -> List[Dict[str, Any]]:
+        """Hashes of the newest ``limit`` articles stored since ``since``, newest first, with the hashes merged into them"""
+        try:
+            cursor = self.articles_collection.find(
+                {'stored_at': {'$gte': since}},
+                {'_id': 0, 'match_id': 1, 'hash': 1, 'stored_at': 1, 'deduplication_info.merged_hashes': 1}
+            ).sort('stored_at', DESCENDING).limit(limit)
+            
+            return await cursor.to_list(length=None)
+            
+        except Exception as e:
+            logger.error(f"Failed to get recent article hashes: {e}")
+            return []
+    
+    async def get_match_simhashes(self, match_id: str) -> List[Dict[str, Any]]:
+        """Hash and content SimHash of every article stored for a match"""
+        try:
+            cursor = self.articles_collection.find(
+                {'match_id': match_id, 'simhash': {'$exists': True}},
+                {'_id': 0, 'hash': 1, 'simhash': 1}
+            )
+            
+            return await cursor.to_list(length=None)
+            
+        except Exception as e:
+            logger.error(f"Failed to get article SimHashes for match {match_id}: {e}")
+            return []
+    
     async def store_match_context(self, match_id: str, context: Dict[str, Any]) -> bool:
         """Store aggregated context for a match"""
         try:
@@ -260,13 +308,13 @@ class MongoDBStorage:
             return None
     
     async def store_match_info(self, match_info: Dict[str, Any]) -> bool:
-        """Store match information"""
+        """Store match information, keeping fields it doesn't set such as the aggregation count"""
         try:
             match_info['updated_at'] = datetime.utcnow()
             
-            await self.matches_collection.replace_one(
+            await self.matches_collection.update_one(
                 {'match_id': match_info['match_id']},
-                match_info,
+                {'$set': match_info},
                 upsert=True
             )
             
@@ -296,6 +344,82 @@ class MongoDBStorage:
             logger.error(f"Failed to get recent matches: {e}")
             return []
     
+    async def schedule_match(self, match_info: Dict[str, Any]) -> bool:
+        """Register a fixture ahead of its aggregations, leaving any aggregation state in place"""
+        try:
+            await self.matches_collection.update_one(
+                {'match_id': match_info['match_id']},
+                {
+                    '$set': {**match_info, 'updated_at': datetime.utcnow()},
+                    '$setOnInsert': {'status': 'scheduled', 'aggregations_completed': 0},
+                },
+                upsert=True
+            )
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to schedule match {match_info.get('match_id')}: {e}")
+            return False
+    
+    async def record_match_aggregation(self, match_id: str) -> bool:
+        """Count one completed aggregation of a match"""
+        try:
+            await self.matches_collection.update_one(
+                {'match_id': match_id},
+                {'$inc': {'aggregations_completed': 1}}
+            )
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to record aggregation of match {match_id}: {e}")
+            return False
+    
+    async def get_upcoming_matches(self, since: datetime, until: datetime, priorities: List[str]) -> List[Dict[str, Any]]:
+        """Get scheduled or aggregated matches of the given priorities kicking off between ``since`` and ``until``"""
+        try:
+            cursor = self.matches_collection.find({
+                'match_date': {'$gte': since, '$lte': until},
+                'priority': {'$in': priorities}
+            }, {'_id': 0, 'match_id': 1, 'home_team': 1, 'away_team': 1, 'match_date': 1, 'priority': 1,
+                'aggregations_completed': 1})
+            
+            return await cursor.to_list(length=None)
+            
+        except Exception as e:
+            logger.error(f"Failed to get upcoming matches: {e}")
+            return []
+    
+    async def increment_api_quota(self, api_name: str, day: str, allowed: int, expires_at: datetime) -> Optional[int]:
+        """
+        Atomically count one call against an API's quota for a UTC day.
+        
+        Returns the new count, or None when ``allowed`` calls have already
+        been made. Raises on connection errors so callers can fall back.
+        """
+        try:
+            document = await self.quota_collection.find_one_and_update(
+                {'_id': f"{api_name}:{day}", 'used': {'$lt': allowed}},
+                {
+                    '$inc': {'used': 1},
+                    '$set': {'updated_at': datetime.utcnow()},
+                    '$setOnInsert': {'api': api_name, 'day': day, 'expires_at': expires_at}
+                },
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            return document['used']
+            
+        except DuplicateKeyError:
+            # The day's document exists but failed the $lt filter: quota spent
+            return None
+    
+    async def get_api_quota_usage(self, day: str) -> Dict[str, int]:
+        """Get calls made per API on a UTC day"""
+        cursor = self.quota_collection.find({'day': day}, {'api': 1, 'used': 1})
+        return {document['api']: document['used'] async for document in cursor}
+    
     async def update_source_stats(self, source_name: str, stats: Dict[str, Any]) -> bool:
         """Update statistics for a source"""
         try:
@@ -502,14 +626,7 @@ class MongoDBStorage:
     
     def _generate_hash(self, article: Dict[str, Any]) -> str:
         """Generate hash for article deduplication"""
-        import hashlib
-        
-        title = article.get('title', '')
-        url = article.get('link', '') or article.get('url', '')
-        content = article.get('content', '') or article.get('summary', '')
-        
-        hash_content = f"{title}{url}{content}"
-        return hashlib.md5(hash_content.encode('utf-8')).hexdigest()
+        return article_hash(article)
     
     async def health_check(self) -> Dict[str, Any]:
         """Check database health"""
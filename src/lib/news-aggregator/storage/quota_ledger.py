@@ -0,0 +1,222 @@
+"""
+News API Quota Ledger - Daily API call budgets shared by every worker
+Counts calls per UTC day in MongoDB, with a locked local file when MongoDB is unavailable
+"""
+
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from ..config import CACHE_CONFIG, NEWS_APIS, QUOTA_CONFIG
+from .mongodb_storage import MongoDBStorage
+
+logger = logging.getLogger(__name__)
+
+
+def utc_day(now: datetime = None) -> str:
+    """Ledger key for the UTC day containing ``now``"""
+    return (now or datetime.utcnow()).strftime('%Y-%m-%d')
+
+
+def next_utc_midnight(now: datetime = None) -> datetime:
+    now = now or datetime.utcnow()
+    return datetime(now.year, now.month, now.day) + timedelta(days=1)
+
+
+class QuotaLedger:
+    """
+    Charges news API calls against their daily limits before they are made.
+
+    Counts live in MongoDB, keyed by API and UTC day, and are incremented
+    with a conditional upsert, so every uvicorn worker and node shares one
+    count and a day rolls over by simply using a new key. When MongoDB is
+    not connected, a JSON file under the cache directory, updated under an
+    exclusive lock, shares the count between processes on this host.
+
+    Part of each limit is held back for the aggregations today's
+    high-priority fixtures still expect: fixtures are read from the match
+    schedule, whether or not they have started aggregating, less the
+    aggregations each has already completed. Normal-priority calls stop at
+    the limit minus that reserve; reserved priorities may spend up to the
+    full limit.
+    """
+
+    def __init__(self, storage: MongoDBStorage = None, path: str = None, apis: Dict[str, Dict[str, Any]] = None):
+        self.storage = storage
+        self.path = path or os.path.join(CACHE_CONFIG['directory'], QUOTA_CONFIG['ledger_file'])
+        self.apis = apis or NEWS_APIS
+        self.config = QUOTA_CONFIG
+
+        self._reserve: Dict[str, int] = {}
+        self._reserve_fixtures = 0
+        self._reserve_refreshed_at = 0.0
+        self._reserve_lock = asyncio.Lock()
+
+        self.stats = {
+            'charged': 0,
+            'denied': 0,
+            'reserve_denied': 0,
+            'file_fallbacks': 0,
+        }
+
+    def _mongo_available(self) -> bool:
+        return self.storage is not None and self.storage.quota_collection is not None
+
+    async def try_charge(self, api_name: str, priority: str = 'normal') -> bool:
+        """Count one call to ``api_name`` if its budget for this priority allows it"""
+        limit = self.apis[api_name].get('daily_limit', 0)
+        allowed = limit
+
+        if priority not in self.config['reserved_priorities']:
+            reserve = (await self._get_reserve()).get(api_name, 0)
+            allowed = limit - reserve
+
+        used = await self._increment(api_name, allowed) if allowed > 0 else None
+
+        if used is None:
+            self.stats['denied'] += 1
+            if allowed < limit:
+                self.stats['reserve_denied'] += 1
+                logger.info(f"{api_name} quota left is reserved for high-priority fixtures")
+            else:
+                logger.warning(f"Daily limit reached for {api_name}")
+            return False
+
+        self.stats['charged'] += 1
+        return True
+
+    async def _increment(self, api_name: str, allowed: int) -> Optional[int]:
+        day = utc_day()
+
+        if self._mongo_available():
+            try:
+                # Keep the day's document a little past midnight for late readers
+                expires_at = next_utc_midnight() + timedelta(days=1)
+                return await self.storage.increment_api_quota(api_name, day, allowed, expires_at)
+            except Exception as e:
+                self.stats['file_fallbacks'] += 1
+                logger.warning(f"Quota ledger unavailable in MongoDB ({e}), using {self.path}")
+
+        return await asyncio.to_thread(self._increment_file, api_name, day, allowed)
+
+    def _increment_file(self, api_name: str, day: str, allowed: int) -> Optional[int]:
+        """Read-modify-write the ledger file under an exclusive lock"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        with open(self.path, 'a+', encoding='utf-8') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    ledger = json.loads(f.read() or '{}')
+                except ValueError:
+                    logger.warning(f"Resetting unreadable quota ledger {self.path}")
+                    ledger = {}
+
+                # Only today's counts matter; earlier days have rolled over
+                usage = ledger.get(day, {})
+                used = usage.get(api_name, 0)
+                if used >= allowed:
+                    return None
+
+                usage[api_name] = used + 1
+                f.seek(0)
+                f.truncate()
+                json.dump({day: usage}, f)
+                f.flush()
+                os.fsync(f.fileno())
+                return used + 1
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _read_file(self, day: str) -> Dict[str, int]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                fcntl.flock(f, fcntl.LOCK_SH)
+                try:
+                    return json.loads(f.read() or '{}').get(day, {})
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+        except (OSError, ValueError):
+            return {}
+
+    async def _get_reserve(self) -> Dict[str, int]:
+        """Calls per API held back for the remaining aggregations of today's high-priority fixtures"""
+        if time.monotonic() - self._reserve_refreshed_at < self.config['reserve_refresh_seconds']:
+            return self._reserve
+
+        async with self._reserve_lock:
+            if time.monotonic() - self._reserve_refreshed_at < self.config['reserve_refresh_seconds']:
+                return self._reserve
+
+            fixtures = []
+            if self._mongo_available():
+                midnight = next_utc_midnight()
+                fixtures = await self.storage.get_upcoming_matches(
+                    midnight - timedelta(days=1), midnight, self.config['reserved_priorities']
+                )
+
+            per_fixture = self.config['aggregations_per_fixture']
+            remaining = [max(0, per_fixture - (fixture.get('aggregations_completed') or 0)) for fixture in fixtures]
+            aggregations = sum(remaining)
+
+            self._reserve_fixtures = sum(1 for count in remaining if count)
+            self._reserve = {}
+            for api_name, api_config in self.apis.items():
+                needed = aggregations * api_config.get('calls_per_match', 1)
+                cap = int(api_config.get('daily_limit', 0) * self.config['max_reserve_fraction'])
+                self._reserve[api_name] = min(needed, cap)
+
+            self._reserve_refreshed_at = time.monotonic()
+            if aggregations:
+                logger.info(f"Holding back API quota for {aggregations} aggregations of "
+                            f"{self._reserve_fixtures} high-priority fixtures: {self._reserve}")
+
+        return self._reserve
+
+    async def get_usage(self) -> Dict[str, Dict[str, Any]]:
+        """Today's usage per API"""
+        day = utc_day()
+        usage = None
+
+        if self._mongo_available():
+            try:
+                usage = await self.storage.get_api_quota_usage(day)
+            except Exception as e:
+                logger.warning(f"Failed to read quota usage from MongoDB: {e}")
+
+        if usage is None:
+            usage = await asyncio.to_thread(self._read_file, day)
+
+        reserve = await self._get_reserve()
+        usage_stats = {}
+
+        for api_name, api_config in self.apis.items():
+            current_usage = usage.get(api_name, 0)
+            daily_limit = api_config.get('daily_limit', 0)
+
+            usage_stats[api_name] = {
+                'current_usage': current_usage,
+                'daily_limit': daily_limit,
+                'reserved': reserve.get(api_name, 0),
+                'remaining': max(0, daily_limit - current_usage),
+                'percentage_used': (current_usage / daily_limit * 100) if daily_limit > 0 else 0,
+                'status': 'available' if current_usage < daily_limit else 'exhausted',
+                'resets_at': next_utc_midnight().isoformat(),
+            }
+
+        return usage_stats
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get quota ledger statistics"""
+        return {
+            **self.stats,
+            'backend': 'mongodb' if self._mongo_available() else 'file',
+            'reserved_fixtures': self._reserve_fixtures,
+            'reserve': dict(self._reserve),
+        }